@@ -1,3 +1,4 @@
+import crypto from "crypto";
 import dotenv from "dotenv";
 import path from "path";
 import { fileURLToPath } from "url";
@@ -13,6 +14,8 @@ import { Server as SocketIOServer } from "socket.io";
 import morgan from "morgan";
 import cors from "cors";
 import { connectDB } from "./src/config/db.js";
+import { startAlertFanout } from "./src/realtime/alertFanout.js";
+import { ensureRollups } from "./src/reports/rollups.js";
 import mongoose from "mongoose";
 
 import authRoutes from "./src/routes/authRoutes.js";
@@ -66,6 +69,10 @@ app.use("/api/reports", reportRoutes);
 
 const PORT = process.env.PORT || 4000;
 
+// Engine.IO session ids start with this replica's port, so backend_proxy.py
+// can send a session's polling requests and upgrade to the replica holding it
+io.engine.generateId = () => `${PORT}.${crypto.randomBytes(15).toString("base64url")}`;
+
 if (!process.env.MONGO_URI && !process.env.MONGODB_URI) {
   // eslint-disable-next-line no-console
   console.error(
@@ -102,6 +109,11 @@ connectDB(process.env.MONGO_URI || process.env.MONGODB_URI)
       // eslint-disable-next-line no-console
       console.warn("Startup ping failed (non-fatal):", e?.message || e);
     }
+    startAlertFanout(app);
+    // Existing databases get their rollups built in the background
+    ensureRollups()
+      .then((built) => built && console.log("Sensor rollups built from existing readings"))
+      .catch((e) => console.warn("Building sensor rollups failed:", e?.message || e));
 
     server.listen(PORT, () => {
       // eslint-disable-next-line no-console
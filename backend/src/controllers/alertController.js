@@ -1,8 +1,15 @@
 import Alert from '../models/Alert.js';
+import { latestAlerts } from '../reports/latest.js';
+import { sendPage, streamExport } from '../utils/keyset.js';
+
+const FIELDS = ['type', 'message', 'severity', 'timestamp', 'createdAt', 'updatedAt'];
 
 export async function listAlerts(req, res) {
-  const alerts = await Alert.find({}).sort({ timestamp: -1 }).limit(200);
-  return res.json(alerts);
+  return sendPage(Alert, FIELDS, req, res);
+}
+
+export async function exportAlerts(req, res) {
+  return streamExport(Alert, FIELDS, req, res);
 }
 
 export async function createAlert(req, res) {
@@ -11,9 +18,11 @@ export async function createAlert(req, res) {
     return res.status(400).json({ message: 'type, message, severity are required' });
   }
   const alert = await Alert.create({ type, message, severity });
-  // Emit real-time event via Socket.io (set on app)
+  latestAlerts.add([alert.toObject()]);
+  // Emit real-time event via Socket.io (set on app); with alert fan-out
+  // enabled the change stream emits it on every replica instead
   const io = req.app.get('io');
-  if (io) {
+  if (io && !req.app.get('alertFanout')) {
     io.emit('alert:new', alert);
   }
   return res.status(201).json(alert);
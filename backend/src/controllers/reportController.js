@@ -1,15 +1,57 @@
-import Sensor from '../models/Sensor.js';
-import Alert from '../models/Alert.js';
+import SensorRollup from '../models/SensorRollup.js';
+import { GRANULARITIES, readSummary } from '../reports/rollups.js';
+import { latestSensors, latestAlerts } from '../reports/latest.js';
 
+const ROLLUP_LIMIT = 1000;
+const MAX_ROLLUP_LIMIT = 10000;
+
+// Served from the grand-total rollup and the in-memory latest lists, so the
+// cost doesn't grow with the number of stored readings. asOf says when the
+// averages last changed.
 export async function getSummaryReport(req, res) {
-  const latestSensors = await Sensor.find({}).sort({ timestamp: -1 }).limit(20);
-  const latestAlerts = await Alert.find({}).sort({ timestamp: -1 }).limit(20);
-  const aggregates = await Sensor.aggregate([
-    { $group: { _id: null, avgTemp: { $avg: '$temperature' }, avgWind: { $avg: '$wind_speed' }, avgWater: { $avg: '$water_level' } } },
-    { $project: { _id: 0 } }
-  ]);
-  const summary = aggregates[0] || { avgTemp: null, avgWind: null, avgWater: null };
-  return res.json({ summary, latestSensors, latestAlerts });
+  let results;
+  try {
+    results = await Promise.all([readSummary(), latestSensors.get(), latestAlerts.get()]);
+  } catch (err) {
+    // Express 4 doesn't catch rejections from async handlers
+    return res.status(500).json({ message: `Summary report failed: ${err.message}` });
+  }
+  const [{ summary, asOf }, sensors, alerts] = results;
+  return res.json({ summary, latestSensors: sensors, latestAlerts: alerts, asOf });
 }
 
-
+// GET /rollups?granularity=hour&location=Station-1&from=...&to=...&limit=...
+// Buckets oldest first, each with count/sum/min/max and the averages
+export async function listRollups(req, res) {
+  const { granularity = 'hour', location, from, to } = req.query;
+  if (!GRANULARITIES.includes(granularity)) {
+    return res.status(400).json({ message: `granularity must be one of ${GRANULARITIES.join(', ')}` });
+  }
+  const filter = { granularity };
+  if (location) filter.location = location;
+  if (from || to) {
+    filter.bucket = {};
+    if (from) filter.bucket.$gte = new Date(from);
+    if (to) filter.bucket.$lt = new Date(to);
+    if (Object.values(filter.bucket).some((date) => Number.isNaN(date.getTime()))) {
+      return res.status(400).json({ message: 'from and to must be ISO 8601 times' });
+    }
+  }
+  const requested = Number.parseInt(req.query.limit, 10) || ROLLUP_LIMIT;
+  const limit = Math.min(Math.max(requested, 1), MAX_ROLLUP_LIMIT);
+  let rollups;
+  try {
+    rollups = await SensorRollup.find(filter, { _id: 0 }).sort({ bucket: 1, location: 1 }).limit(limit).lean();
+  } catch (err) {
+    // Express 4 doesn't catch rejections from async handlers
+    return res.status(500).json({ message: `Rollups query failed: ${err.message}` });
+  }
+  for (const rollup of rollups) {
+    rollup.avg = {
+      water_level: rollup.sum.water_level / rollup.count,
+      wind_speed: rollup.sum.wind_speed / rollup.count,
+      temperature: rollup.sum.temperature / rollup.count
+    };
+  }
+  return res.json(rollups);
+}
@@ -1,8 +1,142 @@
+import { StringDecoder } from 'string_decoder';
 import Sensor from '../models/Sensor.js';
+import { applyReadings } from '../reports/rollups.js';
+import { latestSensors } from '../reports/latest.js';
+import { sendPage, streamExport } from '../utils/keyset.js';
+
+// Readings per insertMany; the request stream is paused while each one runs
+const BULK_BATCH = 1000;
+// Longer lines are rejected unparsed so one bad line can't exhaust memory
+const MAX_LINE_LENGTH = 16 * 1024;
+// Rejected lines listed in the response; the rest are only counted
+const MAX_REPORTED_ERRORS = 100;
+// A reading whose _id is already stored, e.g. a batch the loader sent again
+const DUPLICATE_KEY = 11000;
+const FIELDS = ['location', 'water_level', 'wind_speed', 'temperature', 'timestamp', 'createdAt', 'updatedAt'];
 
 export async function listSensors(req, res) {
-  const sensors = await Sensor.find({}).sort({ timestamp: -1 }).limit(200);
-  return res.json(sensors);
+  return sendPage(Sensor, FIELDS, req, res);
+}
+
+export async function exportSensors(req, res) {
+  return streamExport(Sensor, FIELDS, req, res);
 }
 
+// POST /bulk with one JSON reading per line (application/x-ndjson). The body
+// is consumed as it arrives, so express.json()'s size limit doesn't apply and
+// memory stays at one batch. Every line is validated against the Sensor
+// schema; valid readings are written with unordered bulk inserts and invalid
+// ones are reported by line number without failing the rest.
+export async function ingestSensors(req, res) {
+  if (!req.is('application/x-ndjson')) {
+    return res.status(415).json({ message: 'Expected Content-Type: application/x-ndjson' });
+  }
+  const result = { received: 0, inserted: 0, duplicates: 0, rejected: 0, errors: [] };
+  const reject = (line, message) => {
+    result.rejected += 1;
+    if (result.errors.length < MAX_REPORTED_ERRORS) {
+      result.errors.push({ line, message });
+    }
+  };
 
+  let batch = [];
+  let lines = [];
+  const flush = async () => {
+    if (!batch.length) return;
+    const docs = batch;
+    const docLines = lines;
+    batch = [];
+    lines = [];
+    let inserted = docs;
+    try {
+      // Already validated: go straight to the driver rather than have
+      // Mongoose hydrate and validate every document a second time
+      await Sensor.collection.insertMany(docs, { ordered: false });
+    } catch (err) {
+      if (!err.writeErrors) throw err;
+      const failed = new Set();
+      for (const writeError of [].concat(err.writeErrors)) {
+        failed.add(writeError.index);
+        if (writeError.code === DUPLICATE_KEY) {
+          // Sent again after a failure part-way through: it's already
+          // stored and already in the rollups
+          result.duplicates += 1;
+        } else {
+          reject(docLines[writeError.index], writeError.errmsg);
+        }
+      }
+      inserted = docs.filter((doc, i) => !failed.has(i));
+    }
+    result.inserted += inserted.length;
+    await applyReadings(inserted);
+    latestSensors.add(inserted);
+  };
+
+  const accept = (text, lineNo) => {
+    const trimmed = text.trim();
+    if (!trimmed) return;
+    result.received += 1;
+    let fields;
+    try {
+      fields = JSON.parse(trimmed);
+    } catch (err) {
+      return reject(lineNo, `Invalid JSON: ${err.message}`);
+    }
+    if (!fields || typeof fields !== 'object' || Array.isArray(fields)) {
+      return reject(lineNo, 'Expected a JSON object');
+    }
+    const sensor = new Sensor(fields);
+    const invalid = sensor.validateSync();
+    if (invalid) {
+      return reject(lineNo, invalid.message);
+    }
+    const now = new Date();
+    batch.push({ ...sensor.toObject({ depopulate: true }), createdAt: now, updatedAt: now, __v: 0 });
+    lines.push(lineNo);
+  };
+
+  const decoder = new StringDecoder('utf8');
+  let pending = '';
+  let lineNo = 0;
+  let overlong = false;
+  try {
+    for await (const chunk of req) {
+      pending += decoder.write(chunk);
+      let start = 0;
+      let newline;
+      while ((newline = pending.indexOf('\n', start)) !== -1) {
+        lineNo += 1;
+        if (overlong) {
+          overlong = false;
+        } else if (newline - start > MAX_LINE_LENGTH) {
+          result.received += 1;
+          reject(lineNo, `Line longer than ${MAX_LINE_LENGTH} characters`);
+        } else {
+          accept(pending.slice(start, newline), lineNo);
+        }
+        start = newline + 1;
+        if (batch.length >= BULK_BATCH) await flush();
+      }
+      pending = pending.slice(start);
+      if (pending.length > MAX_LINE_LENGTH) {
+        if (!overlong) {
+          result.received += 1;
+          reject(lineNo + 1, `Line longer than ${MAX_LINE_LENGTH} characters`);
+        }
+        overlong = true;
+        pending = '';
+      }
+    }
+    pending += decoder.end();
+    if (overlong) {
+      lineNo += 1;
+    } else if (pending) {
+      accept(pending, ++lineNo);
+    }
+    await flush();
+  } catch (err) {
+    // Whatever was inserted before the failure stays inserted; say how much
+    return res.status(503).json({ message: `Bulk insert failed: ${err.message}`, ...result });
+  }
+  return res.json(result);
+}
@@ -10,6 +10,8 @@ const alertSchema = new mongoose.Schema(
   { timestamps: true }
 );
 
+alertSchema.index({ timestamp: -1, _id: -1 });
+
 export default mongoose.model('Alert', alertSchema);
 
 
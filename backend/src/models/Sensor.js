@@ -11,6 +11,10 @@ const sensorSchema = new mongoose.Schema(
   { timestamps: true }
 );
 
+// Keyset pages and exports in (timestamp, _id) order, either direction,
+// and the summary's latest-readings refresh
+sensorSchema.index({ timestamp: -1, _id: -1 });
+
 export default mongoose.model('Sensor', sensorSchema);
 
 
@@ -0,0 +1,27 @@
+import mongoose from 'mongoose';
+
+const readingStats = () => ({ water_level: Number, wind_speed: Number, temperature: Number });
+
+// Running count/sum/min/max of sensor readings per station and time bucket,
+// maintained by src/reports/rollups.js as readings are written. 'all'
+// buckets (at the epoch) hold each station's totals, and location '*' the
+// grand total that the summary report reads.
+const sensorRollupSchema = new mongoose.Schema(
+  {
+    location: { type: String, required: true },
+    granularity: { type: String, enum: ['minute', 'hour', 'day', 'all'], required: true },
+    bucket: { type: Date, required: true },
+    count: { type: Number, default: 0 },
+    sum: readingStats(),
+    min: readingStats(),
+    max: readingStats(),
+    updatedAt: Date
+  },
+  { versionKey: false }
+);
+
+sensorRollupSchema.index({ location: 1, granularity: 1, bucket: 1 }, { unique: true });
+// Time-range queries across all stations
+sensorRollupSchema.index({ granularity: 1, bucket: 1, location: 1 });
+
+export default mongoose.model('SensorRollup', sensorRollupSchema);
@@ -0,0 +1,44 @@
+import Alert from '../models/Alert.js';
+import { latestAlerts } from '../reports/latest.js';
+
+// Behind the replica proxy each backend only reaches its own Socket.io
+// clients. With ALERT_FANOUT=changestream every replica watches the alerts
+// collection and emits alert:new for inserts made by any replica. Change
+// streams need a replica set; on a standalone server we fall back to
+// emitting from the replica that handled the request.
+export function startAlertFanout(app) {
+  const io = app.get('io');
+  if (process.env.ALERT_FANOUT !== 'changestream' || !io) {
+    return;
+  }
+  let stream;
+  try {
+    stream = Alert.watch([{ $match: { operationType: 'insert' } }]);
+  } catch (e) {
+    // eslint-disable-next-line no-console
+    console.warn('Alert fan-out unavailable, emitting locally:', e?.message || e);
+    return;
+  }
+  // The controller keeps emitting locally until the server has accepted the
+  // stream. On a standalone server the watch fails only once its aggregate
+  // runs; if the flag were already set, alerts created before that error
+  // would be emitted by neither path. The first resume token arrives with
+  // the aggregate's reply, or failing that, with the first change.
+  let stopped = false;
+  const confirm = () => {
+    if (!stopped) app.set('alertFanout', true);
+  };
+  stream.once('resumeTokenChanged', confirm);
+  stream.on('change', (change) => {
+    confirm();
+    latestAlerts.add([change.fullDocument]);
+    io.emit('alert:new', change.fullDocument);
+  });
+  stream.on('error', (e) => {
+    // eslint-disable-next-line no-console
+    console.warn('Alert fan-out stopped, emitting locally:', e?.message || e);
+    stopped = true;
+    app.set('alertFanout', false);
+    stream.close().catch(() => {});
+  });
+}
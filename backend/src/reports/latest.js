@@ -0,0 +1,62 @@
+import Sensor from '../models/Sensor.js';
+import Alert from '../models/Alert.js';
+
+export const LATEST_LIMIT = 20;
+// Writes made through this process appear at once; anything written
+// elsewhere (another replica, a bulk load) shows up after a refresh
+const REFRESH_MS = 5000;
+
+// The newest LATEST_LIMIT documents of a collection, kept in memory
+export class LatestCache {
+  constructor(model) {
+    this.model = model;
+    this.items = null;
+    this.loadedAt = 0;
+    this.loading = null;
+  }
+
+  async get() {
+    if (this.items && Date.now() - this.loadedAt < REFRESH_MS) {
+      return this.items;
+    }
+    if (!this.loading) {
+      this.loading = this.model
+        .find({})
+        .sort({ timestamp: -1 })
+        .limit(LATEST_LIMIT)
+        .lean()
+        .then((items) => {
+          this.items = items;
+          this.loadedAt = Date.now();
+          return items;
+        })
+        .catch((err) => {
+          // Nothing cached yet: the caller is awaiting this load, so let it fail
+          if (!this.items) throw err;
+          // Otherwise no one awaits a background refresh; keep serving the
+          // stale list and try again after another REFRESH_MS
+          console.warn(`Refreshing latest ${this.model.modelName} failed, serving the cached list:`,
+            err?.message || err);
+          this.loadedAt = Date.now();
+          return this.items;
+        })
+        .finally(() => {
+          this.loading = null;
+        });
+    }
+    // Serve the previous list while a refresh is in flight
+    return this.items ?? this.loading;
+  }
+
+  add(docs) {
+    if (!this.items) return;
+    const seen = new Set(this.items.map((doc) => String(doc._id)));
+    const fresh = docs.filter((doc) => !seen.has(String(doc._id)));
+    this.items = [...fresh, ...this.items]
+      .sort((a, b) => new Date(b.timestamp) - new Date(a.timestamp))
+      .slice(0, LATEST_LIMIT);
+  }
+}
+
+export const latestSensors = new LatestCache(Sensor);
+export const latestAlerts = new LatestCache(Alert);
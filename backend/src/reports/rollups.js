@@ -0,0 +1,174 @@
+import os from 'os';
+import mongoose from 'mongoose';
+import Sensor from '../models/Sensor.js';
+import SensorRollup from '../models/SensorRollup.js';
+
+export const GRANULARITIES = ['minute', 'hour', 'day'];
+export const ALL = 'all';
+export const TOTAL = '*';
+const EPOCH = new Date(0);
+const FIELDS = ['water_level', 'wind_speed', 'temperature'];
+const BUCKET_MS = { minute: 60 * 1000, hour: 60 * 60 * 1000, day: 24 * 60 * 60 * 1000 };
+const REBUILD_LOCK = 'rollup-rebuild';
+// A replica that dies mid-rebuild holds the lock until this runs out
+const REBUILD_LOCK_MS = 30 * 60 * 1000;
+const DUPLICATE_KEY = 11000;
+
+function bucketOf(time, granularity) {
+  return new Date(Math.floor(time / BUCKET_MS[granularity]) * BUCKET_MS[granularity]);
+}
+
+function prefixed(prefix, values) {
+  return Object.fromEntries(Object.entries(values).map(([field, value]) => [`${prefix}.${field}`, value]));
+}
+
+// Fold freshly inserted readings into the rollups. The batch is first
+// combined in memory, so each touched bucket costs a single upsert, and the
+// upserts go out as one unordered bulkWrite. Upserts on the unique key are
+// retried by the server when two writers race to create the same bucket.
+export async function applyReadings(readings) {
+  if (!readings.length) return;
+  const buckets = new Map();
+  const add = (location, granularity, bucket, reading) => {
+    const key = `${location}|${granularity}|${bucket.getTime()}`;
+    let entry = buckets.get(key);
+    if (!entry) {
+      entry = { location, granularity, bucket, count: 0, sum: {}, min: {}, max: {} };
+      for (const field of FIELDS) {
+        entry.sum[field] = 0;
+        entry.min[field] = Infinity;
+        entry.max[field] = -Infinity;
+      }
+      buckets.set(key, entry);
+    }
+    entry.count += 1;
+    for (const field of FIELDS) {
+      const value = reading[field];
+      entry.sum[field] += value;
+      if (value < entry.min[field]) entry.min[field] = value;
+      if (value > entry.max[field]) entry.max[field] = value;
+    }
+  };
+  for (const reading of readings) {
+    const time = new Date(reading.timestamp).getTime();
+    for (const granularity of GRANULARITIES) {
+      add(reading.location, granularity, bucketOf(time, granularity), reading);
+    }
+    add(reading.location, ALL, EPOCH, reading);
+    add(TOTAL, ALL, EPOCH, reading);
+  }
+
+  const now = new Date();
+  const ops = [...buckets.values()].map((entry) => ({
+    updateOne: {
+      filter: { location: entry.location, granularity: entry.granularity, bucket: entry.bucket },
+      update: {
+        $inc: { count: entry.count, ...prefixed('sum', entry.sum) },
+        $min: prefixed('min', entry.min),
+        $max: prefixed('max', entry.max),
+        $set: { updatedAt: now }
+      },
+      upsert: true
+    }
+  }));
+  await SensorRollup.collection.bulkWrite(ops, { ordered: false });
+}
+
+// Overall averages from the grand-total rollup: one indexed read, however
+// many readings there are. asOf is when a reading was last folded in.
+export async function readSummary() {
+  const total = await SensorRollup.findOne({ location: TOTAL, granularity: ALL, bucket: EPOCH }).lean();
+  if (!total || !total.count) {
+    return { summary: { avgTemp: null, avgWind: null, avgWater: null }, asOf: total?.updatedAt ?? null };
+  }
+  return {
+    summary: {
+      avgTemp: total.sum.temperature / total.count,
+      avgWind: total.sum.wind_speed / total.count,
+      avgWater: total.sum.water_level / total.count
+    },
+    asOf: total.updatedAt
+  };
+}
+
+function rollupStages(granularity, location, bucket) {
+  const group = { _id: { location, bucket }, count: { $sum: 1 } };
+  const project = {
+    _id: 0,
+    location: '$_id.location',
+    granularity: { $literal: granularity },
+    bucket: '$_id.bucket',
+    count: 1,
+    updatedAt: '$$NOW'
+  };
+  for (const stat of ['sum', 'min', 'max']) {
+    project[stat] = {};
+    for (const field of FIELDS) {
+      group[`${stat}_${field}`] = { [`$${stat}`]: `$${field}` };
+      project[stat][field] = `$${stat}_${field}`;
+    }
+  }
+  return [
+    { $group: group },
+    { $project: project },
+    {
+      $merge: {
+        into: SensorRollup.collection.collectionName,
+        on: ['location', 'granularity', 'bucket'],
+        whenMatched: 'replace',
+        whenNotMatched: 'insert'
+      }
+    }
+  ];
+}
+
+// Recompute every rollup from the sensors collection, e.g. after seeding or
+// loading data straight into MongoDB. Readings ingested while this runs may
+// be counted twice or not at all, so run it while writes are paused.
+export async function rebuildRollups() {
+  await SensorRollup.init();
+  await SensorRollup.deleteMany({});
+  for (const granularity of GRANULARITIES) {
+    const bucket = { $dateTrunc: { date: '$timestamp', unit: granularity } };
+    await Sensor.aggregate(rollupStages(granularity, '$location', bucket)).allowDiskUse(true);
+  }
+  await Sensor.aggregate(rollupStages(ALL, '$location', { $literal: EPOCH })).allowDiskUse(true);
+  await Sensor.aggregate(rollupStages(ALL, { $literal: TOTAL }, { $literal: EPOCH }));
+}
+
+// Take the rebuild lock unless another process holds an unexpired one. The
+// upsert inserts the lock when there is none and takes over an expired one;
+// when a live lock exists the filter misses and the insert hits the unique _id.
+async function acquireRebuildLock(owner) {
+  const now = new Date();
+  try {
+    await mongoose.connection.collection('locks').findOneAndUpdate(
+      { _id: REBUILD_LOCK, expiresAt: { $lte: now } },
+      { $set: { owner, acquiredAt: now, expiresAt: new Date(now.getTime() + REBUILD_LOCK_MS) } },
+      { upsert: true }
+    );
+    return true;
+  } catch (err) {
+    if (err.code === DUPLICATE_KEY) return false;
+    throw err;
+  }
+}
+
+// Build the rollups on startup if there are readings but no rollups yet,
+// as after upgrading an existing database. Every replica calls this, so a
+// lock document makes sure only one of them runs the rebuild.
+export async function ensureRollups() {
+  const built = () => SensorRollup.exists({ location: TOTAL, granularity: ALL });
+  if (await built()) return false;
+  if (!(await Sensor.exists({}))) return false;
+  const owner = `${os.hostname()}:${process.pid}`;
+  if (!(await acquireRebuildLock(owner))) return false;
+  try {
+    // Another replica may have finished between the check and the lock
+    if (await built()) return false;
+    await rebuildRollups();
+    return true;
+  } finally {
+    await mongoose.connection.collection('locks').deleteOne({ _id: REBUILD_LOCK, owner });
+  }
+}
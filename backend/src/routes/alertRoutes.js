@@ -1,10 +1,11 @@
 import { Router } from 'express';
-import { listAlerts, createAlert } from '../controllers/alertController.js';
+import { listAlerts, createAlert, exportAlerts } from '../controllers/alertController.js';
 import { authenticateJWT, authorizeRoles } from '../middleware/auth.js';
 
 const router = Router();
 
 router.get('/', listAlerts);
+router.get('/export', authenticateJWT, authorizeRoles('Admin', 'Researcher'), exportAlerts);
 router.post('/', authenticateJWT, authorizeRoles('Admin', 'Researcher'), createAlert);
 
 export default router;
@@ -1,11 +1,12 @@
 import { Router } from "express";
-import { getSummaryReport } from "../controllers/reportController.js";
+import { getSummaryReport, listRollups } from "../controllers/reportController.js";
 import { authenticateJWT, authorizeRoles } from "../middleware/auth.js";
 
 const router = Router();
 
 // Allow public access to summary reports for integration testing
 router.get("/", getSummaryReport);
+router.get("/rollups", listRollups);
 
 // POST endpoint for user-submitted hazard reports (placeholder)
 router.post("/", async (req, res) => {
@@ -1,10 +1,11 @@
 import { Router } from 'express';
-import { listSensors } from '../controllers/sensorController.js';
+import { listSensors, ingestSensors, exportSensors } from '../controllers/sensorController.js';
+import { authenticateJWT, authorizeRoles } from '../middleware/auth.js';
 
 const router = Router();
 
 router.get('/', listSensors);
+router.get('/export', authenticateJWT, authorizeRoles('Admin', 'Researcher'), exportSensors);
+router.post('/bulk', authenticateJWT, authorizeRoles('Admin', 'Researcher'), ingestSensors);
 
 export default router;
-
-
@@ -0,0 +1,28 @@
+import dotenv from 'dotenv';
+import path from 'path';
+import { fileURLToPath } from 'url';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = path.dirname(__filename);
+dotenv.config({ path: path.join(__dirname, '../../mg.env') });
+
+import mongoose from 'mongoose';
+import { rebuildRollups } from '../reports/rollups.js';
+
+// Recompute the sensor rollups from scratch, e.g. after loading readings
+// straight into MongoDB with tools/generate.py --mongo
+async function run() {
+  const mongoUri = process.env.MONGO_URI || 'mongodb://localhost:27017/coastalwatch';
+  await mongoose.connect(mongoUri);
+  const started = Date.now();
+  await rebuildRollups();
+  // eslint-disable-next-line no-console
+  console.log(`Sensor rollups rebuilt in ${((Date.now() - started) / 1000).toFixed(1)}s`);
+  await mongoose.disconnect();
+}
+
+run().catch((err) => {
+  // eslint-disable-next-line no-console
+  console.error(err);
+  process.exit(1);
+});
@@ -11,6 +11,7 @@ import bcrypt from 'bcryptjs';
 import User from '../models/User.js';
 import Sensor from '../models/Sensor.js';
 import Alert from '../models/Alert.js';
+import { rebuildRollups } from '../reports/rollups.js';
 
 async function run() {
   const mongoUri = process.env.MONGO_URI || 'mongodb://localhost:27017/coastalwatch';
@@ -34,6 +35,7 @@ async function run() {
     timestamp: new Date(now.getTime() - i * 60 * 60 * 1000)
   }));
   await Sensor.insertMany(sensors);
+  await rebuildRollups();
 
   await Alert.insertMany([
     { type: 'Tide', message: 'High tide approaching', severity: 'medium' },
@@ -0,0 +1,136 @@
+import mongoose from 'mongoose';
+
+export const PAGE_LIMIT = 200;
+export const MAX_PAGE_LIMIT = 1000;
+const EXPORT_BATCH = 1000;
+
+// A bad query parameter; controllers answer these with 400
+export class QueryError extends Error {}
+
+// Resolves once the response can take more data or the client has gone
+function drained(res) {
+  return new Promise((resolve) => {
+    const done = () => {
+      res.off('drain', done);
+      res.off('close', done);
+      resolve();
+    };
+    res.on('drain', done);
+    res.on('close', done);
+  });
+}
+
+// Opaque position after a document in (timestamp, _id) order
+export function encodeCursor(doc) {
+  const position = { t: new Date(doc.timestamp).toISOString(), id: String(doc._id) };
+  return Buffer.from(JSON.stringify(position)).toString('base64url');
+}
+
+function decodeCursor(cursor) {
+  let position;
+  try {
+    position = JSON.parse(Buffer.from(cursor, 'base64url').toString());
+  } catch (err) {
+    throw new QueryError('Invalid cursor');
+  }
+  const timestamp = new Date(position?.t);
+  if (Number.isNaN(timestamp.getTime()) || !mongoose.isObjectIdOrHexString(position.id)) {
+    throw new QueryError('Invalid cursor');
+  }
+  return { timestamp, id: new mongoose.Types.ObjectId(position.id) };
+}
+
+function parseTime(name, value) {
+  const time = new Date(value);
+  if (Number.isNaN(time.getTime())) {
+    throw new QueryError(`${name} must be an ISO 8601 time`);
+  }
+  return time;
+}
+
+// Filter and projection shared by pages and exports. direction is -1 for
+// newest first and 1 for oldest first; the cursor continues after the
+// document it was made from in that direction. _id and timestamp are
+// always returned because the next cursor is built from them.
+function keysetQuery(query, allowedFields, direction) {
+  const clauses = [];
+  if (query.from || query.to) {
+    const timestamp = {};
+    if (query.from) timestamp.$gte = parseTime('from', query.from);
+    if (query.to) timestamp.$lt = parseTime('to', query.to);
+    clauses.push({ timestamp });
+  }
+  if (query.cursor) {
+    const { timestamp, id } = decodeCursor(query.cursor);
+    const beyond = direction < 0 ? '$lt' : '$gt';
+    clauses.push({ $or: [{ timestamp: { [beyond]: timestamp } }, { timestamp, _id: { [beyond]: id } }] });
+  }
+  const filter = clauses.length > 1 ? { $and: clauses } : clauses[0] || {};
+
+  let projection = null;
+  if (query.fields) {
+    const fields = String(query.fields).split(',').map((f) => f.trim()).filter(Boolean);
+    const unknown = fields.filter((f) => !allowedFields.includes(f));
+    if (unknown.length) {
+      throw new QueryError(`Unknown field(s): ${unknown.join(', ')}; choose from ${allowedFields.join(', ')}`);
+    }
+    projection = Object.fromEntries(['_id', 'timestamp', ...fields].map((f) => [f, 1]));
+  }
+  const sort = { timestamp: direction, _id: direction };
+  return { filter, projection, sort };
+}
+
+// GET ?limit=&cursor=&fields=&from=&to= newest first. The body stays a
+// plain array; when there are more documents, the cursor for the next page
+// is sent in X-Next-Cursor and a Link: rel="next" header.
+export async function sendPage(Model, allowedFields, req, res) {
+  let query;
+  try {
+    query = keysetQuery(req.query, allowedFields, -1);
+  } catch (err) {
+    if (err instanceof QueryError) return res.status(400).json({ message: err.message });
+    throw err;
+  }
+  const requested = Number.parseInt(req.query.limit, 10) || PAGE_LIMIT;
+  const limit = Math.min(Math.max(requested, 1), MAX_PAGE_LIMIT);
+  // One extra document says whether there is a next page without a count
+  const docs = await Model.find(query.filter, query.projection).sort(query.sort).limit(limit + 1).lean();
+  if (docs.length > limit) {
+    docs.pop();
+    const next = encodeCursor(docs[docs.length - 1]);
+    const params = new URLSearchParams({ ...req.query, cursor: next });
+    res.set('X-Next-Cursor', next);
+    res.links({ next: `${req.baseUrl}${req.path === '/' ? '' : req.path}?${params}` });
+  }
+  return res.json(docs);
+}
+
+// GET ?fields=&from=&to=&cursor= as NDJSON, oldest first, written as the
+// database cursor yields documents. Only one batch is held in memory, and
+// a slow client pauses the cursor rather than filling the socket buffer.
+// A client that loses the connection can resume with the cursor of the
+// last line it received.
+export async function streamExport(Model, allowedFields, req, res) {
+  let query;
+  try {
+    query = keysetQuery(req.query, allowedFields, 1);
+  } catch (err) {
+    if (err instanceof QueryError) return res.status(400).json({ message: err.message });
+    throw err;
+  }
+  res.status(200).type('application/x-ndjson').set('Cache-Control', 'no-store');
+  const cursor = Model.find(query.filter, query.projection).sort(query.sort).lean().cursor({ batchSize: EXPORT_BATCH });
+  try {
+    for await (const doc of cursor) {
+      if (res.destroyed) break;
+      if (!res.write(`${JSON.stringify(doc)}\n`)) await drained(res);
+    }
+  } catch (err) {
+    // Headers are already out; cutting the stream short is the only signal
+    res.destroy(err);
+    return undefined;
+  } finally {
+    await cursor.close().catch(() => {});
+  }
+  return res.end();
+}
@@ -0,0 +1,66 @@
+import { jest } from '@jest/globals';
+import { LatestCache } from '../src/reports/latest.js';
+
+// Stands in for a Mongoose model: each find() chain resolves or rejects
+// with the next queued result
+function fakeModel(results) {
+  const model = {
+    modelName: 'Sensor',
+    queries: 0,
+    find: () => ({
+      sort: () => ({
+        limit: () => ({
+          lean: () => {
+            model.queries += 1;
+            return results.shift()();
+          }
+        })
+      })
+    })
+  };
+  return model;
+}
+
+describe('LatestCache', () => {
+  let unhandled;
+  const onUnhandled = (reason) => unhandled.push(reason);
+
+  beforeEach(() => {
+    unhandled = [];
+    process.on('unhandledRejection', onUnhandled);
+    jest.spyOn(console, 'warn').mockImplementation(() => {});
+  });
+
+  afterEach(() => {
+    process.off('unhandledRejection', onUnhandled);
+    jest.restoreAllMocks();
+  });
+
+  test('a failed background refresh keeps serving the stale list', async () => {
+    const stale = [{ _id: 'a', timestamp: new Date('2024-06-01T00:00:00Z') }];
+    const model = fakeModel([() => Promise.resolve(stale), () => Promise.reject(new Error('not primary'))]);
+    const cache = new LatestCache(model);
+
+    expect(await cache.get()).toBe(stale);
+    cache.loadedAt = 0;
+    expect(await cache.get()).toBe(stale);
+    await cache.loading;
+    // Give Node a turn to report any rejection nobody handled
+    await new Promise((resolve) => setImmediate(resolve));
+
+    expect(unhandled).toEqual([]);
+    expect(console.warn).toHaveBeenCalledTimes(1);
+    // The failure counts as a refresh, so the next request doesn't retry at once
+    expect(await cache.get()).toBe(stale);
+    expect(model.queries).toBe(2);
+  });
+
+  test('a failed first load rejects to the caller', async () => {
+    const cache = new LatestCache(fakeModel([() => Promise.reject(new Error('not primary'))]));
+
+    await expect(cache.get()).rejects.toThrow('not primary');
+    await new Promise((resolve) => setImmediate(resolve));
+    expect(unhandled).toEqual([]);
+    expect(cache.items).toBeNull();
+  });
+});
@@ -0,0 +1,652 @@
+#!/usr/bin/env python3
+"""
+CoastalWatch Backend Proxy
+Load-balances the backend API across replicas (asyncio reverse proxy)
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import signal
+import sys
+import time
+from urllib.parse import parse_qs, urlsplit
+
+# Active health checks against each replica
+HEALTH_INTERVAL = 2.0
+HEALTH_TIMEOUT = 2.0
+# Consecutive failed checks before a replica is taken out of rotation
+UNHEALTHY_AFTER = 2
+
+# Largest request/response head we accept
+MAX_HEAD = 64 * 1024
+# Keep-alive connections kept open to each replica
+MAX_IDLE_PER_UPSTREAM = 32
+# Node closes idle keep-alive sockets after 5s; retire ours a little sooner
+UPSTREAM_IDLE_TIMEOUT = 4.0
+UPSTREAM_CONNECT_TIMEOUT = 3.0
+CLIENT_IDLE_TIMEOUT = 75.0
+COPY_CHUNK = 64 * 1024
+
+# Share of a drain's deadline over which open WebSockets are closed, so
+# their clients reconnect to other replicas a few at a time
+DRAIN_SPREAD = 0.5
+DRAIN_TIMEOUT = 30.0
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HOP_BY_HOP = {"connection", "keep-alive", "proxy-connection", "te", "upgrade"}
+NO_BODY_STATUSES = {204, 304}
+
+
+class HttpError(Exception):
+    """Malformed or oversized HTTP message from a client"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def log(message):
+    print(message, flush=True)
+
+
+def header(headers, name, default=None):
+    """Return the first value of a header (case-insensitive)"""
+    name = name.lower()
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return default
+
+
+def tokens(headers, name):
+    """Return the comma-separated tokens of a header, lowercased"""
+    value = header(headers, name, "")
+    return {t.strip().lower() for t in value.split(",") if t.strip()}
+
+
+async def read_head(reader):
+    """
+    Read an HTTP request or response head
+
+    Returns:
+        (start_line, [(name, value), ...]) or None on a clean EOF
+    """
+    try:
+        data = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as e:
+        if not e.partial.strip():
+            return None
+        raise HttpError(400, "truncated head")
+    except asyncio.LimitOverrunError:
+        raise HttpError(431, "head too large")
+    lines = data[:-4].decode("latin-1").split("\r\n")
+    headers = []
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if not sep:
+            raise HttpError(400, "malformed header")
+        headers.append((name.strip(), value.strip()))
+    return lines[0], headers
+
+
+def encode_head(start_line, headers):
+    return (start_line + "\r\n" + "".join(f"{k}: {v}\r\n" for k, v in headers) + "\r\n").encode("latin-1")
+
+
+async def copy_exactly(reader, writer, size):
+    while size > 0:
+        chunk = await reader.readexactly(min(size, COPY_CHUNK))
+        writer.write(chunk)
+        size -= len(chunk)
+        await writer.drain()
+
+
+async def copy_body(reader, writer, headers, response_to=None, status=None):
+    """
+    Stream a message body from reader to writer unchanged
+
+    Args:
+        response_to: Request method when copying a response, None for requests
+        status: Response status code
+
+    Returns:
+        True if the body was length-delimited, False if it ran until EOF
+    """
+    if response_to is not None and (response_to == "HEAD" or status in NO_BODY_STATUSES or status < 200):
+        return True
+    if "chunked" in tokens(headers, "transfer-encoding"):
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            writer.write(line)
+            size = int(line.split(b";", 1)[0].strip(), 16)
+            if size == 0:
+                # Trailers, terminated by an empty line
+                while True:
+                    line = await reader.readuntil(b"\r\n")
+                    writer.write(line)
+                    if line == b"\r\n":
+                        break
+                await writer.drain()
+                return True
+            await copy_exactly(reader, writer, size + 2)
+    length = header(headers, "content-length")
+    if length is not None:
+        await copy_exactly(reader, writer, int(length))
+        return True
+    if response_to is None:
+        return True  # requests without a length have no body
+    while True:
+        chunk = await reader.read(COPY_CHUNK)
+        if not chunk:
+            return False
+        writer.write(chunk)
+        await writer.drain()
+
+
+async def pipe(reader, writer):
+    try:
+        while True:
+            chunk = await reader.read(COPY_CHUNK)
+            if not chunk:
+                break
+            writer.write(chunk)
+            await writer.drain()
+    except (ConnectionError, asyncio.CancelledError):
+        pass
+    finally:
+        writer.close()
+
+
+class Upstream:
+    """One backend replica and its counters"""
+
+    def __init__(self, port, host="127.0.0.1"):
+        self.host = host
+        self.port = port
+        self.healthy = False  # until the first health check passes
+        self.draining = False
+        self.failures = 0
+        self.outstanding = 0
+        self.requests = 0
+        self.errors = 0
+        self.latency_buckets = [0] * len(LATENCY_BUCKETS)
+        self.latency_sum = 0.0
+        self.idle = []
+        self.tunnels = set()
+
+    @property
+    def name(self):
+        return str(self.port)
+
+    @property
+    def available(self):
+        return self.healthy and not self.draining
+
+    def observe(self, seconds, error):
+        self.requests += 1
+        if error:
+            self.errors += 1
+        self.latency_sum += seconds
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.latency_buckets[i] += 1
+                break
+
+    def mark_down(self, reason):
+        if self.healthy:
+            log(f"⚠️  Replica :{self.port} out of rotation ({reason})")
+        self.healthy = False
+        self.close_idle()
+
+    async def connect(self):
+        """Return (reader, writer, reused) using a pooled keep-alive connection when possible"""
+        now = time.monotonic()
+        while self.idle:
+            reader, writer, since = self.idle.pop()
+            if now - since < UPSTREAM_IDLE_TIMEOUT and not reader.at_eof() and not writer.is_closing():
+                return reader, writer, True
+            writer.close()
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, limit=MAX_HEAD), UPSTREAM_CONNECT_TIMEOUT)
+        return reader, writer, False
+
+    def release(self, reader, writer):
+        if len(self.idle) < MAX_IDLE_PER_UPSTREAM and not self.draining:
+            self.idle.append((reader, writer, time.monotonic()))
+        else:
+            writer.close()
+
+    def close_idle(self):
+        for _, writer, _ in self.idle:
+            writer.close()
+        self.idle = []
+
+
+def rendezvous(key, upstream):
+    """Highest-random-weight score: each key keeps its replica as others come and go"""
+    return hashlib.blake2b(f"{key}|{upstream.port}".encode(), digest_size=8).digest()
+
+
+def engine_sid(target):
+    """Return the Engine.IO session id in a /socket.io/ request target, or None"""
+    values = parse_qs(urlsplit(target).query).get("sid")
+    return values[0] if values else None
+
+
+class Proxy:
+    """
+    HTTP/1.1 reverse proxy spreading requests across healthy replicas
+
+    Requests go to the replica with the fewest outstanding requests,
+    including Socket.io handshakes. Once a Socket.io session exists, its
+    requests carry the Engine.IO sid, and they go to the replica that
+    holds the session. Replicas prefix their sids with their own port
+    (see server.js). A sid without a known port is pinned by hashing it.
+    Clients behind one NAT or on localhost therefore still spread across
+    replicas, one session at a time.
+    """
+
+    def __init__(self, ports, health_path="/health"):
+        self.upstreams = {port: Upstream(port) for port in ports}
+        self.health_path = health_path
+        self.no_upstream = 0
+        self._next = 0
+
+    def pick(self, sid=None, exclude=()):
+        candidates = [u for u in self.upstreams.values() if u.available and u not in exclude]
+        if not candidates:
+            return None
+        if sid is not None:
+            owner, _, _ = sid.partition(".")
+            for upstream in candidates:
+                if owner == str(upstream.port):
+                    return upstream
+            return max(candidates, key=lambda u: rendezvous(sid, u))
+        fewest = min(u.outstanding for u in candidates)
+        tied = [u for u in candidates if u.outstanding == fewest]
+        self._next += 1
+        return tied[self._next % len(tied)]
+
+    # -- health checks -------------------------------------------------
+
+    async def check(self, upstream):
+        ok = False
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(upstream.host, upstream.port), HEALTH_TIMEOUT)
+            try:
+                writer.write(f"GET {self.health_path} HTTP/1.1\r\nHost: 127.0.0.1:{upstream.port}\r\n"
+                             "Connection: close\r\n\r\n".encode())
+                status_line = await asyncio.wait_for(reader.readline(), HEALTH_TIMEOUT)
+                parts = status_line.split()
+                ok = len(parts) >= 2 and parts[1] == b"200"
+            finally:
+                writer.close()
+        except (OSError, asyncio.TimeoutError):
+            ok = False
+
+        if ok:
+            upstream.failures = 0
+            if not upstream.healthy:
+                log(f"💚 Replica :{upstream.port} in rotation")
+            upstream.healthy = True
+        else:
+            upstream.failures += 1
+            if upstream.failures >= UNHEALTHY_AFTER:
+                upstream.mark_down("health check failed")
+
+    async def health_loop(self):
+        while True:
+            await asyncio.gather(*(self.check(u) for u in list(self.upstreams.values())))
+            await asyncio.sleep(HEALTH_INTERVAL)
+
+    # -- proxying ------------------------------------------------------
+
+    async def handle_client(self, reader, writer):
+        peer = writer.get_extra_info("peername")
+        client_ip = peer[0] if peer else "unknown"
+        try:
+            while True:
+                head = await asyncio.wait_for(read_head(reader), CLIENT_IDLE_TIMEOUT)
+                if head is None:
+                    break
+                if not await self.forward(head, reader, writer, client_ip):
+                    break
+        except HttpError as e:
+            await self.respond(writer, e.status, {"message": str(e)}, keep_alive=False)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, writer, status, payload, keep_alive=True):
+        body = json.dumps(payload).encode()
+        reason = {400: "Bad Request", 431: "Request Header Fields Too Large",
+                  502: "Bad Gateway", 503: "Service Unavailable"}.get(status, "Error")
+        headers = [("Content-Type", "application/json"), ("Content-Length", str(len(body))),
+                   ("Connection", "keep-alive" if keep_alive else "close")]
+        try:
+            writer.write(encode_head(f"HTTP/1.1 {status} {reason}", headers) + body)
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+    async def forward(self, head, reader, writer, client_ip):
+        """
+        Proxy one request (and its response) for a client connection
+
+        Returns:
+            True if the client connection can carry another request
+        """
+        start_line, headers = head
+        try:
+            method, target, version = start_line.split(" ", 2)
+        except ValueError:
+            raise HttpError(400, "malformed request line")
+        path = urlsplit(target).path
+        connection = tokens(headers, "connection")
+        upgrade = "upgrade" in connection and header(headers, "upgrade") is not None
+        client_keep_alive = version == "HTTP/1.1" and "close" not in connection
+        has_body = header(headers, "content-length", "0") != "0" or header(headers, "transfer-encoding")
+        sid = engine_sid(target) if path.startswith("/socket.io/") else None
+
+        forwarded = [(k, v) for k, v in headers if k.lower() not in HOP_BY_HOP]
+        previous = header(headers, "x-forwarded-for")
+        forwarded = [(k, v) for k, v in forwarded if k.lower() != "x-forwarded-for"]
+        forwarded.append(("X-Forwarded-For", f"{previous}, {client_ip}" if previous else client_ip))
+        if upgrade:
+            forwarded += [("Connection", "Upgrade"), ("Upgrade", header(headers, "upgrade"))]
+        else:
+            forwarded.append(("Connection", "keep-alive"))
+        request_head = encode_head(f"{method} {target} HTTP/1.1", forwarded)
+
+        tried = []
+        while True:
+            upstream = self.pick(sid, exclude=tried)
+            if upstream is None:
+                self.no_upstream += 1
+                await self.respond(writer, 503, {"message": "No healthy backend replica"},
+                                   keep_alive=client_keep_alive and not has_body)
+                return client_keep_alive and not has_body
+            try:
+                up_reader, up_writer, reused = await upstream.connect()
+            except (OSError, asyncio.TimeoutError):
+                upstream.mark_down("connection refused")
+                tried.append(upstream)
+                continue
+
+            started = time.monotonic()
+            upstream.outstanding += 1
+            response_started = False
+            try:
+                up_writer.write(request_head)
+                if not upgrade:
+                    await copy_body(reader, up_writer, headers)
+                await up_writer.drain()
+                response = await read_head(up_reader)
+                while response is not None and response[0].split(" ", 2)[1] in ("100", "102", "103"):
+                    writer.write(encode_head(*response))
+                    response = await read_head(up_reader)
+                if response is None:
+                    raise ConnectionError("replica closed the connection")
+                status_line, response_headers = response
+                status = int(status_line.split(" ", 2)[1])
+
+                if upgrade and status == 101:
+                    writer.write(encode_head(status_line, response_headers))
+                    await writer.drain()
+                    upstream.observe(time.monotonic() - started, error=False)
+                    upstream.outstanding -= 1
+                    started = None
+                    await self.tunnel(upstream, reader, writer, up_reader, up_writer)
+                    return False
+
+                delimited = (method == "HEAD" or status in NO_BODY_STATUSES
+                             or header(response_headers, "content-length") is not None
+                             or "chunked" in tokens(response_headers, "transfer-encoding"))
+                keep_alive = client_keep_alive and delimited and not upgrade
+                out_headers = [(k, v) for k, v in response_headers if k.lower() not in ("connection", "keep-alive")]
+                out_headers.append(("Connection", "keep-alive" if keep_alive else "close"))
+                response_started = True
+                writer.write(encode_head(status_line, out_headers))
+                await copy_body(up_reader, writer, response_headers, response_to=method, status=status)
+                await writer.drain()
+
+                upstream.observe(time.monotonic() - started, error=status >= 500)
+                if delimited and "close" not in tokens(response_headers, "connection"):
+                    upstream.release(up_reader, up_writer)
+                else:
+                    up_writer.close()
+                return keep_alive
+            except (ConnectionError, asyncio.IncompleteReadError, HttpError, ValueError) as e:
+                up_writer.close()
+                if started is not None:
+                    upstream.observe(time.monotonic() - started, error=True)
+                if response_started:
+                    return False
+                # A stale pooled connection is safe to retry when nothing in the
+                # request body has been consumed
+                if reused and not has_body:
+                    continue
+                await self.respond(writer, 502, {"message": f"Backend replica error: {e}"}, keep_alive=False)
+                return False
+            finally:
+                if started is not None:
+                    upstream.outstanding -= 1
+
+    async def tunnel(self, upstream, reader, writer, up_reader, up_writer):
+        """Relay an upgraded (WebSocket) connection until either side closes"""
+        entry = (writer, up_writer)
+        upstream.tunnels.add(entry)
+        try:
+            await asyncio.gather(pipe(reader, up_writer), pipe(up_reader, writer))
+        finally:
+            upstream.tunnels.discard(entry)
+
+    # -- admin ---------------------------------------------------------
+
+    def metrics(self):
+        lines = []
+
+        def family(name, kind, help_text, values):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for upstream in self.upstreams.values():
+                lines.append(f'{name}{{upstream="{upstream.name}"}} {values(upstream)}')
+
+        family("coastalwatch_proxy_upstream_up", "gauge", "1 if the replica is passing health checks",
+               lambda u: int(u.healthy))
+        family("coastalwatch_proxy_upstream_draining", "gauge", "1 if the replica is being drained",
+               lambda u: int(u.draining))
+        family("coastalwatch_proxy_upstream_outstanding_requests", "gauge", "Requests in flight",
+               lambda u: u.outstanding)
+        family("coastalwatch_proxy_upstream_tunnels", "gauge", "Open WebSocket tunnels",
+               lambda u: len(u.tunnels))
+        family("coastalwatch_proxy_upstream_requests_total", "counter", "Requests proxied",
+               lambda u: u.requests)
+        family("coastalwatch_proxy_upstream_errors_total", "counter", "Requests that failed or returned 5xx",
+               lambda u: u.errors)
+
+        name = "coastalwatch_proxy_upstream_latency_seconds"
+        lines.append(f"# HELP {name} Time from request head to end of response")
+        lines.append(f"# TYPE {name} histogram")
+        for upstream in self.upstreams.values():
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, upstream.latency_buckets):
+                cumulative += count
+                lines.append(f'{name}_bucket{{upstream="{upstream.name}",le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{upstream="{upstream.name}",le="+Inf"}} {upstream.requests}')
+            lines.append(f'{name}_sum{{upstream="{upstream.name}"}} {upstream.latency_sum:.6f}')
+            lines.append(f'{name}_count{{upstream="{upstream.name}"}} {upstream.requests}')
+
+        lines.append("# HELP coastalwatch_proxy_no_upstream_total Requests rejected with no healthy replica")
+        lines.append("# TYPE coastalwatch_proxy_no_upstream_total counter")
+        lines.append(f"coastalwatch_proxy_no_upstream_total {self.no_upstream}")
+        return "\n".join(lines) + "\n"
+
+    def describe(self):
+        return [{
+            "port": u.port,
+            "healthy": u.healthy,
+            "draining": u.draining,
+            "outstanding": u.outstanding,
+            "tunnels": len(u.tunnels),
+            "requests": u.requests,
+            "errors": u.errors,
+        } for u in self.upstreams.values()]
+
+    async def add(self, port):
+        """Put a replica into rotation once it passes a health check"""
+        upstream = self.upstreams.get(port)
+        if upstream is None:
+            upstream = self.upstreams[port] = Upstream(port)
+        upstream.draining = False
+        await self.check(upstream)
+        return upstream
+
+    async def drain(self, upstream, timeout=DRAIN_TIMEOUT):
+        """
+        Take a replica out of rotation and wait for its traffic to finish
+
+        New requests go to other replicas at once. Open WebSockets are
+        closed one by one over the first part of the deadline, and
+        in-flight requests get until the deadline to complete.
+
+        Returns:
+            Dict with the drain time, WebSockets closed and requests still in flight
+        """
+        started = time.monotonic()
+        deadline = started + timeout
+        upstream.draining = True
+        upstream.close_idle()
+        log(f"🚰 Draining replica :{upstream.port} ({upstream.outstanding} in flight, "
+            f"{len(upstream.tunnels)} WebSockets)")
+
+        tunnels = list(upstream.tunnels)
+        closed = 0
+        if tunnels:
+            gap = timeout * DRAIN_SPREAD / len(tunnels)
+            for client_writer, up_writer in tunnels:
+                if (client_writer, up_writer) in upstream.tunnels:
+                    client_writer.close()
+                    up_writer.close()
+                    closed += 1
+                await asyncio.sleep(gap)
+        while upstream.outstanding and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+
+        seconds = time.monotonic() - started
+        log(f"🚰 Replica :{upstream.port} drained in {seconds:.2f}s "
+            f"({upstream.outstanding} request(s) left)")
+        return {"port": upstream.port, "seconds": round(seconds, 3),
+                "websockets_closed": closed, "in_flight": upstream.outstanding}
+
+    def remove(self, upstream):
+        del self.upstreams[upstream.port]
+        upstream.close_idle()
+        for client_writer, up_writer in list(upstream.tunnels):
+            client_writer.close()
+            up_writer.close()
+        log(f"➖ Replica :{upstream.port} removed")
+
+    async def admin_route(self, method, path, payload):
+        """Dispatch an admin request; returns (status, body, content_type)"""
+        if method == "GET" and path == "/metrics":
+            return 200, self.metrics(), "text/plain; version=0.0.4"
+        if method == "GET" and path == "/upstreams":
+            return 200, self.describe(), None
+        if method == "POST" and path == "/upstreams":
+            upstream = await self.add(int(payload["port"]))
+            log(f"➕ Replica :{upstream.port} added ({'healthy' if upstream.healthy else 'not healthy yet'})")
+            return 200, {"port": upstream.port, "healthy": upstream.healthy}, None
+
+        parts = path.strip("/").split("/")
+        if len(parts) >= 2 and parts[0] == "upstreams" and parts[1].isdigit():
+            upstream = self.upstreams.get(int(parts[1]))
+            if upstream is None:
+                return 404, {"message": f"No replica on port {parts[1]}"}, None
+            if method == "POST" and parts[2:] == ["drain"]:
+                return 200, await self.drain(upstream, float(payload.get("timeout", DRAIN_TIMEOUT))), None
+            if method == "DELETE" and len(parts) == 2:
+                self.remove(upstream)
+                return 200, {"port": upstream.port}, None
+        return 404, {"message": "Not found"}, None
+
+    async def handle_admin(self, reader, writer):
+        """
+        Local control API used by run_all.py
+
+        GET /metrics, GET /upstreams, POST /upstreams {"port": N},
+        POST /upstreams/N/drain {"timeout": seconds}, DELETE /upstreams/N
+        """
+        try:
+            head = await asyncio.wait_for(read_head(reader), 10)
+            if head is None:
+                return
+            method, target, _ = head[0].split(" ", 2)
+            length = int(header(head[1], "content-length", "0"))
+            payload = json.loads(await reader.readexactly(length)) if length else {}
+            try:
+                status, body, content_type = await self.admin_route(method, urlsplit(target).path, payload)
+            except (KeyError, TypeError, ValueError) as e:
+                status, body, content_type = 400, {"message": f"Bad request: {e}"}, None
+            if content_type is None:
+                body, content_type = json.dumps(body), "application/json"
+            body = body.encode()
+            reason = {200: "OK", 400: "Bad Request", 404: "Not Found"}[status]
+            writer.write(encode_head(f"HTTP/1.1 {status} {reason}", [
+                ("Content-Type", content_type), ("Content-Length", str(len(body))), ("Connection", "close"),
+            ]) + body)
+            await writer.drain()
+        except (HttpError, ValueError, ConnectionError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(args):
+    proxy = Proxy(args.upstream, health_path=args.health_path)
+    server = await asyncio.start_server(proxy.handle_client, args.host, args.port,
+                                        limit=MAX_HEAD, reuse_address=True)
+    admin = await asyncio.start_server(proxy.handle_admin, "127.0.0.1", args.admin_port,
+                                       limit=MAX_HEAD, reuse_address=True)
+    health = asyncio.create_task(proxy.health_loop())
+    log(f"✅ Proxy on http://{args.host}:{args.port} → replicas "
+        f"{', '.join(f':{p}' for p in args.upstream)} (admin http://127.0.0.1:{args.admin_port})")
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    if sys.platform != "win32":
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, stop.set)
+    try:
+        await stop.wait()
+    finally:
+        health.cancel()
+        server.close()
+        admin.close()
+        for upstream in proxy.upstreams.values():
+            upstream.close_idle()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-balance the CoastalWatch backend across replicas")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=4000)
+    parser.add_argument("--admin-port", type=int, default=4900,
+                        help="Local port for /metrics and /upstreams (default 4900)")
+    parser.add_argument("--upstream", type=int, action="append", required=True,
+                        help="Replica port on 127.0.0.1 (repeatable)")
+    parser.add_argument("--health-path", default="/health")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
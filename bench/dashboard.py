@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+CoastalWatch Dashboard Benchmark
+Compares the dashboard's development server with its prefork worker pool
+
+Each mode is started on a free port and driven closed-loop with the page
+and /status.json. It is then stopped with SIGTERM, as run_all.py would.
+The dev and prefork results are printed side by side as JSON.
+
+    python bench/dashboard.py --concurrency 64 --duration 15
+    python bench/dashboard.py --workers 4 --threads 16 --modes prefork
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+from loadtest import LoadTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from readiness import wait_ready
+
+PATHS = {"page": "/", "status": "/status.json"}
+READY_TIMEOUT = 30
+STOP_TIMEOUT = 10
+
+
+def log(message):
+    print(message, file=sys.stderr, flush=True)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def command_for(mode, port, args):
+    command = [sys.executable, "app.py", "--port", str(port)]
+    if mode == "prefork":
+        command += ["--prefork", "--workers", str(args.workers), "--threads", str(args.threads)]
+    return command
+
+
+def bench_mode(mode, args):
+    """Start one serving mode, load it, stop it; returns the load-test result"""
+    port = free_port()
+    url = f"http://127.0.0.1:{port}"
+    process = subprocess.Popen(command_for(mode, port, args), cwd=os.path.join(ROOT, "dashboard"),
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                               start_new_session=True)
+    try:
+        ready = wait_ready({mode: f"{url}/health"}, timeout=READY_TIMEOUT)[mode]
+        if not ready.ready:
+            raise SystemExit(f"❌ {mode} dashboard not ready: {ready.error}")
+        log(f"⏱️  {mode}: {args.concurrency} client(s) for {args.duration:g}s...")
+        test = LoadTest(url, list(PATHS), args.duration, warmup=args.warmup, paths=PATHS)
+        result = asyncio.run(test.run(concurrency=args.concurrency))
+    finally:
+        stopped = time.monotonic()
+        os.killpg(process.pid, signal.SIGTERM)
+        try:
+            process.wait(STOP_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            os.killpg(process.pid, signal.SIGKILL)
+            process.wait()
+    result["shutdown_s"] = round(time.monotonic() - stopped, 3)
+    total = result["total"]
+    log(f"   {total['throughput_rps']} req/s, p99 {total['latency_ms']['p99']}ms, "
+        f"errors {total['error_rate']:.2%}")
+    return result
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard's dev server against prefork mode")
+    parser.add_argument("--modes", default="dev,prefork", help="Comma-separated modes to run (default dev,prefork)")
+    parser.add_argument("--concurrency", type=int, default=64, help="Closed-loop clients (default 64)")
+    parser.add_argument("--duration", type=float, default=15, help="Seconds to measure per mode (default 15)")
+    parser.add_argument("--warmup", type=float, default=2, help="Seconds of unmeasured load first (default 2)")
+    parser.add_argument("--workers", type=int, default=4, help="Prefork worker processes (default 4)")
+    parser.add_argument("--threads", type=int, default=32, help="Threads per prefork worker (default 32)")
+    parser.add_argument("--output", help="Also write the JSON result here")
+    args = parser.parse_args(argv)
+    args.modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    unknown = [m for m in args.modes if m not in ("dev", "prefork")]
+    if unknown:
+        parser.error(f"unknown mode(s): {', '.join(unknown)}")
+    return args
+
+
+def main():
+    args = parse_args()
+    results = {mode: bench_mode(mode, args) for mode in args.modes}
+    output = {"concurrency": args.concurrency, "workers": args.workers, "threads": args.threads,
+              "results": results}
+    if "dev" in results and "prefork" in results:
+        dev, prefork = results["dev"]["total"], results["prefork"]["total"]
+        output["throughput_ratio"] = round(prefork["throughput_rps"] / dev["throughput_rps"], 2) \
+            if dev["throughput_rps"] else None
+        output["p99_ratio"] = round(prefork["latency_ms"]["p99"] / dev["latency_ms"]["p99"], 2) \
+            if dev["latency_ms"]["p99"] else None
+    text = json.dumps(output, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+CoastalWatch Fan-out Benchmark
+Measures alert:new broadcast latency as the number of Socket.io clients grows
+
+For each client count it connects that many WebSocket subscribers, POSTs
+alerts at a fixed rate and records, for every client, the time from the
+POST to receipt of the matching alert:new event. It reports the latency
+distribution, missed events and backend CPU for each step as JSON.
+
+    python bench/fanout.py --clients 100,1000,5000,10000 --alerts 20 --rate 2
+
+Subscribers speak the minimal Engine.IO v4 / Socket.IO v5 protocol over
+one shared aiohttp session. A full client per subscriber would make the
+benchmark itself the bottleneck well before 10,000 connections. The
+client's own CPU use is reported so a saturated client can be spotted.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import uuid
+
+import aiohttp
+
+from stats import LatencyRecorder
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+CONNECT_TIMEOUT = 30
+# How long to keep listening after the last POST before counting misses
+SETTLE_SECONDS = 5.0
+METRICS_URL = "http://127.0.0.1:9464/metrics"
+
+
+def log(message):
+    print(message, file=sys.stderr, flush=True)
+
+
+class Subscriber:
+    """One Socket.io client listening for alert:new"""
+
+    def __init__(self, bench):
+        self.bench = bench
+        self.ws = None
+        self.connected = asyncio.Event()
+        self.task = None
+
+    async def run(self, session, url):
+        try:
+            async with session.ws_connect(url, heartbeat=None, max_msg_size=0) as ws:
+                self.ws = ws
+                async for message in ws:
+                    if message.type != aiohttp.WSMsgType.TEXT:
+                        break
+                    await self.handle(message.data)
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+            self.bench.connect_errors[type(e).__name__] = self.bench.connect_errors.get(type(e).__name__, 0) + 1
+        finally:
+            self.connected.set()  # unblock waiters even on failure
+            self.ws = None
+
+    async def handle(self, data):
+        received = time.monotonic()
+        if data.startswith("0"):          # Engine.IO open
+            await self.ws.send_str("40")  # Socket.IO connect, default namespace
+        elif data == "2":                 # Engine.IO ping
+            await self.ws.send_str("3")
+        elif data.startswith("40"):       # Socket.IO connected
+            self.connected.set()
+        elif data.startswith("42"):       # Socket.IO event
+            name, *args = json.loads(data[2:])
+            if name == "alert:new" and args:
+                self.bench.received(args[0], received)
+
+
+class FanoutBenchmark:
+    """
+    Fan-out measurement against one backend
+
+    Args:
+        base_url: Backend URL (the proxy's :4000 when running replicas)
+        token: JWT allowed to create alerts
+        connect_rate: New connections opened per second
+    """
+
+    def __init__(self, base_url, token, connect_rate=500):
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self.connect_rate = connect_rate
+        self.run_id = uuid.uuid4().hex[:8]
+        self.sent = {}
+        self.recorder = None
+        self.counts = {}
+        self.connect_errors = {}
+
+    @property
+    def ws_url(self):
+        return self.base_url.replace("http", "ws", 1) + "/socket.io/?EIO=4&transport=websocket"
+
+    def received(self, alert, at):
+        sent = self.sent.get(alert.get("message"))
+        if sent is not None:
+            self.recorder.record(at - sent)
+            self.counts[alert["message"]] += 1
+
+    async def connect(self, session, count):
+        subscribers = [Subscriber(self) for _ in range(count)]
+        started = time.monotonic()
+        for i, subscriber in enumerate(subscribers):
+            subscriber.task = asyncio.ensure_future(subscriber.run(session, self.ws_url))
+            # Pace the handshakes so the connect phase isn't a thundering herd
+            delay = started + (i + 1) / self.connect_rate - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        try:
+            await asyncio.wait_for(asyncio.gather(*(s.connected.wait() for s in subscribers)),
+                                   CONNECT_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+        return subscribers, time.monotonic() - started
+
+    async def post_alerts(self, session, alerts, rate):
+        errors = 0
+        started = time.monotonic()
+        for i in range(alerts):
+            delay = started + i / rate - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            message = f"fanout-bench {self.run_id} #{i}"
+            self.counts[message] = 0
+            self.sent[message] = time.monotonic()
+            try:
+                async with session.post(
+                        f"{self.base_url}/api/alerts",
+                        json={"type": "Benchmark", "message": message, "severity": "low"},
+                        headers={"Authorization": f"Bearer {self.token}"}) as response:
+                    await response.read()
+                    if response.status != 201:
+                        errors += 1
+                        del self.sent[message], self.counts[message]
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                errors += 1
+                del self.sent[message], self.counts[message]
+        return errors
+
+    async def step(self, session, clients, alerts, rate, cpu):
+        """Run one client count; returns its result dict"""
+        self.recorder = LatencyRecorder()
+        self.sent, self.counts, self.connect_errors = {}, {}, {}
+        log(f"🔌 Connecting {clients} subscriber(s)...")
+        subscribers, connect_seconds = await self.connect(session, clients)
+        connected = sum(1 for s in subscribers if s.ws is not None)
+        log(f"   {connected}/{clients} connected in {connect_seconds:.2f}s; posting {alerts} alert(s) at {rate}/s")
+
+        cpu_before = time.process_time()
+        wall_before = time.monotonic()
+        await cpu.start()
+        post_errors = await self.post_alerts(session, alerts, rate)
+        deadline = time.monotonic() + SETTLE_SECONDS
+        expected = connected * len(self.sent)
+        while time.monotonic() < deadline and sum(self.counts.values()) < expected:
+            await asyncio.sleep(0.05)
+        server_cpu = await cpu.stop()
+        client_cpu = (time.process_time() - cpu_before) / (time.monotonic() - wall_before) * 100
+
+        for subscriber in subscribers:
+            if subscriber.ws is not None:
+                await subscriber.ws.close()
+        await asyncio.gather(*(s.task for s in subscribers), return_exceptions=True)
+
+        received = sum(self.counts.values())
+        summary = self.recorder.summary()
+        result = {
+            "clients": clients,
+            "connected": connected,
+            "connect_seconds": round(connect_seconds, 3),
+            "connect_errors": self.connect_errors,
+            "alerts_posted": len(self.sent),
+            "post_errors": post_errors,
+            "expected_events": expected,
+            "received_events": received,
+            "missed_events": expected - received,
+            "latency_ms": summary["latency_ms"],
+            "server_cpu_percent": server_cpu,
+            "client_cpu_percent": round(client_cpu, 1),
+        }
+        p99 = summary["latency_ms"]["p99"]
+        log(f"   p99 {p99}ms, {expected - received} missed, server CPU {server_cpu}")
+        return result
+
+
+class ServerCpu:
+    """
+    Backend CPU during a step
+
+    Reads /proc/<pid>/stat when --server-pid is given, otherwise the
+    orchestrator's metrics endpoint (summing backend and backend-N).
+    Returns None if neither is available.
+    """
+
+    def __init__(self, pid=None, metrics_url=METRICS_URL):
+        self.pid = pid
+        self.metrics_url = metrics_url
+        self.samples = []
+        self._task = None
+        self._start = None
+
+    def _ticks(self):
+        with open(f"/proc/{self.pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        return int(fields[11]) + int(fields[12])
+
+    async def _scrape(self):
+        async with aiohttp.ClientSession() as session:
+            while True:
+                try:
+                    async with session.get(self.metrics_url, timeout=aiohttp.ClientTimeout(total=2)) as response:
+                        text = await response.text()
+                    total = 0.0
+                    for line in text.splitlines():
+                        if line.startswith("coastalwatch_service_cpu_percent{") and 'service="backend' in line:
+                            total += float(line.rsplit(" ", 1)[1])
+                    self.samples.append(total)
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+                    pass
+                await asyncio.sleep(1)
+
+    async def start(self):
+        self.samples = []
+        if self.pid:
+            self._start = (time.monotonic(), self._ticks())
+        elif self.metrics_url:
+            self._task = asyncio.ensure_future(self._scrape())
+
+    async def stop(self):
+        if self.pid:
+            started, ticks = self._start
+            seconds = (self._ticks() - ticks) / os.sysconf("SC_CLK_TCK")
+            return {"mean": round(seconds / (time.monotonic() - started) * 100, 1)}
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        if not self.samples:
+            return None
+        return {"mean": round(sum(self.samples) / len(self.samples), 1), "max": round(max(self.samples), 1)}
+
+
+async def login(session, base_url, username, password):
+    async with session.post(f"{base_url}/api/auth/login",
+                            json={"username": username, "password": password}) as response:
+        body = await response.json()
+        if response.status != 200:
+            raise SystemExit(f"❌ Login as {username} failed: {body.get('message')}")
+        return body["token"]
+
+
+def raise_fd_limit(needed):
+    """Lift the soft open-files limit towards the hard limit for many sockets"""
+    if resource is None:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != resource.RLIM_INFINITY and soft < needed:
+        target = needed if hard == resource.RLIM_INFINITY else min(needed, hard)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+        if target < needed:
+            log(f"⚠️  Open-files limit is {hard}; expect connection errors above ~{hard - 100} clients")
+
+
+async def run(args):
+    raise_fd_limit(max(args.clients) + 256)
+    connector = aiohttp.TCPConnector(limit=0)
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=CONNECT_TIMEOUT)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        token = await login(session, args.url.rstrip("/"), args.username, args.password)
+        bench = FanoutBenchmark(args.url, token, connect_rate=args.connect_rate)
+        cpu = ServerCpu(pid=args.server_pid, metrics_url=None if args.no_metrics else args.metrics_url)
+        steps = []
+        for clients in args.clients:
+            steps.append(await bench.step(session, clients, args.alerts, args.rate, cpu))
+    return {"target": args.url, "alerts_per_step": args.alerts, "rate": args.rate, "steps": steps}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark alert:new fan-out latency against subscriber count")
+    parser.add_argument("--url", default="http://127.0.0.1:4000", help="Backend base URL")
+    parser.add_argument("--clients", default="100,1000",
+                        help="Comma-separated subscriber counts to step through (default 100,1000)")
+    parser.add_argument("--alerts", type=int, default=20, help="Alerts to POST per step (default 20)")
+    parser.add_argument("--rate", type=float, default=2.0, help="Alerts per second (default 2)")
+    parser.add_argument("--connect-rate", type=float, default=500, help="New connections per second (default 500)")
+    parser.add_argument("--username", default="admin", help="Admin or Researcher account (default: seeded admin)")
+    parser.add_argument("--password", default="admin123")
+    parser.add_argument("--server-pid", type=int, help="Backend node PID to read CPU from /proc")
+    parser.add_argument("--metrics-url", default=METRICS_URL,
+                        help="Orchestrator metrics endpoint used for backend CPU when --server-pid is not given")
+    parser.add_argument("--no-metrics", action="store_true", help="Don't report server CPU")
+    parser.add_argument("--output", help="Also write the JSON result here")
+    args = parser.parse_args(argv)
+    args.clients = [int(c) for c in args.clients.split(",") if c.strip()]
+    return args
+
+
+def main():
+    args = parse_args()
+    result = asyncio.run(run(args))
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+CoastalWatch Load Test
+Drives the backend read endpoints and reports throughput and latency as JSON
+
+Closed loop (default): --concurrency workers each send the next request as
+soon as the previous one completes.
+
+Open loop (--rate): requests start on a fixed schedule whether or not
+earlier ones have finished, and latency is measured from each request's
+scheduled start, so a stalled server shows up as queueing delay instead of
+silently lowering the request rate (coordinated omission).
+
+    python bench/loadtest.py --concurrency 32 --duration 30
+    python bench/loadtest.py --rate 500 --duration 30 --output after.json --baseline before.json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import sys
+import time
+
+import aiohttp
+
+from stats import LatencyRecorder, compare, load_json
+
+ENDPOINTS = {
+    "sensors": "/api/sensors",
+    "alerts": "/api/alerts",
+    "reports": "/api/reports",
+}
+REQUEST_TIMEOUT = 30
+
+
+class LoadTest:
+    """
+    One load-test run against a backend
+
+    Args:
+        base_url: Backend URL, e.g. http://127.0.0.1:4000
+        endpoints: Names from paths to hit, in round-robin order
+        duration: Seconds to measure (after warmup)
+        warmup: Seconds of load before measuring starts
+        paths: Mapping of endpoint name to path (default ENDPOINTS)
+    """
+
+    def __init__(self, base_url, endpoints, duration, warmup=0.0, paths=None):
+        self.base_url = base_url.rstrip("/")
+        self.paths = paths or ENDPOINTS
+        self.endpoints = endpoints
+        self.duration = duration
+        self.warmup = warmup
+        self.recorders = {name: LatencyRecorder() for name in endpoints}
+        self.dropped = 0
+        self._measure_from = None
+
+    async def request(self, session, name, scheduled):
+        """Issue one GET; latency counts from `scheduled`"""
+        error, status = False, None
+        try:
+            async with session.get(self.base_url + self.paths[name]) as response:
+                await response.read()
+                status = response.status
+                error = status >= 400
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+            error, status = True, type(e).__name__
+        finished = time.monotonic()
+        if scheduled >= self._measure_from:
+            self.recorders[name].record(finished - scheduled, status=status, error=error)
+
+    async def closed_loop(self, session, concurrency, deadline):
+        rotation = itertools.cycle(self.endpoints)
+
+        async def worker():
+            while time.monotonic() < deadline:
+                await self.request(session, next(rotation), time.monotonic())
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    async def open_loop(self, session, rate, max_in_flight, deadline):
+        rotation = itertools.cycle(self.endpoints)
+        interval = 1.0 / rate
+        in_flight = set()
+        scheduled = time.monotonic()
+        while scheduled < deadline:
+            delay = scheduled - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(in_flight) >= max_in_flight:
+                # The client itself is saturated; count it rather than stall the schedule
+                if scheduled >= self._measure_from:
+                    self.dropped += 1
+            else:
+                task = asyncio.ensure_future(self.request(session, next(rotation), scheduled))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            scheduled += interval
+        if in_flight:
+            await asyncio.wait(in_flight)
+
+    async def run(self, concurrency=None, rate=None, max_in_flight=1000):
+        limit = concurrency if rate is None else max_in_flight
+        connector = aiohttp.TCPConnector(limit=limit, keepalive_timeout=30)
+        timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            started = time.monotonic()
+            self._measure_from = started + self.warmup
+            deadline = self._measure_from + self.duration
+            if rate is None:
+                await self.closed_loop(session, concurrency, deadline)
+            else:
+                await self.open_loop(session, rate, max_in_flight, deadline)
+            elapsed = time.monotonic() - self._measure_from
+        return self.report(elapsed, concurrency=concurrency, rate=rate)
+
+    def report(self, elapsed, concurrency=None, rate=None):
+        total = LatencyRecorder()
+        for recorder in self.recorders.values():
+            total.merge(recorder)
+        totals = total.summary(elapsed)
+        result = {
+            "target": self.base_url,
+            "mode": "open" if rate else "closed",
+            "concurrency": concurrency,
+            "rate": rate,
+            "duration_s": round(elapsed, 3),
+            "total": totals,
+            "endpoints": {name: r.summary(elapsed) for name, r in self.recorders.items()},
+        }
+        if rate:
+            result["dropped"] = self.dropped
+            result["achieved_rate"] = round(totals["requests"] / elapsed, 2) if elapsed else 0
+        return result
+
+
+def check_baseline(result, baseline, tolerance):
+    """
+    Compare a result with an earlier one, overall and per endpoint
+
+    Throughput is only compared between two closed-loop runs.
+
+    Returns:
+        Dict mapping "total" or an endpoint name to its regressions
+    """
+    regressions = {}
+    closed = result["mode"] == baseline.get("mode") == "closed"
+    pairs = [("total", result["total"], baseline.get("total"))]
+    pairs += [(name, summary, baseline.get("endpoints", {}).get(name))
+              for name, summary in result["endpoints"].items()]
+    for name, current, before in pairs:
+        if before:
+            found = compare(current, before, tolerance, throughput=closed)
+            if found:
+                regressions[name] = found
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the CoastalWatch backend read endpoints")
+    parser.add_argument("--url", default="http://127.0.0.1:4000", help="Backend base URL")
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS),
+                        help=f"Comma-separated subset of {', '.join(ENDPOINTS)}")
+    parser.add_argument("--concurrency", type=int, default=16, help="Closed-loop workers (default 16)")
+    parser.add_argument("--rate", type=float, help="Open-loop request rate per second (overrides --concurrency)")
+    parser.add_argument("--max-in-flight", type=int, default=1000,
+                        help="Open-loop cap on outstanding requests; excess is counted as dropped")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to measure (default 30)")
+    parser.add_argument("--warmup", type=float, default=3, help="Seconds of unmeasured load first (default 3)")
+    parser.add_argument("--output", help="Also write the JSON result here")
+    parser.add_argument("--baseline", help="Earlier result to compare against; exit 1 on regression")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="Allowed relative regression against --baseline (default 0.10)")
+    args = parser.parse_args(argv)
+    args.endpoints = [e.strip() for e in args.endpoints.split(",") if e.strip()]
+    unknown = [e for e in args.endpoints if e not in ENDPOINTS]
+    if unknown:
+        parser.error(f"unknown endpoint(s): {', '.join(unknown)}")
+    return args
+
+
+def main():
+    args = parse_args()
+    test = LoadTest(args.url, args.endpoints, args.duration, warmup=args.warmup)
+    result = asyncio.run(test.run(
+        concurrency=None if args.rate else args.concurrency,
+        rate=args.rate,
+        max_in_flight=args.max_in_flight,
+    ))
+
+    exit_code = 0
+    if args.baseline:
+        regressions = check_baseline(result, load_json(args.baseline), args.tolerance)
+        result["baseline"] = {"file": args.baseline, "tolerance": args.tolerance, "regressions": regressions}
+        if regressions:
+            exit_code = 1
+            for name, found in regressions.items():
+                print(f"❌ {name}: {'; '.join(found)}", file=sys.stderr)
+
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    print(text)
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
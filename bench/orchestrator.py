@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+CoastalWatch Orchestrator Benchmark
+Times run_all.py startup and shutdown over repeated runs and tracks regressions
+
+Each run launches run_all.py and records, per service:
+  - spawn: launch until the orchestrator reports the service's PID
+  - healthy: launch until the service's health URL first answers
+
+It also records, per run:
+  - first_healthy / all_healthy: launch until the first / last service is healthy
+  - idle RSS and CPU of the orchestrator process over --idle seconds
+  - shutdown: SIGINT (Ctrl+C) until every service port can be bound again
+  - exit: SIGINT until run_all.py itself has exited
+
+The median of each metric across runs is appended as one JSON line to the
+history file (bench_output.txt by default). It is then compared with the
+median of the last --window entries recorded with the same options. The
+script exits 1 if any metric grew by more than --tolerance.
+
+    python bench/orchestrator.py --runs 5
+    python bench/orchestrator.py --runs 5 --prod --backend-replicas 2
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import signal
+import subprocess
+import sys
+import time
+
+import aiohttp
+
+from stats import percentile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import run_all
+
+HISTORY_FILE = os.path.join(ROOT, "bench_output.txt")
+POLL_INTERVAL = 0.02
+PROBE_TIMEOUT = 1.0
+# A metric must also grow by at least this much (by unit suffix) to count,
+# so sub-noise changes in fast metrics don't fail the run
+MIN_DELTA = {"_s": 0.05, "_bytes": 2 * 1024 * 1024, "_percent": 0.5}
+
+ANSI = re.compile(r"\x1b\[[0-9;]*m")
+STARTED = re.compile(r"✅ (.+) started \(PID: (\d+)\)")
+
+
+def log(message):
+    print(message, file=sys.stderr, flush=True)
+
+
+def process_stats(pid):
+    """Return (cpu_ticks, rss_bytes) for one process, or None if it is gone"""
+    stats = run_all.MetricsSampler._read_pid(pid)
+    return None if stats is None else (stats[0], stats[1])
+
+
+class OrchestratorRun:
+    """
+    One start → idle → Ctrl+C cycle of run_all.py
+
+    Args:
+        args: Extra run_all.py arguments
+        services: Services run_all.py will start (from run_all.build_services)
+        timeout: Seconds to wait for every service to become healthy
+        idle: Seconds to sample the orchestrator once everything is healthy
+        log_path: File receiving the orchestrator's output
+    """
+
+    def __init__(self, args, services, timeout, idle, log_path):
+        self.args = args
+        self.services = services
+        self.timeout = timeout
+        self.idle = idle
+        self.log_path = log_path
+        self.labels = {s.label: s.name for s in services}
+        self.process = None
+        self.launched = None
+        self.spawn = {}
+        self.healthy = {}
+
+    async def _read_output(self, log_file):
+        async for raw in self.process.stdout:
+            at = time.monotonic()
+            line = ANSI.sub("", raw.decode(errors="replace"))
+            log_file.write(line)
+            match = STARTED.search(line)
+            if match and match.group(1) in self.labels:
+                self.spawn.setdefault(self.labels[match.group(1)], at - self.launched)
+
+    async def _wait_healthy(self, session, service):
+        # Fixed short interval rather than backoff: the poll period bounds the error
+        url = service.health_url or service.url
+        while True:
+            try:
+                async with session.get(url, allow_redirects=False) as response:
+                    await response.read()
+                    if 200 <= response.status < 400:
+                        self.healthy[service.name] = time.monotonic() - self.launched
+                        return
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError):
+                pass
+            if self.process.returncode is not None:
+                return
+            await asyncio.sleep(POLL_INTERVAL)
+
+    async def _sample_idle(self):
+        pid = self.process.pid
+        before = process_stats(pid)
+        started = time.monotonic()
+        await asyncio.sleep(self.idle)
+        after = process_stats(pid)
+        if before is None or after is None:
+            return None, None
+        seconds = (after[0] - before[0]) / run_all.MetricsSampler.CLK_TCK
+        return after[1], seconds / (time.monotonic() - started) * 100
+
+    async def _shutdown(self):
+        ports = [s.port for s in self.services if s.port]
+        signalled = time.monotonic()
+        try:
+            os.killpg(self.process.pid, signal.SIGINT)
+        except ProcessLookupError:
+            pass
+        shutdown = exit_seconds = None
+        deadline = signalled + run_all.SHUTDOWN_TIMEOUT + run_all.SHUTDOWN_KILL_GRACE + 10
+        while time.monotonic() < deadline and (shutdown is None or exit_seconds is None):
+            now = time.monotonic()
+            if shutdown is None and all(run_all.port_is_free(p) for p in ports):
+                shutdown = now - signalled
+            if exit_seconds is None and self.process.returncode is not None:
+                exit_seconds = now - signalled
+            await asyncio.sleep(POLL_INTERVAL)
+        if self.process.returncode is None:
+            log("⚠️  run_all.py ignored Ctrl+C, killing it")
+            self.process.kill()
+            await self.process.wait()
+        return shutdown, exit_seconds
+
+    async def run(self):
+        env = dict(os.environ, PYTHONUNBUFFERED="1")
+        with open(self.log_path, "w") as log_file:
+            self.launched = time.monotonic()
+            self.process = await asyncio.create_subprocess_exec(
+                sys.executable, "run_all.py", *self.args, cwd=ROOT, env=env,
+                stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                # Own process group, like a shell job that Ctrl+C is delivered to
+                start_new_session=True,
+            )
+            reader = asyncio.ensure_future(self._read_output(log_file))
+            timeout = aiohttp.ClientTimeout(total=PROBE_TIMEOUT)
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                try:
+                    await asyncio.wait_for(
+                        asyncio.gather(*(self._wait_healthy(session, s) for s in self.services)),
+                        self.timeout)
+                except asyncio.TimeoutError:
+                    pass
+            complete = len(self.healthy) == len(self.services)
+            rss, cpu = await self._sample_idle() if complete else (None, None)
+            shutdown, exit_seconds = await self._shutdown()
+            await reader
+
+        return {
+            "complete": complete,
+            "spawn_s": {name: round(s, 3) for name, s in self.spawn.items()},
+            "healthy_s": {name: round(s, 3) for name, s in self.healthy.items()},
+            "first_healthy_s": round(min(self.healthy.values()), 3) if self.healthy else None,
+            "all_healthy_s": round(max(self.healthy.values()), 3) if complete else None,
+            "idle_rss_bytes": rss,
+            "idle_cpu_percent": None if cpu is None else round(cpu, 2),
+            "shutdown_s": None if shutdown is None else round(shutdown, 3),
+            "exit_s": None if exit_seconds is None else round(exit_seconds, 3),
+            "exit_code": self.process.returncode,
+        }
+
+
+def flatten(result):
+    """Turn one run's result into {metric: value}, e.g. healthy_s.backend"""
+    metrics = {}
+    for key, value in result.items():
+        if isinstance(value, dict):
+            for name, v in value.items():
+                metrics[f"{key}.{name}"] = v
+        elif key.endswith(tuple(MIN_DELTA)) and value is not None:
+            metrics[key] = value
+    return metrics
+
+
+def medians(rows):
+    """Per-metric median across a list of {metric: value} dicts"""
+    values = {}
+    for row in rows:
+        for key, value in row.items():
+            if value is not None:
+                values.setdefault(key, []).append(value)
+    return {key: percentile(sorted(v), 50) for key, v in sorted(values.items())}
+
+
+def load_history(path):
+    entries = []
+    try:
+        with open(path) as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue  # stray text from an older bench_output.txt
+    except OSError:
+        pass
+    return entries
+
+
+def find_regressions(current, baseline, tolerance):
+    """
+    Compare metric medians with a baseline
+
+    Every metric here is lower-is-better. A metric regresses when it grows
+    by more than tolerance (a fraction) and by more than its MIN_DELTA.
+
+    Returns:
+        List of human-readable regression descriptions (empty if none)
+    """
+    regressions = []
+    for key, now in current.items():
+        before = baseline.get(key)
+        if before is None:
+            continue
+        slack = next(v for suffix, v in MIN_DELTA.items() if key.split(".")[0].endswith(suffix))
+        if now > before * (1 + tolerance) and now - before > slack:
+            regressions.append(f"{key} {before:g} → {now:g}")
+    return regressions
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def wait_ports_free(services, timeout=30):
+    deadline = time.monotonic() + timeout
+    busy = [s.port for s in services if s.port]
+    while time.monotonic() < deadline:
+        busy = [p for p in busy if not run_all.port_is_free(p)]
+        if not busy:
+            return []
+        time.sleep(0.1)
+    return busy
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark run_all.py startup and shutdown")
+    parser.add_argument("--runs", type=int, default=5, help="Start/stop cycles (default 5)")
+    parser.add_argument("--prod", action="store_true", help="Pass --prod to run_all.py")
+    parser.add_argument("--backend-replicas", type=int, metavar="N", help="Pass --backend-replicas N to run_all.py")
+    parser.add_argument("--timeout", type=float, default=120, help="Seconds to wait for all services per run")
+    parser.add_argument("--idle", type=float, default=5, help="Seconds to sample the idle orchestrator (default 5)")
+    parser.add_argument("--history", default=HISTORY_FILE, help="JSON-lines history file (default bench_output.txt)")
+    parser.add_argument("--window", type=int, default=5,
+                        help="Compare against the median of this many earlier entries (default 5)")
+    parser.add_argument("--tolerance", type=float, default=0.20,
+                        help="Allowed relative regression against the history (default 0.20)")
+    parser.add_argument("--no-record", action="store_true", help="Compare only; don't append to the history")
+    parser.add_argument("--output", help="Also write the JSON result here")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    run_args = []
+    if args.prod:
+        run_args.append("--prod")
+    if args.backend_replicas:
+        run_args += ["--backend-replicas", str(args.backend_replicas)]
+    services = run_all.build_services(prod=args.prod, backend_replicas=args.backend_replicas)
+    log_path = os.path.join(ROOT, run_all.STATE_DIR, "bench-orchestrator.log")
+    os.makedirs(os.path.dirname(log_path), exist_ok=True)
+
+    runs = []
+    for i in range(args.runs):
+        busy = wait_ports_free(services)
+        if busy:
+            sys.exit(f"❌ Ports still in use: {', '.join(map(str, busy))} (is the stack already running?)")
+        log(f"⏱️  Run {i + 1}/{args.runs}...")
+        result = asyncio.run(OrchestratorRun(run_args, services, args.timeout, args.idle, log_path).run())
+        runs.append(result)
+        if not result["complete"]:
+            missing = [s.name for s in services if s.name not in result["healthy_s"]]
+            log(f"❌ Not healthy within {args.timeout:g}s: {', '.join(missing)} (see {log_path})")
+            break
+        log(f"   all healthy {result['all_healthy_s']:.2f}s, shutdown {result['shutdown_s']}s")
+
+    config = {"mode": "prod" if args.prod else "dev", "backend_replicas": args.backend_replicas}
+    entry = {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "revision": git_revision(),
+        "config": config,
+        "runs": len(runs),
+        "metrics": medians([flatten(r) for r in runs]),
+    }
+    complete = all(r["complete"] for r in runs)
+    earlier = [e for e in load_history(args.history) if e.get("config") == config][-args.window:]
+    regressions = []
+    if complete and earlier:
+        baseline = medians([e["metrics"] for e in earlier])
+        regressions = find_regressions(entry["metrics"], baseline, args.tolerance)
+        entry["baseline"] = {"entries": len(earlier), "tolerance": args.tolerance, "regressions": regressions}
+    if complete and not args.no_record:
+        with open(args.history, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    text = json.dumps(dict(entry, details=runs), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    print(text)
+    for regression in regressions:
+        log(f"❌ {regression}")
+    sys.exit(0 if complete and not regressions else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+CoastalWatch Live Traffic Simulator
+Replays the shape of live load: many stations reporting on a fixed period
+while alerts fire and dashboards listen
+
+Every virtual Station-N sends one reading to POST /api/sensors/bulk each
+--period seconds. The stations are spread evenly across the period, so
+the backend sees a steady stream of stations / period writes per second.
+Alerts are POSTed at --alert-rate. --dashboards Socket.io clients stay
+connected throughout and time how long each alert takes to reach them.
+
+Requests start on their schedule whether or not earlier ones have
+finished (open loop). Latency is measured from each request's scheduled
+start, so a slow backend shows up as latency rather than as a quietly
+lower rate (coordinated omission). The report compares achieved with
+target rates and gives end-to-end write latency percentiles. It also
+gives the scheduler's own lag; if that grows, the simulator is the
+bottleneck rather than the backend.
+
+    python bench/simulate.py --stations 5000 --period 5 --duration 60
+    python bench/simulate.py --stations 1000 --alert-rate 2 --dashboards 200 --output live.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+
+import aiohttp
+
+from fanout import Subscriber, login, raise_fd_limit
+from stats import LatencyRecorder
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "tools"))
+
+from generate import Station, season_offset  # noqa: E402
+
+REQUEST_TIMEOUT = 30
+CONNECT_TIMEOUT = 30
+CONNECT_RATE = 500
+# How long to keep listening after the last alert before counting misses
+SETTLE_SECONDS = 5.0
+SEVERITIES = ("low", "medium", "high", "critical")
+
+
+def log(message):
+    print(message, file=sys.stderr, flush=True)
+
+
+class Simulator:
+    """
+    One simulation run against a backend
+
+    Args:
+        base_url: Backend URL (the proxy's :4000 when running replicas)
+        token: JWT for an Admin or Researcher
+        stations: Number of virtual stations
+        period: Seconds between each station's readings
+        alert_rate: Alerts per second (0 for none)
+        max_in_flight: Cap on outstanding requests; excess is counted as dropped
+        seed: Seed for the stations' readings
+    """
+
+    def __init__(self, base_url, token, stations, period, alert_rate=0.0, max_in_flight=1000, seed=42):
+        self.base_url = base_url.rstrip("/")
+        self.headers = {"Authorization": f"Bearer {token}"}
+        self.stations = [Station(i, seed) for i in range(stations)]
+        self.period = period
+        self.alert_rate = alert_rate
+        self.max_in_flight = max_in_flight
+        self.run_id = uuid.uuid4().hex[:8]
+        self.readings = LatencyRecorder()
+        self.alerts = LatencyRecorder()
+        self.delivery = LatencyRecorder()
+        self.lag = LatencyRecorder()
+        self.scheduled = {"readings": 0, "alerts": 0}
+        self.dropped = {"readings": 0, "alerts": 0}
+        self.in_flight = set()
+        self.alert_scheduled = {}
+        self.delivered = 0
+        self.connect_errors = {}
+        self._measure_from = None
+
+    @property
+    def ws_url(self):
+        return self.base_url.replace("http", "ws", 1) + "/socket.io/?EIO=4&transport=websocket"
+
+    def received(self, alert, at):
+        """Called by each dashboard Subscriber for every alert:new"""
+        scheduled = self.alert_scheduled.get(alert.get("message"))
+        if scheduled is not None:
+            self.delivery.record(at - scheduled)
+            self.delivered += 1
+
+    async def post(self, session, recorder, scheduled, url, **kwargs):
+        """Issue one write; latency counts from `scheduled`"""
+        error, status = False, None
+        try:
+            async with session.post(url, **kwargs) as response:
+                await response.read()
+                status = response.status
+                error = status >= 400
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+            error, status = True, type(e).__name__
+        if scheduled >= self._measure_from:
+            recorder.record(time.monotonic() - scheduled, status=status, error=error)
+
+    def reading(self, station, scheduled):
+        """Station's next reading as a one-line NDJSON body"""
+        # Readings follow the wall clock so timestamps and tide phases are real
+        now = time.time() + scheduled - time.monotonic()
+        season = season_offset(datetime.fromtimestamp(now, timezone.utc))
+        water, wind, temperature = station.read(now, self.period / 3600, season, 0, 0)
+        return json.dumps({"location": station.name, "water_level": water, "wind_speed": wind,
+                           "temperature": temperature}).encode() + b"\n"
+
+    def launch(self, kind, scheduled, coroutine_factory):
+        measured = scheduled >= self._measure_from
+        if measured:
+            self.scheduled[kind] += 1
+            self.lag.record(max(time.monotonic() - scheduled, 0))
+        if len(self.in_flight) >= self.max_in_flight:
+            # The client itself is saturated; count it rather than stall the schedule
+            if measured:
+                self.dropped[kind] += 1
+            return
+        task = asyncio.ensure_future(coroutine_factory())
+        self.in_flight.add(task)
+        task.add_done_callback(self.in_flight.discard)
+
+    async def schedule_readings(self, session, started, deadline):
+        url = f"{self.base_url}/api/sensors/bulk"
+        headers = dict(self.headers, **{"Content-Type": "application/x-ndjson"})
+        interval = self.period / len(self.stations)
+        n = 0
+        while True:
+            scheduled = started + n * interval
+            if scheduled >= deadline:
+                return
+            delay = scheduled - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            station = self.stations[n % len(self.stations)]
+            self.launch("readings", scheduled, lambda: self.post(
+                session, self.readings, scheduled, url, data=self.reading(station, scheduled), headers=headers))
+            n += 1
+
+    async def schedule_alerts(self, session, started, deadline):
+        if not self.alert_rate:
+            return
+        url = f"{self.base_url}/api/alerts"
+        n = 0
+        while True:
+            scheduled = started + n / self.alert_rate
+            if scheduled >= deadline:
+                return
+            delay = scheduled - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            station = self.stations[n % len(self.stations)]
+            message = f"simulate {self.run_id} #{n}: threshold crossed at {station.name}"
+            body = {"type": "Simulation", "message": message, "severity": SEVERITIES[n % len(SEVERITIES)]}
+            if scheduled >= self._measure_from:
+                self.alert_scheduled[message] = scheduled
+            self.launch("alerts", scheduled, lambda: self.post(session, self.alerts, scheduled, url, json=body, headers=self.headers))
+            n += 1
+
+    async def connect_dashboards(self, session, count):
+        subscribers = [Subscriber(self) for _ in range(count)]
+        started = time.monotonic()
+        for i, subscriber in enumerate(subscribers):
+            subscriber.task = asyncio.ensure_future(subscriber.run(session, self.ws_url))
+            delay = started + (i + 1) / CONNECT_RATE - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        try:
+            await asyncio.wait_for(asyncio.gather(*(s.connected.wait() for s in subscribers)), CONNECT_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+        return subscribers
+
+    async def run(self, duration, warmup=0.0, dashboards=0):
+        connector = aiohttp.TCPConnector(limit=self.max_in_flight + dashboards, keepalive_timeout=30)
+        timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            subscribers = []
+            if dashboards:
+                log(f"🔌 Connecting {dashboards} dashboard client(s)...")
+                subscribers = await self.connect_dashboards(session, dashboards)
+            connected = sum(1 for s in subscribers if s.ws is not None)
+
+            log(f"🛰️  {len(self.stations)} station(s) every {self.period:g}s, {self.alert_rate:g} alert(s)/s "
+                f"for {warmup:g}s warmup + {duration:g}s...")
+            cpu_before = time.process_time()
+            started = time.monotonic()
+            self._measure_from = started + warmup
+            deadline = self._measure_from + duration
+            await asyncio.gather(self.schedule_readings(session, started, deadline),
+                                 self.schedule_alerts(session, started, deadline))
+            if self.in_flight:
+                await asyncio.wait(set(self.in_flight))
+            elapsed = time.monotonic() - self._measure_from
+            client_cpu = (time.process_time() - cpu_before) / (time.monotonic() - started) * 100
+
+            expected = connected * self.alerts.statuses.get("201", 0)
+            settle = time.monotonic() + SETTLE_SECONDS
+            while subscribers and self.delivered < expected and time.monotonic() < settle:
+                await asyncio.sleep(0.05)
+            for subscriber in subscribers:
+                if subscriber.ws is not None:
+                    await subscriber.ws.close()
+            await asyncio.gather(*(s.task for s in subscribers), return_exceptions=True)
+        return self.report(elapsed, duration, connected, expected, client_cpu)
+
+    def report(self, elapsed, duration, connected, expected, client_cpu):
+        def rates(kind, recorder, target):
+            summary = recorder.summary(elapsed)
+            succeeded = summary["requests"] - summary["errors"]
+            return dict(summary, target_rate=round(target, 2), achieved_rate=round(succeeded / duration, 2),
+                        scheduled=self.scheduled[kind], dropped=self.dropped[kind])
+
+        result = {
+            "target": self.base_url,
+            "stations": len(self.stations),
+            "period_s": self.period,
+            "duration_s": round(elapsed, 3),
+            "readings": rates("readings", self.readings, len(self.stations) / self.period),
+            "alerts": rates("alerts", self.alerts, self.alert_rate),
+            "schedule_lag_ms": self.lag.summary()["latency_ms"],
+            "client_cpu_percent": round(client_cpu, 1),
+        }
+        if connected or self.connect_errors:
+            result["dashboards"] = {
+                "connected": connected,
+                "connect_errors": self.connect_errors,
+                "expected_events": expected,
+                "received_events": self.delivered,
+                "missed_events": expected - self.delivered,
+                "delivery_latency_ms": self.delivery.summary()["latency_ms"],
+            }
+        return result
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate live station, alert and dashboard traffic")
+    parser.add_argument("--url", default="http://127.0.0.1:4000", help="Backend base URL")
+    parser.add_argument("--stations", type=int, default=1000, help="Virtual stations (default 1000)")
+    parser.add_argument("--period", type=float, default=5, help="Seconds between each station's readings (default 5)")
+    parser.add_argument("--alert-rate", type=float, default=0.5, help="Alerts per second (default 0.5; 0 for none)")
+    parser.add_argument("--dashboards", type=int, default=0, help="Socket.io clients listening for alerts")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds to measure (default 60)")
+    parser.add_argument("--warmup", type=float, default=5, help="Seconds of unmeasured load first (default 5)")
+    parser.add_argument("--max-in-flight", type=int, default=1000,
+                        help="Cap on outstanding requests; excess is counted as dropped (default 1000)")
+    parser.add_argument("--seed", default="42", help="Seed for the stations' readings (default 42)")
+    parser.add_argument("--username", default="research", help="Admin or Researcher account (default: seeded researcher)")
+    parser.add_argument("--password", default="research123")
+    parser.add_argument("--output", help="Also write the JSON result here")
+    args = parser.parse_args(argv)
+    if args.stations < 1 or args.period <= 0 or args.duration <= 0 or args.alert_rate < 0:
+        parser.error("--stations, --period and --duration must be positive and --alert-rate not negative")
+    return args
+
+
+async def run(args):
+    raise_fd_limit(args.max_in_flight + args.dashboards + 256)
+    async with aiohttp.ClientSession() as session:
+        token = await login(session, args.url.rstrip("/"), args.username, args.password)
+    simulator = Simulator(args.url, token, args.stations, args.period, args.alert_rate,
+                          args.max_in_flight, args.seed)
+    return await simulator.run(args.duration, args.warmup, args.dashboards)
+
+
+def main():
+    args = parse_args()
+    result = asyncio.run(run(args))
+    readings = result["readings"]
+    log(f"   readings {readings['achieved_rate']}/{readings['target_rate']} per s, "
+        f"p99 {readings['latency_ms']['p99']}ms, errors {readings['error_rate']:.2%}")
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
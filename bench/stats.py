@@ -0,0 +1,105 @@
+"""
+Shared helpers for the CoastalWatch benchmarks: latency summaries and
+baseline comparison
+"""
+
+import json
+import math
+
+# Error rate may rise by this much (absolute) before it counts as a regression
+ERROR_RATE_SLACK = 0.001
+
+
+def percentile(ordered, q):
+    """Nearest-rank percentile of an already sorted list (q in 0..100)"""
+    if not ordered:
+        return None
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class LatencyRecorder:
+    """Collect latencies (seconds) and errors for one named operation"""
+
+    def __init__(self):
+        self.latencies = []
+        self.errors = 0
+        self.statuses = {}
+
+    def record(self, seconds, status=None, error=False):
+        self.latencies.append(seconds)
+        if status is not None:
+            self.statuses[str(status)] = self.statuses.get(str(status), 0) + 1
+        if error:
+            self.errors += 1
+
+    def merge(self, other):
+        self.latencies.extend(other.latencies)
+        self.errors += other.errors
+        for status, count in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + count
+
+    def summary(self, elapsed=None):
+        """
+        Summarise what was recorded
+
+        Args:
+            elapsed: Wall-clock seconds the measurement ran, for throughput
+
+        Returns:
+            Dict with count, error rate, throughput and latency percentiles in ms
+        """
+        ordered = sorted(self.latencies)
+        count = len(ordered)
+
+        def ms(value):
+            return None if value is None else round(value * 1000, 3)
+
+        result = {
+            "requests": count,
+            "errors": self.errors,
+            "error_rate": round(self.errors / count, 6) if count else 0.0,
+            "latency_ms": {
+                "mean": ms(sum(ordered) / count) if count else None,
+                "p50": ms(percentile(ordered, 50)),
+                "p95": ms(percentile(ordered, 95)),
+                "p99": ms(percentile(ordered, 99)),
+                "max": ms(ordered[-1]) if ordered else None,
+            },
+        }
+        if elapsed:
+            result["throughput_rps"] = round(count / elapsed, 2)
+        if self.statuses:
+            result["statuses"] = dict(sorted(self.statuses.items()))
+        return result
+
+
+def load_json(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(current, baseline, tolerance, throughput=True):
+    """
+    Compare two summaries produced by LatencyRecorder.summary
+
+    A metric regresses when p95/p99 latency grows or throughput drops by
+    more than tolerance (a fraction, e.g. 0.1), or the error rate rises by
+    more than ERROR_RATE_SLACK. Pass throughput=False when the request
+    rate was fixed by the client (open loop), since throughput then only
+    reflects the configured rate.
+
+    Returns:
+        List of human-readable regression descriptions (empty if none)
+    """
+    regressions = []
+    for key in ("p95", "p99"):
+        now, before = current["latency_ms"].get(key), baseline["latency_ms"].get(key)
+        if now is not None and before and now > before * (1 + tolerance):
+            regressions.append(f"{key} {before:.1f}ms → {now:.1f}ms")
+    now, before = current.get("throughput_rps"), baseline.get("throughput_rps")
+    if throughput and now is not None and before and now < before * (1 - tolerance):
+        regressions.append(f"throughput {before:.0f} → {now:.0f} req/s")
+    if current["error_rate"] > baseline["error_rate"] + ERROR_RATE_SLACK:
+        regressions.append(f"error rate {baseline['error_rate']:.2%} → {current['error_rate']:.2%}")
+    return regressions
@@ -0,0 +1,1198 @@
+#!/usr/bin/env python3
+"""
+CoastalWatch Dashboard
+Central page linking to every service, with live status from a background poller
+
+Pages never probe the services themselves. A poller thread per service
+checks its health URL every POLL_INTERVAL seconds over a kept-alive
+connection, and the results are held in memory. Page renders and
+/status.json read that cache, so a slow or hung upstream delays nothing
+but its own next probe.
+
+Open pages keep one Server-Sent Events connection to /events. It carries
+each probe result and every alert:new from the backend. The dashboard
+holds a single Socket.io subscription to the backend however many
+browsers are watching.
+
+`python app.py` runs Flask's development server. `python app.py --prefork`
+runs a gunicorn prefork pool instead: a master process owns the listening
+socket and forks workers that share it. Each worker serves requests on a
+thread pool and is replaced after --max-requests requests. The poller and
+the Socket.io subscription then run once, in a collector process the
+master starts; workers mirror its results and sum their /metrics
+counters through it.
+
+The page is rendered only when what it shows changes: a service's state
+or the recent alerts. Until then the cached HTML and its gzip/brotli
+variants are reused, with a strong ETag so revisits get 304s. Files
+under static/ are served from memory under fingerprinted URLs with
+far-future cache headers. /metrics reports response sizes and handling
+times per route.
+"""
+
+import argparse
+import gzip
+import hashlib
+import http.client
+import itertools
+import json
+import mimetypes
+import os
+import queue
+import shutil
+import socket
+import socketserver
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+from flask import Flask, Response, abort, g, jsonify, render_template, request
+
+# Encoding negotiation and cache policies are shared with the frontend's static server
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from static_server import (  # noqa: E402
+    COMPRESSIBLE_TYPES, IMMUTABLE_CACHE, MIN_COMPRESS_SIZE, REVALIDATE_CACHE, accepted_encodings, brotli,
+)
+
+try:
+    import socketio
+except ImportError:  # python-socketio is optional; /events then carries status only
+    socketio = None
+
+try:
+    from gunicorn.app.base import BaseApplication
+except ImportError:  # gunicorn is optional (and Unix only); --prefork then falls back
+    BaseApplication = None
+
+POLL_INTERVAL = 2.0
+PROBE_TIMEOUT = 2.0
+# Results older than this many intervals are shown as "unknown"; the poller
+# for that service is stuck or dead, so the last answer can't be trusted
+STALE_INTERVALS = 3
+
+BACKEND_URL = "http://127.0.0.1:4000"
+# Comment line sent on idle /events streams so proxies keep them open and
+# closed browsers are noticed
+SSE_HEARTBEAT = 15.0
+# Events buffered per browser; one that falls this far behind is disconnected
+# and catches up from a fresh snapshot when EventSource reconnects
+SSE_QUEUE_SIZE = 256
+RECENT_ALERTS = 20
+ALERT_RECONNECT_MAX = 30.0
+
+# Prefork defaults. Every open /events stream holds a worker thread, so
+# threads matter more than workers for a control room of screens.
+PREFORK_WORKERS = min(os.cpu_count() or 1, 4)
+PREFORK_THREADS = 32
+MAX_REQUESTS = 10000
+MAX_REQUESTS_JITTER = 1000
+KEEPALIVE = 5
+# Below run_all.py's 5s SIGTERM grace: open event streams are cut rather than
+# waited for, and EventSource reconnects to another worker
+GRACEFUL_TIMEOUT = 3
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+# Histogram buckets for /metrics
+RESPONSE_BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+RESPONSE_SECONDS_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+# Prefork workers share one status poller and alert feed in a collector
+# process; each reports its request counters to it this often
+COLLECTOR_REPORT_INTERVAL = 1.0
+# A worker that takes longer than this to accept an update is dropped
+COLLECTOR_SEND_TIMEOUT = 5.0
+COLLECTOR_RECONNECT_MAX = 1.0
+
+ONLINE = "online"
+OFFLINE = "offline"
+UNKNOWN = "unknown"
+# What a probe result holds, as relayed from the collector
+RESULT_FIELDS = ("state", "http_status", "latency_ms", "error", "checked_at")
+
+
+class Service:
+    """
+    A service card on the dashboard
+
+    Args:
+        name: Short identifier used in /status.json
+        label: Card title
+        url: Link opened by the card's launch button
+        health_url: URL probed for status (defaults to url)
+        icon: Emoji shown on the card
+        description: One line under the title
+    """
+
+    def __init__(self, name, label, url, health_url=None, icon="", description=""):
+        self.name = name
+        self.label = label
+        self.url = url
+        self.health_url = health_url or url
+        self.icon = icon
+        self.description = description
+
+
+SERVICES = [
+    Service(
+        "frontend", "CoastalWatch Frontend", "http://127.0.0.1:5173",
+        icon="🌊", description="Report hazards and follow live alerts on the map",
+    ),
+    Service(
+        "backend", "Backend API", "http://127.0.0.1:4000",
+        health_url="http://127.0.0.1:4000/health",
+        icon="⚙️", description="REST API, Socket.io and the MongoDB connection",
+    ),
+]
+
+
+class Probe:
+    """
+    Health check for one service over a persistent HTTP connection
+
+    The connection is reused between checks and reopened after any error,
+    so a steady poll costs one request rather than a TCP handshake each time.
+    """
+
+    def __init__(self, url, timeout=PROBE_TIMEOUT):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        self.connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self.timeout = timeout
+        self.connection = None
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def _request(self):
+        if self.connection is None:
+            self.connection = self.connection_class(self.host, self.port, timeout=self.timeout)
+        self.connection.request("GET", self.path)
+        response = self.connection.getresponse()
+        response.read()
+        if response.will_close:
+            self.close()
+        return response.status
+
+    def check(self):
+        """
+        Probe once
+
+        Returns:
+            Tuple of (HTTP status or None, latency in seconds, error message or None)
+        """
+        reused = self.connection is not None
+        started = time.monotonic()
+        try:
+            try:
+                status = self._request()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                if not reused:
+                    raise
+                # The server dropped an idle kept-alive connection; retry on a fresh one
+                self.close()
+                started = time.monotonic()
+                status = self._request()
+        except (OSError, http.client.HTTPException) as e:
+            self.close()
+            return None, time.monotonic() - started, str(e) or type(e).__name__
+        return status, time.monotonic() - started, None
+
+
+class StatusPoller:
+    """
+    Keep every service's latest health result in memory
+
+    Args:
+        services: Services to probe
+        interval: Seconds between probes of each service
+        timeout: Per-probe timeout
+        ttl: Seconds after which a result is reported as unknown
+             (default STALE_INTERVALS * interval)
+    """
+
+    def __init__(self, services, interval=POLL_INTERVAL, timeout=PROBE_TIMEOUT, ttl=None):
+        self.services = services
+        self.interval = interval
+        self.timeout = timeout
+        self.ttl = ttl if ttl is not None else STALE_INTERVALS * interval
+        self._results = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads = []
+        self._listeners = []
+
+    def add_listener(self, callback):
+        """Call callback(update) from the poller thread after every probe"""
+        self._listeners.append(callback)
+
+    def start(self):
+        for service in self.services:
+            thread = threading.Thread(target=self._run, args=(service,),
+                                      name=f"status-{service.name}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self):
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def _run(self, service):
+        # One thread per service so a hung upstream only delays its own result
+        probe = Probe(service.health_url, self.timeout)
+        try:
+            while not self._stop.is_set():
+                self.record(service, *probe.check())
+                self._stop.wait(self.interval)
+        finally:
+            probe.close()
+
+    def record(self, service, status, latency, error):
+        self.store(service.name, {
+            "state": ONLINE if status is not None and 200 <= status < 400 else OFFLINE,
+            "http_status": status,
+            "latency_ms": round(latency * 1000, 1),
+            "error": error or (None if status is None or status < 400 else f"HTTP {status}"),
+            "checked_at": time.time(),
+        })
+
+    def store(self, name, result, age=0.0):
+        """
+        Keep a probe result and tell the listeners
+
+        Args:
+            name: Service name
+            result: state, http_status, latency_ms, error and checked_at
+            age: Seconds since the probe ran (for results relayed from
+                another process)
+        """
+        result = dict(result, _monotonic=time.monotonic() - age)
+        with self._lock:
+            self._results[name] = result
+        update = {"name": name, "age_s": round(age, 3)}
+        update.update({k: v for k, v in result.items() if not k.startswith("_")})
+        for callback in self._listeners:
+            callback(update)
+
+    def snapshot(self):
+        """
+        Current status of every service, straight from memory
+
+        Returns:
+            List of dicts in service order: name, label, url, health_url,
+            icon, description, state, http_status, latency_ms, error,
+            checked_at (epoch seconds) and age_s
+        """
+        now = time.monotonic()
+        with self._lock:
+            results = dict(self._results)
+        snapshot = []
+        for service in self.services:
+            entry = {
+                "name": service.name,
+                "label": service.label,
+                "url": service.url,
+                "health_url": service.health_url,
+                "icon": service.icon,
+                "description": service.description,
+                "state": UNKNOWN,
+                "http_status": None,
+                "latency_ms": None,
+                "error": None,
+                "checked_at": None,
+                "age_s": None,
+            }
+            result = results.get(service.name)
+            if result is not None:
+                entry.update({k: v for k, v in result.items() if not k.startswith("_")})
+                entry["age_s"] = round(now - result["_monotonic"], 3)
+                if entry["age_s"] > self.ttl:
+                    entry["state"] = UNKNOWN
+                    entry["error"] = f"no result for {entry['age_s']:.0f}s"
+            snapshot.append(entry)
+        return snapshot
+
+
+class Subscriber:
+    """One browser's queue of pending SSE frames"""
+
+    def __init__(self, size):
+        self.queue = queue.Queue(size)
+        self.dropped = False
+
+
+class EventHub:
+    """
+    Fan Server-Sent Events out to every connected browser
+
+    Each event is serialised once, and the encoded frame is put on every
+    subscriber's bounded queue. Publishing never blocks: a subscriber
+    whose queue is full is dropped and its stream ends.
+
+    Args:
+        queue_size: Frames buffered per subscriber
+        heartbeat: Seconds of silence before a keep-alive comment is sent
+    """
+
+    def __init__(self, queue_size=SSE_QUEUE_SIZE, heartbeat=SSE_HEARTBEAT):
+        self.queue_size = queue_size
+        self.heartbeat = heartbeat
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self.published = 0
+        self.dropped = 0
+
+    @property
+    def subscribers(self):
+        return len(self._subscribers)
+
+    def frame(self, event, data):
+        payload = json.dumps(data, separators=(",", ":"))
+        return f"id: {next(self._ids)}\nevent: {event}\ndata: {payload}\n\n".encode()
+
+    def subscribe(self):
+        subscriber = Subscriber(self.queue_size)
+        with self._lock:
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def publish(self, event, data):
+        frame = self.frame(event, data)
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.queue.put_nowait(frame)
+            except queue.Full:
+                subscriber.dropped = True
+                self.unsubscribe(subscriber)
+                self.dropped += 1
+        self.published += 1
+
+    def stream(self, subscriber, initial=()):
+        """
+        Generate one browser's response body
+
+        Args:
+            subscriber: From subscribe(); unsubscribed when the stream ends
+            initial: Frames sent before any live events
+        """
+        try:
+            yield b"retry: 3000\n\n"
+            yield from initial
+            while not subscriber.dropped:
+                try:
+                    yield subscriber.queue.get(timeout=self.heartbeat)
+                except queue.Empty:
+                    # Also how a closed browser is noticed: the write fails
+                    yield b": ping\n\n"
+        finally:
+            self.unsubscribe(subscriber)
+
+
+class AlertFeed:
+    """
+    The dashboard's single Socket.io subscription to alert:new
+
+    Keeps the most recent alerts for new viewers and publishes each new
+    one to the hub. Reconnects with backoff while the backend is down.
+
+    Args:
+        backend_url: Backend base URL
+        hub: EventHub receiving "alert" events
+        keep: Number of recent alerts kept for new viewers
+    """
+
+    def __init__(self, backend_url, hub, keep=RECENT_ALERTS):
+        self.backend_url = backend_url
+        self.hub = hub
+        self.recent = deque(maxlen=keep)
+        self.connected = False
+        self._client = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def available():
+        return socketio is not None
+
+    def start(self):
+        if not self.available():
+            print("⚠️  python-socketio is not installed; live alerts disabled", flush=True)
+            return self
+        self._thread = threading.Thread(target=self._run, name="alert-feed", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._client is not None:
+            self._client.disconnect()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _on_alert(self, alert):
+        self.recent.appendleft(alert)
+        self.hub.publish("alert", alert)
+
+    def _run(self):
+        delay = 0.5
+        while not self._stop.is_set():
+            client = socketio.Client(reconnection=False)
+            client.on("alert:new", self._on_alert)
+            self._client = client
+            try:
+                client.connect(self.backend_url, wait_timeout=PROBE_TIMEOUT * 5)
+                self.connected = True
+                delay = 0.5
+                client.wait()  # returns when the connection drops
+            except socketio.exceptions.ConnectionError:
+                pass
+            finally:
+                self.connected = False
+                self._client = None
+            self._stop.wait(delay)
+            delay = min(delay * 2, ALERT_RECONNECT_MAX)
+
+
+class Encoded:
+    """
+    A response body with its ETag and compressed variants, built once
+
+    Args:
+        body: Response bytes
+        content_type: Content-Type header value
+        cache_control: Cache-Control header value
+        static: Compress as hard as possible (for bodies served many times);
+            False favours speed for bodies built per request
+    """
+
+    def __init__(self, body, content_type, cache_control, static=True):
+        self.body = body
+        self.content_type = content_type
+        self.cache_control = cache_control
+        self.digest = hashlib.blake2b(body, digest_size=12).hexdigest()
+        self.variants = {}
+        if len(body) >= MIN_COMPRESS_SIZE and content_type.startswith(COMPRESSIBLE_TYPES):
+            self.variants["gzip"] = gzip.compress(body, compresslevel=9 if static else 6, mtime=0)
+            if brotli is not None:
+                self.variants["br"] = brotli.compress(body, quality=11 if static else 5)
+            # Never send a variant that came out larger than the original
+            self.variants = {k: v for k, v in self.variants.items() if len(v) < len(body)}
+
+    def etag(self, encoding=None):
+        # Each encoding is a different byte sequence, so it gets its own strong validator
+        return f'"{self.digest}-{encoding}"' if encoding else f'"{self.digest}"'
+
+    def respond(self, cache_control=None):
+        """Build the response for the current request: 304, or the best accepted encoding"""
+        accepted = accepted_encodings(request.headers.get("Accept-Encoding"))
+        encoding = next((e for e in ("br", "gzip") if e in accepted and e in self.variants), None)
+        headers = {"ETag": self.etag(encoding), "Cache-Control": cache_control or self.cache_control}
+        if self.variants:
+            headers["Vary"] = "Accept-Encoding"
+        if request.if_none_match.contains_weak(self.etag(encoding).strip('"')):
+            return Response(status=304, headers=headers)
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        body = self.variants[encoding] if encoding else self.body
+        return Response(body, content_type=self.content_type, headers=headers)
+
+
+def load_static(folder=STATIC_DIR):
+    """
+    Read the dashboard's static files into memory
+
+    Returns:
+        Tuple of (files, urls). files maps both the plain and the
+        fingerprinted name (dashboard.css, dashboard.3f2a9c1b7e.css) to its
+        Encoded body. urls maps plain names to fingerprinted /static/ URLs
+        for the template.
+    """
+    files, urls = {}, {}
+    if not os.path.isdir(folder):
+        return files, urls
+    for name in sorted(os.listdir(folder)):
+        path = os.path.join(folder, name)
+        if not os.path.isfile(path):
+            continue
+        with open(path, "rb") as f:
+            body = f.read()
+        content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type == "application/javascript":
+            content_type += "; charset=utf-8"
+        encoded = Encoded(body, content_type, REVALIDATE_CACHE)
+        stem, ext = os.path.splitext(name)
+        fingerprinted = f"{stem}.{encoded.digest[:10]}{ext}"
+        files[name] = files[fingerprinted] = encoded
+        urls[name] = f"/static/{fingerprinted}"
+    return files, urls
+
+
+class PageCache:
+    """
+    The rendered dashboard page, reused until what it shows changes
+
+    Args:
+        render: Function taking the view dict and returning HTML
+    """
+
+    def __init__(self, render):
+        self._render = render
+        self._key = None
+        self._page = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.renders = 0
+        self.render_seconds = 0.0
+
+    def get(self, view):
+        key = json.dumps(view, sort_keys=True, default=str)
+        with self._lock:
+            if key == self._key:
+                self.hits += 1
+                return self._page
+        started = time.perf_counter()
+        page = Encoded(self._render(view).encode(), "text/html; charset=utf-8", REVALIDATE_CACHE)
+        with self._lock:
+            self._key, self._page = key, page
+            self.renders += 1
+            self.render_seconds += time.perf_counter() - started
+        return page
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense"""
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * len(bounds)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def state(self):
+        return {"counts": list(self.counts), "sum": self.sum, "count": self.count}
+
+    def merge(self, state):
+        """Add another histogram's state() with the same bounds into this one"""
+        self.counts = [a + b for a, b in zip(self.counts, state["counts"])]
+        self.sum += state["sum"]
+        self.count += state["count"]
+
+    def lines(self, name, labels):
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            yield f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}'
+        yield f'{name}_bucket{{{labels},le="+Inf"}} {self.count}'
+        yield f"{name}_sum{{{labels}}} {self.sum:g}"
+        yield f"{name}_count{{{labels}}} {self.count}"
+
+
+class RequestMetrics:
+    """Per-route response counts, sizes and handling times for /metrics"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.responses = {}
+        self.sizes = {}
+        self.seconds = {}
+
+    def observe(self, route, status, encoding, size, seconds):
+        with self._lock:
+            key = (route, status, encoding)
+            self.responses[key] = self.responses.get(key, 0) + 1
+            if size is not None:
+                self.sizes.setdefault(route, Histogram(RESPONSE_BYTES_BUCKETS)).observe(size)
+            self.seconds.setdefault(route, Histogram(RESPONSE_SECONDS_BUCKETS)).observe(seconds)
+
+    def state(self, gauges=()):
+        """
+        The counters as plain JSON, for merging with other workers'
+
+        Args:
+            gauges: (name, kind, help, value) tuples carried along
+        """
+        with self._lock:
+            return {
+                "responses": [[*key, count] for key, count in self.responses.items()],
+                "sizes": {route: h.state() for route, h in self.sizes.items()},
+                "seconds": {route: h.state() for route, h in self.seconds.items()},
+                "gauges": [list(gauge) for gauge in gauges],
+            }
+
+    def merge(self, state):
+        """Add a state() from another worker into these counters"""
+        with self._lock:
+            for route, status, encoding, count in state["responses"]:
+                key = (route, status, encoding)
+                self.responses[key] = self.responses.get(key, 0) + count
+            for histograms, bounds, states in ((self.sizes, RESPONSE_BYTES_BUCKETS, state["sizes"]),
+                                               (self.seconds, RESPONSE_SECONDS_BUCKETS, state["seconds"])):
+                for route, histogram in states.items():
+                    histograms.setdefault(route, Histogram(bounds)).merge(histogram)
+
+    def render(self, gauges=()):
+        """
+        Prometheus text exposition
+
+        Args:
+            gauges: Extra (name, kind, help, value) tuples appended unlabelled
+        """
+        lines = []
+        with self._lock:
+            name = "coastalwatch_dashboard_responses_total"
+            lines += [f"# HELP {name} Responses sent", f"# TYPE {name} counter"]
+            for (route, status, encoding), count in sorted(self.responses.items()):
+                lines.append(f'{name}{{route="{route}",status="{status}",encoding="{encoding}"}} {count}')
+            for name, help_text, histograms in (
+                ("coastalwatch_dashboard_response_bytes", "Response body size as sent", self.sizes),
+                ("coastalwatch_dashboard_response_seconds", "Time to build each response", self.seconds),
+            ):
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+                for route, histogram in sorted(histograms.items()):
+                    lines.extend(histogram.lines(name, f'route="{route}"'))
+        for name, kind, help_text, value in gauges:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", f"{name} {value}"]
+        return "\n".join(lines) + "\n"
+
+
+def merge_metrics(states):
+    """
+    Sum several workers' RequestMetrics.state() into one
+
+    Gauges with the same name are added up too.
+    """
+    total, gauges = RequestMetrics(), {}
+    for state in states:
+        total.merge(state)
+        for name, kind, help_text, value in state["gauges"]:
+            gauges.setdefault(name, [name, kind, help_text, 0])[3] += value
+    return total.state(list(gauges.values()))
+
+
+class Collector:
+    """
+    The one status poller and alert feed behind a prefork worker pool
+
+    Runs in its own process, started by the gunicorn master before it
+    forks any worker, so each service is probed and the backend's
+    alert:new is subscribed to once however many workers there are.
+    Workers connect over a Unix socket and send one JSON line:
+
+    - {"op": "subscribe", "pid": ...}: the collector answers with a
+      "state" line (every service's latest result and the recent alerts),
+      then a line per "service" update and "alert". The worker sends
+      {"op": "report", "metrics": ...} lines back with its request counters.
+    - {"op": "collect", "pid": ..., "metrics": ...}: answered with one
+      "metrics" line, the counters of every worker added up, then closed.
+
+    Counters of a worker that has gone (recycled after --max-requests) are
+    kept, so totals never go backwards; its gauges are dropped.
+
+    Args:
+        path: Unix socket path to listen on
+        services: Services to probe
+        interval: Seconds between status probes
+        backend_url: Backend whose alert:new events are relayed (None disables)
+    """
+
+    def __init__(self, path, services=None, interval=POLL_INTERVAL, backend_url=BACKEND_URL):
+        self.path = path
+        self.poller = StatusPoller(services or SERVICES, interval=interval)
+        self.feed = AlertFeed(backend_url, self) if backend_url else None
+        self.poller.add_listener(lambda update: self.publish("service", update))
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._reports = {}
+        self._retired = merge_metrics([])
+        self._server = None
+
+    def publish(self, event, data):
+        """Send an event to every subscribed worker (AlertFeed publishes here too)"""
+        line = json.dumps({"event": event, "data": data}, separators=(",", ":")).encode() + b"\n"
+        with self._lock:
+            for connection in list(self._subscribers):
+                try:
+                    connection.sendall(line)
+                except OSError:
+                    # A worker stuck for COLLECTOR_SEND_TIMEOUT; it resubscribes for a fresh state
+                    self._subscribers.discard(connection)
+                    connection.close()
+
+    def merged(self, pid=None, fresh=None):
+        """Every worker's counters added up, with fresh standing in for pid's last report"""
+        with self._lock:
+            reports = dict(self._reports)
+            states = [self._retired]
+        if pid is not None:
+            reports[pid] = fresh
+        return merge_metrics(states + list(reports.values()))
+
+    def _subscribe(self, connection, pid):
+        with self._lock:
+            # Registered and sent the state under one lock, so no update falls in between
+            self._subscribers.add(connection)
+            state = {
+                "services": [entry for entry in self.poller.snapshot() if entry["checked_at"] is not None],
+                "alerts": list(self.feed.recent) if self.feed else [],
+            }
+            connection.sendall(json.dumps({"event": "state", "data": state}).encode() + b"\n")
+
+    def _retire(self, connection, pid):
+        with self._lock:
+            self._subscribers.discard(connection)
+            last = self._reports.pop(pid, None)
+            if last is not None:
+                last["gauges"] = [gauge for gauge in last["gauges"] if gauge[1] != "gauge"]
+                self._retired = merge_metrics([self._retired, last])
+
+    def handle(self, connection):
+        """Serve one worker connection until it closes"""
+        connection.settimeout(COLLECTOR_SEND_TIMEOUT)
+        reader = connection.makefile("rb")
+        hello = json.loads(reader.readline() or b"{}")
+        pid = hello.get("pid")
+        if hello.get("op") == "collect":
+            merged = self.merged(pid, hello["metrics"])
+            connection.sendall(json.dumps({"event": "metrics", "data": merged}).encode() + b"\n")
+            return
+        if hello.get("op") != "subscribe":
+            return
+        self._subscribe(connection, pid)
+        try:
+            # Reports arrive every COLLECTOR_REPORT_INTERVAL; a worker silent for
+            # COLLECTOR_SEND_TIMEOUT is stuck and gets dropped
+            for line in reader:
+                message = json.loads(line)
+                if message.get("op") == "report":
+                    with self._lock:
+                        self._reports[pid] = message["metrics"]
+        except ConnectionResetError:
+            pass  # the worker exited with events still unread
+        finally:
+            self._retire(connection, pid)
+
+    def serve_forever(self):
+        collector = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                try:
+                    collector.handle(self.request)
+                except (OSError, ValueError) as e:
+                    print(f"⚠️  Collector connection failed: {e}", flush=True)
+
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._server = socketserver.ThreadingUnixStreamServer(self.path, Handler)
+        self._server.daemon_threads = True
+        self.poller.start()
+        if self.feed:
+            self.feed.start()
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self.poller.stop()
+            if self.feed:
+                self.feed.stop()
+
+
+class CollectorClient:
+    """
+    A prefork worker's link to the shared Collector
+
+    Stands in for the worker's own AlertFeed: probe results are stored in
+    a StatusPoller that is never started, alerts kept in recent, and both
+    published to the worker's EventHub as they arrive. The link is
+    reopened with backoff if it drops; until then results age into
+    "unknown" as they would with a stuck poller. The worker's request
+    counters are reported every COLLECTOR_REPORT_INTERVAL seconds.
+
+    Args:
+        path: The collector's Unix socket
+        poller: StatusPoller that receives relayed results
+        hub: EventHub for "service", "alert" and "alerts" events
+        metrics_state: Function returning this worker's RequestMetrics.state()
+        keep: Number of recent alerts kept for new viewers
+    """
+
+    def __init__(self, path, poller, hub, metrics_state, keep=RECENT_ALERTS):
+        self.path = path
+        self.poller = poller
+        self.hub = hub
+        self.metrics_state = metrics_state
+        self.recent = deque(maxlen=keep)
+        self.connected = False
+        self._socket = None
+        self._send_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="collector-link", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Send a last report, so counts since the previous one aren't lost, and close"""
+        self._stop.set()
+        connection = self._socket
+        if connection is not None:
+            try:
+                self._send(connection, {"op": "report", "metrics": self.metrics_state()})
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _send(self, connection, message):
+        line = json.dumps(message, separators=(",", ":")).encode() + b"\n"
+        with self._send_lock:
+            connection.sendall(line)
+
+    def collect(self):
+        """
+        Every worker's counters added up, this one's as of now
+
+        Returns:
+            Merged RequestMetrics.state(), or None if the collector can't be reached
+        """
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+                connection.settimeout(COLLECTOR_SEND_TIMEOUT)
+                connection.connect(self.path)
+                self._send(connection, {"op": "collect", "pid": os.getpid(), "metrics": self.metrics_state()})
+                with connection.makefile("rb") as reader:
+                    return json.loads(reader.readline())["data"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _apply(self, message):
+        event, data = message["event"], message["data"]
+        if event == "state":
+            for entry in data["services"]:
+                self.poller.store(entry["name"], {k: entry[k] for k in RESULT_FIELDS}, entry["age_s"])
+            self.recent.clear()
+            self.recent.extend(data["alerts"])
+            self.hub.publish("alerts", data["alerts"])
+        elif event == "service":
+            self.poller.store(data["name"], {k: data[k] for k in RESULT_FIELDS}, data["age_s"])
+        elif event == "alert":
+            self.recent.appendleft(data)
+            self.hub.publish("alert", data)
+
+    def _run(self):
+        delay = 0.05
+        while not self._stop.is_set():
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+                    connection.connect(self.path)
+                    self._socket = connection
+                    self._send(connection, {"op": "subscribe", "pid": os.getpid()})
+                    self.connected = True
+                    delay = 0.05
+                    self._listen(connection)
+            except (OSError, ValueError) as e:
+                if self.connected and not self._stop.is_set():
+                    print(f"⚠️  Lost the status collector ({e}); reconnecting", flush=True)
+            finally:
+                self.connected = False
+                self._socket = None
+            self._stop.wait(delay)
+            delay = min(delay * 2, COLLECTOR_RECONNECT_MAX)
+
+    def _listen(self, connection):
+        # The read timeout doubles as the report timer
+        connection.settimeout(COLLECTOR_REPORT_INTERVAL)
+        pending, next_report = b"", time.monotonic()
+        while not self._stop.is_set():
+            if time.monotonic() >= next_report:
+                self._send(connection, {"op": "report", "metrics": self.metrics_state()})
+                next_report = time.monotonic() + COLLECTOR_REPORT_INTERVAL
+            try:
+                chunk = connection.recv(65536)
+            except socket.timeout:
+                continue
+            if not chunk:
+                raise ConnectionResetError("collector closed the connection")
+            *lines, pending = (pending + chunk).split(b"\n")
+            for line in lines:
+                self._apply(json.loads(line))
+
+
+def create_app(services=None, interval=POLL_INTERVAL, start_poller=True, backend_url=BACKEND_URL,
+               heartbeat=SSE_HEARTBEAT, collector=None):
+    """
+    Build the dashboard application
+
+    Args:
+        services: Services to show (default SERVICES)
+        interval: Seconds between status probes
+        start_poller: Start the background poller and alert feed immediately
+        backend_url: Backend whose alert:new events are relayed on /events
+            (None disables the feed)
+        heartbeat: Seconds between keep-alive comments on idle /events streams
+        collector: Unix socket of a shared Collector (prefork workers). Status
+            and alerts then come from it rather than from a poller and feed
+            in this process, and /metrics adds up every worker's counters.
+
+    Returns:
+        Flask app; its parts are in app.extensions: status_poller, event_hub,
+        alert_feed (a CollectorClient with collector), page_cache and
+        request_metrics
+    """
+    # static/ is served from memory by the route below, not by Flask's file sender
+    app = Flask(__name__, static_folder=None)
+    poller = StatusPoller(services or SERVICES, interval=interval)
+    hub = EventHub(heartbeat=heartbeat)
+    poller.add_listener(lambda update: hub.publish("service", update))
+    static_files, asset_urls = load_static()
+    pages = PageCache(lambda view: render_template("index.html", **view))
+    metrics = RequestMetrics()
+
+    def gauges():
+        return [
+            ("coastalwatch_dashboard_page_renders_total", "counter", "Times the page template was rendered",
+             pages.renders),
+            ("coastalwatch_dashboard_page_cache_hits_total", "counter", "Page views served from the render cache",
+             pages.hits),
+            ("coastalwatch_dashboard_page_render_seconds_total", "counter", "Time spent rendering the page",
+             round(pages.render_seconds, 6)),
+            ("coastalwatch_dashboard_sse_viewers", "gauge", "Open /events streams", hub.subscribers),
+            ("coastalwatch_dashboard_sse_events_total", "counter", "Events published to /events", hub.published),
+            ("coastalwatch_dashboard_sse_dropped_total", "counter", "Streams dropped for falling behind",
+             hub.dropped),
+        ]
+
+    if collector:
+        feed = link = CollectorClient(collector, poller, hub, lambda: metrics.state(gauges()))
+    else:
+        feed, link = AlertFeed(backend_url, hub) if backend_url else None, None
+    app.extensions.update(status_poller=poller, event_hub=hub, alert_feed=feed, page_cache=pages,
+                          request_metrics=metrics)
+
+    def recent_alerts():
+        return list(feed.recent) if feed else []
+
+    def page_view():
+        # Only what the HTML shows: latency and ages change every probe and
+        # reach open pages over /events instead
+        services = []
+        for entry in poller.snapshot():
+            view = {k: entry[k] for k in ("name", "label", "url", "health_url", "icon", "description", "state")}
+            view["error"] = entry["error"] if entry["state"] != UNKNOWN else None
+            services.append(view)
+        return {"services": services, "alerts": recent_alerts(), "refresh_ms": int(interval * 1000),
+                "assets": asset_urls}
+
+    @app.before_request
+    def start_timer():
+        g.started = time.perf_counter()
+
+    @app.after_request
+    def record(response):
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+        size = None if response.is_streamed else response.calculate_content_length()
+        metrics.observe(route, response.status_code, response.headers.get("Content-Encoding", "identity"),
+                        size, time.perf_counter() - g.started)
+        return response
+
+    @app.route("/")
+    def index():
+        return pages.get(page_view()).respond()
+
+    @app.route("/static/<path:filename>")
+    def static_file(filename):
+        encoded = static_files.get(filename)
+        if encoded is None:
+            abort(404)
+        fingerprinted = filename not in asset_urls
+        return encoded.respond(IMMUTABLE_CACHE if fingerprinted else None)
+
+    @app.route("/status.json")
+    def status():
+        body = json.dumps({"services": poller.snapshot(), "viewers": hub.subscribers,
+                           "generated_at": time.time()}).encode()
+        return Encoded(body, "application/json", "no-cache", static=False).respond()
+
+    @app.route("/events")
+    def events():
+        # Subscribe before taking the snapshot so nothing falls in between
+        subscriber = hub.subscribe()
+        initial = [
+            hub.frame("status", {"services": poller.snapshot()}),
+            hub.frame("alerts", recent_alerts()),
+        ]
+        return Response(hub.stream(subscriber, initial), mimetype="text/event-stream", headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # don't let a fronting nginx buffer the stream
+        })
+
+    @app.route("/metrics")
+    def metrics_endpoint():
+        # In prefork mode, every worker's counters; other workers' are up to
+        # COLLECTOR_REPORT_INTERVAL old. Just this one's if the collector is down.
+        merged = link.collect() if link else None
+        if merged is None:
+            text = metrics.render(gauges())
+        else:
+            total = RequestMetrics()
+            total.merge(merged)
+            text = total.render(merged["gauges"])
+        return Response(text, content_type="text/plain; version=0.0.4; charset=utf-8",
+                        headers={"Cache-Control": "no-store"})
+
+    @app.route("/health")
+    def health():
+        return jsonify(status="ok")
+
+    if start_poller:
+        if not link:
+            poller.start()
+        if feed:
+            feed.start()
+    return app
+
+
+def serve_prefork(args):
+    """
+    Serve with a gunicorn master and forked gthread workers
+
+    Before forking any worker the master starts one Collector process
+    (app.py --collector), which owns the status poller and the alert feed.
+    The app is created inside each worker after the fork and mirrors the
+    collector over a Unix socket, so every worker shows the same status
+    and alerts and /metrics counts requests across all of them. The master
+    itself starts no threads, so forking it stays safe.
+    """
+    directory = tempfile.mkdtemp(prefix="coastalwatch-dashboard-")
+    path = os.path.join(directory, "collector.sock")
+    collector = {}
+
+    def on_starting(server):
+        command = [sys.executable, os.path.abspath(__file__), "--collector", path,
+                   "--poll-interval", str(args.poll_interval), "--backend-url", args.backend_url or ""]
+        collector["process"] = subprocess.Popen(command)
+
+    def on_exit(server):
+        process = collector.get("process")
+        if process is not None:
+            process.terminate()
+            try:
+                process.wait(GRACEFUL_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        shutil.rmtree(directory, ignore_errors=True)
+
+    def worker_exit(server, worker):
+        # Hand the collector this worker's final counts before it goes
+        link = worker.wsgi.extensions.get("alert_feed") if worker.wsgi else None
+        if isinstance(link, CollectorClient):
+            link.stop()
+
+    class PreforkServer(BaseApplication):
+        def load_config(self):
+            settings = {
+                "bind": f"{args.host}:{args.port}",
+                "worker_class": "gthread",
+                "workers": args.workers,
+                "threads": args.threads,
+                "keepalive": args.keepalive,
+                "max_requests": args.max_requests,
+                "max_requests_jitter": args.max_requests_jitter if args.max_requests else 0,
+                "graceful_timeout": GRACEFUL_TIMEOUT,
+                "accesslog": None,
+                "errorlog": "-",
+                "proc_name": "coastalwatch-dashboard",
+                "on_starting": on_starting,
+                "on_exit": on_exit,
+                "worker_exit": worker_exit,
+            }
+            if "control_socket_disable" in self.cfg.settings:
+                # gunicorn 24+ opens ~/.gunicorn/gunicorn.ctl, shared by every instance
+                settings["control_socket_disable"] = True
+            for key, value in settings.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return create_app(interval=args.poll_interval, collector=path)
+
+    PreforkServer().run()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the CoastalWatch dashboard")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--poll-interval", type=float, default=POLL_INTERVAL,
+                        help=f"Seconds between service status probes (default {POLL_INTERVAL:g})")
+    parser.add_argument("--backend-url", default=BACKEND_URL,
+                        help=f"Backend whose alert:new events are relayed on /events (default {BACKEND_URL})")
+    # Started by the prefork master; not meant to be run by hand
+    parser.add_argument("--collector", metavar="SOCKET", help=argparse.SUPPRESS)
+    prefork = parser.add_argument_group("prefork serving (gunicorn)")
+    prefork.add_argument("--prefork", action="store_true",
+                         help="Serve with a prefork worker pool instead of the development server")
+    prefork.add_argument("--workers", type=int, default=PREFORK_WORKERS,
+                         help=f"Worker processes (default {PREFORK_WORKERS})")
+    prefork.add_argument("--threads", type=int, default=PREFORK_THREADS,
+                         help=f"Request threads per worker; each open /events stream holds one "
+                              f"(default {PREFORK_THREADS})")
+    prefork.add_argument("--max-requests", type=int, default=MAX_REQUESTS,
+                         help=f"Recycle a worker after this many requests, 0 to never (default {MAX_REQUESTS})")
+    prefork.add_argument("--max-requests-jitter", type=int, default=MAX_REQUESTS_JITTER,
+                         help="Random extra requests per worker so they don't all recycle at once")
+    prefork.add_argument("--keepalive", type=int, default=KEEPALIVE,
+                         help=f"Seconds to hold an idle keep-alive connection open (default {KEEPALIVE})")
+    args = parser.parse_args(argv)
+    if args.workers < 1 or args.threads < 1:
+        parser.error("--workers and --threads must be at least 1")
+    return args
+
+
+def main():
+    args = parse_args()
+    if args.collector:
+        Collector(args.collector, interval=args.poll_interval, backend_url=args.backend_url or None).serve_forever()
+        return
+    if args.prefork and (BaseApplication is None or sys.platform == "win32"):
+        print("⚠️  gunicorn is not available; using the development server", flush=True)
+        args.prefork = False
+    if args.prefork:
+        print(f"📊 CoastalWatch Dashboard on http://{args.host}:{args.port} "
+              f"({args.workers} worker(s) × {args.threads} thread(s))", flush=True)
+        serve_prefork(args)
+        return
+    app = create_app(interval=args.poll_interval, backend_url=args.backend_url)
+    print(f"📊 CoastalWatch Dashboard on http://{args.host}:{args.port}", flush=True)
+    app.run(host=args.host, port=args.port, threaded=True)
+
+
+if __name__ == "__main__":
+    main()
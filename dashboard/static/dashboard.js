@@ -0,0 +1,69 @@
+const REFRESH_MS = Number(document.body.dataset.refreshMs);
+// Without an update for this long a card falls back to "unknown"
+const STALE_MS = REFRESH_MS * 3;
+const MAX_ALERTS = 20;
+const lastSeen = {};
+
+function renderService(service) {
+  const card = document.querySelector(`[data-service="${service.name}"]`);
+  if (!card) return;
+  lastSeen[service.name] = Date.now() - (service.age_s || 0) * 1000;
+  const badge = card.querySelector(".status");
+  badge.className = `status ${service.state}`;
+  badge.textContent = service.state;
+  const parts = [];
+  if (service.latency_ms !== null) parts.push(`${service.latency_ms} ms`);
+  if (service.error) parts.push(service.error);
+  card.querySelector(".detail").textContent = parts.join(" · ");
+}
+
+function alertItem(alert) {
+  const item = document.createElement("li");
+  item.className = alert.severity || "";
+  const when = document.createElement("span");
+  when.className = "when";
+  when.textContent = new Date(alert.timestamp || alert.createdAt || Date.now()).toLocaleTimeString();
+  const type = document.createElement("strong");
+  type.textContent = alert.type;
+  item.append(when, type, ` · ${alert.message}`);
+  return item;
+}
+
+function renderAlerts(alerts) {
+  const list = document.getElementById("alerts");
+  if (alerts.length) list.replaceChildren(...alerts.map(alertItem));
+}
+
+function addAlert(alert) {
+  const list = document.getElementById("alerts");
+  list.querySelector(".empty")?.remove();
+  list.prepend(alertItem(alert));
+  while (list.children.length > MAX_ALERTS) list.lastChild.remove();
+}
+
+function markStale() {
+  for (const [name, seen] of Object.entries(lastSeen)) {
+    if (Date.now() - seen > STALE_MS) {
+      renderService({ name, state: "unknown", latency_ms: null, error: "no recent status" });
+      lastSeen[name] = Infinity;
+    }
+  }
+}
+
+if (window.EventSource) {
+  // One long-lived connection; the server pushes each status change and alert
+  const events = new EventSource("/events");
+  events.addEventListener("status", (e) => JSON.parse(e.data).services.forEach(renderService));
+  events.addEventListener("service", (e) => renderService(JSON.parse(e.data)));
+  events.addEventListener("alerts", (e) => renderAlerts(JSON.parse(e.data)));
+  events.addEventListener("alert", (e) => addAlert(JSON.parse(e.data)));
+  document.getElementById("footer").textContent = "Live status and alerts";
+  setInterval(markStale, REFRESH_MS);
+} else {
+  setInterval(() => {
+    fetch("/status.json")
+      .then((response) => response.json())
+      .then((body) => body.services.forEach(renderService))
+      .catch(() => {});
+  }, REFRESH_MS);
+}
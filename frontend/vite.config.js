@@ -1,6 +1,24 @@
 import { defineConfig } from 'vite'
 import react from '@vitejs/plugin-react'
 
+// Readiness endpoint probed by run_all.py, served by both `vite` and `vite preview`
+function healthEndpoint() {
+  const handler = (req, res, next) => {
+    if (req.url !== '/health') return next()
+    res.setHeader('Content-Type', 'application/json')
+    res.end(JSON.stringify({ status: 'ok' }))
+  }
+  return {
+    name: 'health-endpoint',
+    configureServer(server) {
+      server.middlewares.use(handler)
+    },
+    configurePreviewServer(server) {
+      server.middlewares.use(handler)
+    },
+  }
+}
+
 // https://vite.dev/config/
 export default defineConfig({
   plugins: [
@@ -9,5 +27,6 @@ export default defineConfig({
         plugins: [['babel-plugin-react-compiler']],
       },
     }),
+    healthEndpoint(),
   ],
 })
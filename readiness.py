@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+CoastalWatch Readiness Poller
+Waits for several HTTP endpoints at once under a single deadline
+"""
+
+import asyncio
+import random
+import sys
+import time
+
+import aiohttp
+
+# Per-request timeout; the overall deadline still wins if it is sooner
+PROBE_TIMEOUT = 5.0
+# Retry delays grow from BACKOFF_MIN to BACKOFF_MAX, with jitter so probes
+# against a slow service don't line up
+BACKOFF_MIN = 0.05
+BACKOFF_MAX = 1.0
+
+
+class Readiness:
+    """
+    Outcome of waiting for one endpoint
+
+    Args:
+        name: Service name
+        url: URL that was probed
+    """
+
+    def __init__(self, name, url):
+        self.name = name
+        self.url = url
+        self.ready = False
+        self.seconds = None
+        self.attempts = 0
+        self.status = None
+        self.error = None
+
+    def __repr__(self):
+        if self.ready:
+            return f"<Readiness {self.name} ready in {self.seconds:.2f}s>"
+        return f"<Readiness {self.name} not ready: {self.error}>"
+
+
+async def _poll(session, readiness, started, deadline, on_ready):
+    delay = BACKOFF_MIN
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            readiness.error = readiness.error or "deadline passed"
+            return readiness
+        readiness.attempts += 1
+        try:
+            timeout = aiohttp.ClientTimeout(total=min(PROBE_TIMEOUT, remaining))
+            async with session.get(readiness.url, timeout=timeout, allow_redirects=False) as response:
+                await response.read()
+                readiness.status = response.status
+                if 200 <= response.status < 400:
+                    readiness.ready = True
+                    readiness.seconds = time.monotonic() - started
+                    readiness.error = None
+                    if on_ready:
+                        on_ready(readiness)
+                    return readiness
+                readiness.error = f"HTTP {response.status}"
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+            readiness.error = str(e) or type(e).__name__
+        sleep = delay / 2 + random.uniform(0, delay / 2)
+        await asyncio.sleep(min(sleep, max(0.0, deadline - time.monotonic())))
+        delay = min(delay * 2, BACKOFF_MAX)
+
+
+async def wait_ready_async(endpoints, timeout=60, on_ready=None):
+    """
+    Probe every endpoint concurrently until each answers 2xx/3xx or time runs out
+
+    All probes share one connection pool with keep-alive, so retries reuse
+    sockets instead of reconnecting.
+
+    Args:
+        endpoints: Dict mapping service name to URL
+        timeout: Overall deadline in seconds for all endpoints together
+        on_ready: Optional callback receiving each Readiness as it succeeds
+
+    Returns:
+        Dict mapping service name to Readiness
+    """
+    started = time.monotonic()
+    deadline = started + timeout
+    connector = aiohttp.TCPConnector(limit=0, keepalive_timeout=30)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        results = await asyncio.gather(*(
+            _poll(session, Readiness(name, url), started, deadline, on_ready)
+            for name, url in endpoints.items()
+        ))
+    return {r.name: r for r in results}
+
+
+def wait_ready(endpoints, timeout=60, on_ready=None):
+    """Blocking wrapper around wait_ready_async for scripts and tests"""
+    return asyncio.run(wait_ready_async(endpoints, timeout=timeout, on_ready=on_ready))
+
+
+def print_ready(readiness):
+    """on_ready callback printing the time-to-ready of each service"""
+    print(f"✅ {readiness.name} is ready ({readiness.seconds:.2f}s, {readiness.attempts} probe(s))")
+
+
+def report(results):
+    """
+    Print the outcome of wait_ready
+
+    Returns:
+        True if every endpoint became ready
+    """
+    for readiness in results.values():
+        if not readiness.ready:
+            print(f"❌ {readiness.name} not ready at {readiness.url}: {readiness.error}")
+    ready = [r.seconds for r in results.values() if r.ready]
+    if ready:
+        print(f"⏱️  Slowest service ready after {max(ready):.2f}s")
+    return all(r.ready for r in results.values())
+
+
+def main():
+    """Wait for the default CoastalWatch endpoints, e.g. from a shell script"""
+    endpoints = {
+        "Dashboard": "http://127.0.0.1:5000",
+        "Backend API": "http://127.0.0.1:4000/health",
+        "Frontend UI": "http://127.0.0.1:5173",
+    }
+    timeout = float(sys.argv[1]) if len(sys.argv) > 1 else 60
+    sys.exit(0 if report(wait_ready(endpoints, timeout=timeout, on_ready=print_ready)) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,14 +4,114 @@ CoastalWatch Orchestrator
 Launches and manages all services (backend, frontend, dashboard)
 """
 
+import argparse
+import hashlib
+import http.client
+import json
 import subprocess
 import sys
 import time
 import signal
 import os
+import queue
+import selectors
+import socket
+import threading
+import urllib.error
+import urllib.request
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
-# Track all spawned processes
-processes = []
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+from urllib.parse import urlparse
+
+# Track all orchestrated services
+services = []
+
+# LogMultiplexer capturing service output (None: children inherit the terminal)
+log_capture = None
+
+# Path of the control socket this orchestrator listens on, if any
+control_socket = None
+
+# Orchestrator state (startup metrics, build cache, ...) lives here
+STATE_DIR = ".coastalwatch"
+STARTUP_METRICS_FILE = os.path.join(STATE_DIR, "startup-metrics.jsonl")
+FRONTEND_BUILD_MANIFEST = os.path.join(STATE_DIR, "frontend-build.json")
+FRONTEND_BUILD_LOG = os.path.join(STATE_DIR, "frontend-builds.jsonl")
+
+# Service output is captured into a per-service ring buffer (last N lines,
+# kept in memory) and size-rotated files under LOG_DIR
+LOG_DIR = os.path.join(STATE_DIR, "logs")
+LOG_RING_LINES = 1000
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUPS = 3
+# Longer lines are split so one runaway line can't grow the buffers
+LOG_MAX_LINE = 8192
+# Lines waiting for the terminal; beyond this they are dropped from the
+# console (they are still in the ring buffer and log file)
+CONSOLE_QUEUE_LINES = 10000
+
+# Backend replicas (--backend-replicas) listen on 4001, 4002, ... behind
+# backend_proxy.py on :4000; the proxy's own metrics are on the admin port
+BACKEND_REPLICA_BASE_PORT = 4001
+BACKEND_PROXY_ADMIN_PORT = 4900
+
+# Rolling restarts of the replicas (SIGHUP or `run_all.py --rolling-restart`)
+CONTROL_SOCKET = os.path.join(STATE_DIR, "control.sock")
+DRAIN_TIMEOUT = 30.0
+DB_READY_TIMEOUT = 30.0
+# What a step can fail with: proxy admin calls (wrapped in RuntimeError)
+# and the socket and HTTP errors of talking to a replica
+ROLLOUT_ERRORS = (RuntimeError, OSError, http.client.HTTPException)
+
+# Per-service resource metrics, served in Prometheus text format
+METRICS_PORT = 9464
+METRICS_INTERVAL = 5.0
+
+# Everything `vite build` reads; a change to any of these invalidates dist/
+FRONTEND_DIR = "frontend"
+FRONTEND_DIST = os.path.join(FRONTEND_DIR, "dist")
+FRONTEND_BUILD_INPUTS = [
+    "src",
+    "public",
+    "index.html",
+    "vite.config.js",
+    "package.json",
+    "package-lock.json",
+]
+
+# How long a single readiness probe may take before it counts as a miss
+PROBE_TIMEOUT = 2
+
+# Readiness polling backs off from the first to the last interval (seconds)
+PROBE_INTERVAL_MIN = 0.05
+PROBE_INTERVAL_MAX = 1.0
+
+# Crashed services are restarted after an exponential backoff (seconds)
+RESTART_BACKOFF_MIN = 0.5
+RESTART_BACKOFF_MAX = 30.0
+
+# A service that crashes more than RESTART_BUDGET times within
+# RESTART_WINDOW seconds is marked failed and left down
+RESTART_BUDGET = 5
+RESTART_WINDOW = 300.0
+
+# Service lifecycle states
+PENDING = "pending"      # waiting for dependencies
+STARTING = "starting"    # spawned, readiness probe not yet passing
+READY = "ready"
+BACKOFF = "backoff"      # crashed, waiting to be restarted
+FAILED = "failed"        # restart budget exhausted
+RETIRING = "retiring"    # replaced by a rolling restart; exiting is expected
+
+# Shutdown gives every service this long to exit after SIGTERM (shared
+# deadline, not per service) before escalating to SIGKILL
+SHUTDOWN_TIMEOUT = 5.0
+SHUTDOWN_KILL_GRACE = 2.0
 
 # ANSI color codes for terminal output
 class Colors:
@@ -49,48 +149,740 @@ def colorize(text, color):
         return f"{color}{text}{Colors.ENDC}"
     return text
 
+def signal_group(process, force=False):
+    """
+    Ask a service's whole process tree to stop, or kill it outright
+
+    Services run in their own process group (session) so that npm's
+    grandchildren (node, vite, esbuild) are signalled along with npm.
+    """
+    try:
+        if sys.platform == "win32":
+            if force:
+                subprocess.run(["taskkill", "/F", "/T", "/PID", str(process.pid)],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            else:
+                process.send_signal(signal.CTRL_BREAK_EVENT)
+        else:
+            os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+    except OSError:
+        pass
+
+def scan_process_groups():
+    """
+    Map each process group ID to the PIDs of its running (non-zombie) members
+
+    Orphaned grandchildren linger as zombies until init reaps them, so
+    they are skipped. Linux only; returns None where /proc is unavailable.
+    """
+    if not os.path.isdir("/proc"):
+        return None
+    groups = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "rb") as f:
+                fields = f.read().rsplit(b")", 1)[1].split()
+        except OSError:
+            continue
+        if fields[0] != b"Z":
+            groups.setdefault(int(fields[2]), []).append(int(entry))
+    return groups
+
+def group_members(pgid):
+    """Return the PIDs of running members of a process group, or None without /proc"""
+    groups = scan_process_groups()
+    return None if groups is None else groups.get(pgid, [])
+
+def group_rss(process):
+    """Total resident memory of a service's process group in bytes, or None"""
+    members = group_members(process.pid) if sys.platform != "win32" else None
+    if members is None:
+        return None
+    total = 0
+    for pid in members:
+        try:
+            with open(f"/proc/{pid}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1]) * 1024
+                        break
+        except OSError:
+            continue
+    return total
+
+def group_alive(process):
+    """Return True while any process in the service's group is still running"""
+    process.poll()  # reap the leader so a zombie doesn't count as alive
+    if sys.platform == "win32":
+        return process.returncode is None
+    members = group_members(process.pid)
+    if members is not None:
+        return bool(members)
+    try:
+        os.killpg(process.pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def port_is_free(port):
+    """Return True if a new listener could bind the port right now"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        if sys.platform != "win32":
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind(("0.0.0.0", port))
+        except OSError:
+            return False
+    return True
+
+def stop_services(services, timeout=SHUTDOWN_TIMEOUT):
+    """
+    Stop all services in parallel under one shared deadline
+
+    Every process group gets SIGTERM at once; whatever is still alive when
+    the deadline passes gets SIGKILL. Returns once the groups are gone and
+    their ports can be bound again, or once the grace after SIGKILL runs
+    out.
+
+    Returns:
+        List of (service, seconds_to_stop, forced) tuples. seconds_to_stop
+        is None for a group still alive after SIGKILL (e.g. a process
+        stuck in uninterruptible sleep)
+    """
+    started = time.monotonic()
+    deadline = started + timeout
+    running = [s for s in services if s.process is not None and group_alive(s.process)]
+    for service in running:
+        print(f"   Stopping {colorize(service.label, Colors.CYAN)} "
+              f"{colorize(f'(PGID: {service.process.pid})', Colors.CYAN)}...")
+        signal_group(service.process)
+
+    results = []
+    pending = list(running)
+    forced = False
+    while pending:
+        now = time.monotonic()
+        if now >= deadline and not forced:
+            for service in pending:
+                print(f"   Force killing {colorize(service.label, Colors.RED)}...")
+                signal_group(service.process, force=True)
+            forced = True
+            deadline = now + SHUTDOWN_KILL_GRACE
+        elif now >= deadline:
+            break
+        for service in list(pending):
+            if not group_alive(service.process):
+                pending.remove(service)
+                results.append((service, time.monotonic() - started, forced))
+        if pending:
+            time.sleep(0.02)
+
+    # Listening sockets can outlive the process by a moment; wait them out so
+    # a restart straight after a stop never hits EADDRINUSE
+    for service, _, _ in results:
+        while service.port and not port_is_free(service.port) and time.monotonic() < deadline:
+            time.sleep(0.02)
+    results.extend((service, None, True) for service in pending)
+    return results
+
 def signal_handler(sig, frame):
     """Handle Ctrl+C gracefully by terminating all services"""
+    # Ignore repeated Ctrl+C while the shutdown is in progress
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
     print()
     print(colorize("=" * 60, Colors.YELLOW))
     print(colorize("🛑 Shutting down all services...", Colors.YELLOW))
     print(colorize("=" * 60, Colors.YELLOW))
     print()
-    
-    shutdown_count = 0
-    for p in processes:
+
+    if control_socket is not None:
         try:
-            if p.poll() is None:  # Process is still running
-                print(f"   Stopping process {colorize(str(p.pid), Colors.CYAN)}...")
-                p.terminate()
-                p.wait(timeout=5)
-                shutdown_count += 1
-        except subprocess.TimeoutExpired:
-            print(f"   Force killing process {colorize(str(p.pid), Colors.RED)}...")
-            p.kill()
-            shutdown_count += 1
-        except Exception as e:
-            print(colorize(f"   Error terminating process: {e}", Colors.RED))
-    
+            os.unlink(control_socket)
+        except OSError:
+            pass
+
+    started = time.monotonic()
+    results = stop_services(list(services))
+    elapsed = time.monotonic() - started
+
+    print()
+    survivors = []
+    for service, latency, forced in results:
+        if latency is None:
+            survivors.append(service)
+            print(f"   {colorize(f'{service.label}:'.ljust(14), Colors.CYAN)} "
+                  f"{colorize('still running after SIGKILL', Colors.RED)} (PGID: {service.process.pid})")
+            continue
+        how = colorize("SIGKILL", Colors.RED) if forced else colorize("SIGTERM", Colors.GREEN)
+        print(f"   {colorize(f'{service.label}:'.ljust(14), Colors.CYAN)} {latency:6.2f}s ({how})")
     print()
-    print(colorize(f"✅ Successfully stopped {shutdown_count} service(s)", Colors.GREEN))
+    if survivors:
+        print(colorize(f"❌ Could not stop {len(survivors)} of {len(results)} service(s) "
+                       f"in {elapsed:.2f}s", Colors.RED))
+        print(colorize("=" * 60, Colors.RED))
+        print()
+        sys.exit(1)
+    print(colorize(f"✅ Successfully stopped {len(results)} service(s) in {elapsed:.2f}s", Colors.GREEN))
     print(colorize("=" * 60, Colors.GREEN))
     print()
     sys.exit(0)
 
-def start_service(name, command, cwd=None):
+def parse_cpu_list(text):
+    """Parse a CPU list such as "0-3,6" into a set of CPU numbers"""
+    cpus = set()
+    for chunk in text.split(","):
+        start, _, end = chunk.strip().partition("-")
+        cpus.update(range(int(start), int(end or start) + 1))
+    return cpus
+
+
+def format_cpu_list(cpus):
+    """Format a set of CPU numbers compactly, e.g. {0, 1, 2, 6} as 0-2,6"""
+    ranges = []
+    for cpu in sorted(cpus):
+        if ranges and cpu == ranges[-1][1] + 1:
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+    return ",".join(str(a) if a == b else f"{a}-{b}" for a, b in ranges)
+
+
+def parse_size(text):
+    """Parse a byte size such as "512M" or "4G" """
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+    text = text.strip().upper().rstrip("B")
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+class SchedulingProfile:
     """
-    Start a service and track its process
-    
+    CPU affinity, niceness and resource limits applied to a service
+
+    The service is started through a small exec wrapper (run_all.py
+    --exec-profile) that applies the settings to itself and then execs the
+    real command, so npm and every process and thread it spawns inherit
+    them. Nothing runs between fork and exec in the orchestrator.
+
+    Args:
+        cpus: Set of CPUs the service may run on (os.sched_setaffinity)
+        nice: Absolute niceness, -20 (highest priority) to 19
+        nofile: Cap on open file descriptors (RLIMIT_NOFILE, soft and hard)
+        address_space: Cap on virtual memory in bytes (RLIMIT_AS, soft and hard)
+    """
+
+    def __init__(self, cpus=None, nice=None, nofile=None, address_space=None):
+        self.cpus = set(cpus) if cpus else None
+        self.nice = nice
+        self.nofile = nofile
+        self.address_space = address_space
+
+    @classmethod
+    def parse(cls, spec):
+        """
+        Parse "cpus=0-1,nice=5,nofile=4096,as=2G"
+
+        Raises:
+            ValueError: On unknown keys or malformed values
+        """
+        profile = cls()
+        # Split on commas that start a new key=value, so "cpus=0-1,4" works
+        items = []
+        for part in spec.split(","):
+            if "=" in part or not items:
+                items.append(part)
+            else:
+                items[-1] += "," + part
+        for item in items:
+            key, sep, value = item.partition("=")
+            key = key.strip().lower()
+            if not sep or not value:
+                raise ValueError(f"expected key=value, got '{item}'")
+            if key == "cpus":
+                profile.cpus = parse_cpu_list(value)
+            elif key == "nice":
+                profile.nice = int(value)
+            elif key == "nofile":
+                profile.nofile = int(value)
+            elif key == "as":
+                profile.address_space = parse_size(value)
+            else:
+                raise ValueError(f"unknown setting '{key}' (use cpus, nice, nofile, as)")
+        return profile
+
+    def validate(self):
+        """
+        Check the profile can be applied by this orchestrator
+
+        Raises:
+            ValueError: Describing the first problem found
+        """
+        if resource is None or not hasattr(os, "sched_setaffinity"):
+            raise ValueError("scheduling profiles are only supported on Linux")
+        if self.cpus is not None:
+            allowed = os.sched_getaffinity(0)
+            if not self.cpus or not self.cpus <= allowed:
+                raise ValueError(f"cpus={format_cpu_list(self.cpus)} is not within the "
+                                 f"CPUs available here ({format_cpu_list(allowed)})")
+        if self.nice is not None:
+            if not -20 <= self.nice <= 19:
+                raise ValueError(f"nice={self.nice} is outside -20..19")
+            current = os.getpriority(os.PRIO_PROCESS, 0)
+            if self.nice < current and os.geteuid() != 0:
+                raise ValueError(f"nice={self.nice} is below the orchestrator's own ({current}); "
+                                 "lowering niceness needs root or CAP_SYS_NICE")
+        for name, limit, value in (("nofile", resource.RLIMIT_NOFILE, self.nofile),
+                                   ("as", resource.RLIMIT_AS, self.address_space)):
+            if value is None:
+                continue
+            hard = resource.getrlimit(limit)[1]
+            if value <= 0:
+                raise ValueError(f"{name}={value} must be positive")
+            if hard != resource.RLIM_INFINITY and value > hard:
+                raise ValueError(f"{name}={value} exceeds the hard limit ({hard})")
+
+    def apply(self):
+        """Apply the profile to the calling process"""
+        if self.cpus is not None:
+            os.sched_setaffinity(0, self.cpus)
+        if self.nice is not None:
+            os.setpriority(os.PRIO_PROCESS, 0, self.nice)
+        if self.nofile is not None:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (self.nofile, self.nofile))
+        if self.address_space is not None:
+            resource.setrlimit(resource.RLIMIT_AS, (self.address_space, self.address_space))
+
+    def spec(self):
+        """The profile as a settings string, e.g. "cpus=0-1,nice=5", that parse() reads back"""
+        parts = []
+        if self.cpus is not None:
+            parts.append(f"cpus={format_cpu_list(self.cpus)}")
+        for key, value in (("nice", self.nice), ("nofile", self.nofile), ("as", self.address_space)):
+            if value is not None:
+                parts.append(f"{key}={value}")
+        return ",".join(parts)
+
+    def wrap(self, command):
+        """Prefix a command list with the exec wrapper that applies this profile"""
+        return [sys.executable, os.path.abspath(__file__), "--exec-profile", self.spec(), "--", *command]
+
+    def describe(self):
+        parts = []
+        if self.cpus is not None:
+            parts.append(f"cpus={format_cpu_list(self.cpus)}")
+        if self.nice is not None:
+            parts.append(f"nice={self.nice}")
+        if self.nofile is not None:
+            parts.append(f"nofile={self.nofile}")
+        if self.address_space is not None:
+            parts.append(f"as={format_bytes(self.address_space)}")
+        return " ".join(parts)
+
+    @staticmethod
+    def effective(pid):
+        """Read back the settings a running process actually has"""
+        try:
+            nofile = resource.prlimit(pid, resource.RLIMIT_NOFILE)[0]
+            address_space = resource.prlimit(pid, resource.RLIMIT_AS)[0]
+            return SchedulingProfile(
+                cpus=os.sched_getaffinity(pid),
+                nice=os.getpriority(os.PRIO_PROCESS, pid),
+                nofile=nofile,
+                address_space=None if address_space == resource.RLIM_INFINITY else address_space,
+            )
+        except (OSError, AttributeError):
+            return None
+
+    def matches(self, other):
+        """True if every setting in this profile is in effect in other"""
+        return other is not None and all(
+            mine is None or mine == theirs
+            for mine, theirs in ((self.cpus, other.cpus), (self.nice, other.nice),
+                                 (self.nofile, other.nofile), (self.address_space, other.address_space))
+        )
+
+
+class Service:
+    """
+    Definition and runtime state of one orchestrated service
+
     Args:
-        name: Display name of the service
+        name: Short key used for dependencies (e.g. "backend")
+        label: Display name of the service
         command: Command to execute (string or list)
         cwd: Working directory for the command
-    
+        url: Public URL shown in the service banner
+        health_url: URL that answers 2xx once the service can take traffic
+        depends_on: Names of services that must be ready before this one starts
+        ready_timeout: Seconds to wait for the health URL before giving up
+        profile: Optional SchedulingProfile the process is started under
+        env: Extra environment variables for the process
+    """
+
+    def __init__(self, name, label, command, cwd=None, url=None, health_url=None,
+                 depends_on=(), ready_timeout=60, profile=None, env=None):
+        self.name = name
+        self.label = label
+        self.command = command
+        self.cwd = cwd
+        self.url = url
+        self.health_url = health_url
+        self.depends_on = tuple(depends_on)
+        self.ready_timeout = ready_timeout
+        self.profile = profile
+        self.env = dict(env or {})
+
+        self.process = None
+        self.state = PENDING
+        self.started_at = None
+        self.ready_at = None
+        self.ready_rss = None
+        self.error = None
+        self.restarts = 0
+        self.restart_times = deque()
+        self.log_ring = deque(maxlen=LOG_RING_LINES)
+        self.restart_at = None
+        # True once the first launch attempt has either passed or failed
+        self.settled = False
+
+    @property
+    def is_ready(self):
+        return self.state == READY
+
+    @property
+    def port(self):
+        """Port the service listens on, taken from its URL"""
+        return urlparse(self.url).port if self.url else None
+
+    @property
+    def time_to_ready(self):
+        """Seconds from spawn to the first passing health probe"""
+        if self.ready_at is None or self.started_at is None:
+            return None
+        return self.ready_at - self.started_at
+
+
+def build_backend(replicas=None):
+    """
+    Return the backend service(s)
+
+    Args:
+        replicas: Number of backend replicas to run behind backend_proxy.py on
+            :4000, or None for a single backend listening on :4000 itself
+    """
+    if not replicas:
+        return [Service(
+            "backend", "Backend API", "npm start", cwd="backend",
+            url="http://127.0.0.1:4000",
+            health_url="http://127.0.0.1:4000/health",
+            # Mongo's serverSelectionTimeoutMS is 15s before the API listens
+            ready_timeout=60,
+        )]
+    ports = [BACKEND_REPLICA_BASE_PORT + i for i in range(replicas)]
+    backends = [
+        Service(
+            f"backend-{i}", f"Backend #{i}", "npm start", cwd="backend",
+            url=f"http://127.0.0.1:{port}",
+            health_url=f"http://127.0.0.1:{port}/health",
+            ready_timeout=60,
+            env={"PORT": str(port), "ALERT_FANOUT": "changestream"},
+        )
+        for i, port in enumerate(ports, 1)
+    ]
+    command = [sys.executable, "backend_proxy.py", "--port", "4000",
+               "--admin-port", str(BACKEND_PROXY_ADMIN_PORT)]
+    for port in ports:
+        command += ["--upstream", str(port)]
+    # The proxy keeps the "backend" name so dependents wait on the public :4000
+    proxy = Service(
+        "backend", "Backend API", command,
+        url="http://127.0.0.1:4000",
+        # /health is proxied, so this passes once a replica is in rotation
+        health_url="http://127.0.0.1:4000/health",
+        depends_on=[b.name for b in backends],
+        ready_timeout=30,
+    )
+    return backends + [proxy]
+
+
+def build_services(prod=False, backend_replicas=None, dashboard_workers=None):
+    """
+    Return the service definitions managed by the orchestrator
+
+    Args:
+        prod: Serve the prebuilt frontend/dist instead of the Vite dev server,
+            and the dashboard from a prefork worker pool
+        backend_replicas: Run this many backends behind a load balancer
+        dashboard_workers: Dashboard worker processes in prod mode
+            (default: the dashboard's own default)
+    """
+    dashboard = [sys.executable, "app.py"]
+    if prod:
+        dashboard.append("--prefork")
+        if dashboard_workers:
+            dashboard += ["--workers", str(dashboard_workers)]
+    if prod:
+        frontend = Service(
+            "frontend", "Frontend UI",
+            [sys.executable, "static_server.py", os.path.join("frontend", "dist"),
+             "--port", "5173", "--quiet"],
+            url="http://127.0.0.1:5173",
+            health_url="http://127.0.0.1:5173/health",
+        )
+    else:
+        frontend = Service(
+            "frontend", "Frontend UI", "npm run dev", cwd="frontend",
+            url="http://127.0.0.1:5173",
+            health_url="http://127.0.0.1:5173/health",
+        )
+    return build_backend(backend_replicas) + [
+        frontend,
+        Service(
+            "dashboard", "Dashboard", dashboard, cwd="dashboard",
+            url="http://127.0.0.1:5000",
+            health_url="http://127.0.0.1:5000/health",
+            # The dashboard reports backend status, so start it once the API answers
+            depends_on=["backend"],
+            ready_timeout=30,
+        ),
+    ]
+
+
+def format_bytes(size):
+    """Human-readable size for status output"""
+    if size is None:
+        return "n/a"
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+def load_startup_history():
+    """
+    Read the most recent cold-start record for each (service, mode)
+
+    Returns:
+        Dict mapping (service name, mode) to the last recorded entry
+    """
+    latest = {}
+    try:
+        with open(STARTUP_METRICS_FILE) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                latest[(entry.get("service"), entry.get("mode"))] = entry
+    except OSError:
+        pass
+    return latest
+
+
+def record_startup(services, mode):
+    """Append each ready service's cold-start time and RSS to the metrics file"""
+    os.makedirs(STATE_DIR, exist_ok=True)
+    now = time.strftime("%Y-%m-%dT%H:%M:%S%z")
+    with open(STARTUP_METRICS_FILE, "a") as f:
+        for service in services:
+            if service.is_ready:
+                f.write(json.dumps({
+                    "time": now,
+                    "service": service.name,
+                    "mode": mode,
+                    "time_to_ready": round(service.time_to_ready, 3),
+                    "rss_bytes": service.ready_rss,
+                }) + "\n")
+
+
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_tree(root, entries=None):
+    """
+    Hash every file under root (or under the given entries of root)
+
+    Returns:
+        Dict mapping forward-slash relative paths to sha256 hex digests
+    """
+    hashes = {}
+    for entry in entries if entries is not None else ["."]:
+        path = os.path.join(root, entry)
+        if os.path.isfile(path):
+            hashes[entry] = hash_file(path)
+            continue
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                full = os.path.join(dirpath, filename)
+                rel = os.path.normpath(os.path.relpath(full, root)).replace(os.sep, "/")
+                hashes[rel] = hash_file(full)
+    return hashes
+
+
+def frontend_fingerprint():
+    """Single digest over the frontend build inputs (paths and contents)"""
+    digest = hashlib.sha256()
+    for rel, file_hash in sorted(hash_tree(FRONTEND_DIR, FRONTEND_BUILD_INPUTS).items()):
+        digest.update(f"{rel}\0{file_hash}\n".encode())
+    return digest.hexdigest()
+
+
+def load_build_manifest():
+    try:
+        with open(FRONTEND_BUILD_MANIFEST) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def log_build(result, fingerprint, check_seconds, build_seconds=None):
+    os.makedirs(STATE_DIR, exist_ok=True)
+    with open(FRONTEND_BUILD_LOG, "a") as f:
+        f.write(json.dumps({
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "result": result,
+            "fingerprint": fingerprint,
+            "check_seconds": round(check_seconds, 3),
+            "build_seconds": None if build_seconds is None else round(build_seconds, 3),
+        }) + "\n")
+
+
+def ensure_frontend_build(force=False):
+    """
+    Rebuild frontend/dist only when its inputs have changed
+
+    The inputs are fingerprinted into a manifest alongside a hash of every
+    file the build produced. A build is skipped when the fingerprint
+    matches and dist/ still holds exactly those files.
+
+    Args:
+        force: Rebuild even if the manifest says dist/ is current
+
+    Returns:
+        True if dist/ is usable (fresh, or stale after a failed rebuild)
+    """
+    started = time.monotonic()
+    fingerprint = frontend_fingerprint()
+    manifest = load_build_manifest()
+    up_to_date = (
+        not force
+        and manifest.get("fingerprint") == fingerprint
+        and os.path.isdir(FRONTEND_DIST)
+        and hash_tree(FRONTEND_DIST) == manifest.get("outputs")
+    )
+    check_seconds = time.monotonic() - started
+
+    if up_to_date:
+        saved = manifest.get("build_seconds")
+        saved_text = f", saved ~{saved:.1f}s" if saved else ""
+        print(f"📦 Frontend build cache {colorize('hit', Colors.GREEN)} "
+              f"({fingerprint[:12]}, checked in {check_seconds:.2f}s{saved_text})")
+        log_build("hit", fingerprint, check_seconds)
+        return True
+
+    reason = "forced" if force else ("no manifest" if not manifest else "inputs changed")
+    print(f"📦 Frontend build cache {colorize('miss', Colors.YELLOW)} ({reason}), running vite build...")
+    build_started = time.monotonic()
+    command = "npm run build"
+    try:
+        result = subprocess.run(
+            command if sys.platform == "win32" else command.split(),
+            cwd=FRONTEND_DIR,
+            shell=sys.platform == "win32",
+        )
+        returncode = result.returncode
+    except OSError as e:
+        print(colorize(f"❌ Could not run {command}: {e}", Colors.RED))
+        returncode = None
+    build_seconds = time.monotonic() - build_started
+
+    if returncode != 0:
+        log_build("error", fingerprint, check_seconds, build_seconds)
+        if os.path.isfile(os.path.join(FRONTEND_DIST, "index.html")):
+            print(colorize("⚠️  Frontend build failed, serving the existing (possibly stale) dist/", Colors.YELLOW))
+            return True
+        print(colorize("❌ Frontend build failed and there is no dist/ to fall back to", Colors.RED))
+        return False
+
+    os.makedirs(STATE_DIR, exist_ok=True)
+    with open(FRONTEND_BUILD_MANIFEST, "w") as f:
+        json.dump({
+            "fingerprint": fingerprint,
+            "built_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "build_seconds": round(build_seconds, 3),
+            "outputs": hash_tree(FRONTEND_DIST),
+        }, f, indent=2, sort_keys=True)
+    log_build("miss", fingerprint, check_seconds, build_seconds)
+    print(f"📦 Frontend built in {colorize(f'{build_seconds:.2f}s', Colors.CYAN)}")
+    return True
+
+
+def validate_dependencies(services):
+    """
+    Check that every dependency exists and that there are no cycles
+
+    Raises:
+        ValueError: If a dependency is unknown or the graph has a cycle
+    """
+    by_name = {s.name: s for s in services}
+    for service in services:
+        for dep in service.depends_on:
+            if dep not in by_name:
+                raise ValueError(f"{service.name} depends on unknown service '{dep}'")
+
+    visiting, done = set(), set()
+
+    def visit(name, path):
+        if name in done:
+            return
+        if name in visiting:
+            raise ValueError("Dependency cycle: " + " -> ".join(path + [name]))
+        visiting.add(name)
+        for dep in by_name[name].depends_on:
+            visit(dep, path + [name])
+        visiting.discard(name)
+        done.add(name)
+
+    for service in services:
+        visit(service.name, [])
+
+
+def probe(url, timeout=PROBE_TIMEOUT):
+    """Return True if url answers with a 2xx/3xx status"""
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return 200 <= response.status < 400
+    except (urllib.error.URLError, OSError, ValueError):
+        return False
+
+
+def start_service(service):
+    """
+    Start a service and track its process
+
+    Args:
+        service: Service to launch
+
     Returns:
-        subprocess.Popen object
+        subprocess.Popen object, or None if the process could not be spawned
     """
+    name = service.label
+    command = service.command
+    cwd = service.cwd
     print(f"🚀 Starting {colorize(name, Colors.CYAN)}...")
+    capture = {}
+    if service.env:
+        capture["env"] = dict(os.environ, **service.env)
+    if log_capture is not None:
+        capture.update(stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
     
     try:
         # Handle Windows vs Unix command differences
@@ -102,19 +894,28 @@ def start_service(name, command, cwd=None):
                 command,
                 cwd=cwd,
                 shell=True,
-                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP
+                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,
+                **capture
             )
         else:
             # On Unix, prefer shell=False with list commands
             if isinstance(command, str):
                 command = command.split()
+            if service.profile:
+                command = service.profile.wrap(command)
+            # Own session/process group so shutdown can signal the whole tree
             process = subprocess.Popen(
                 command,
                 cwd=cwd,
-                shell=False
+                shell=False,
+                start_new_session=True,
+                **capture
             )
         
-        processes.append(process)
+        if log_capture is not None:
+            log_capture.attach(service, process)
+        service.process = process
+        service.started_at = time.monotonic()
         print(f"✅ {colorize(name, Colors.GREEN)} started {colorize(f'(PID: {process.pid})', Colors.CYAN)}")
         return process
         
@@ -122,8 +923,966 @@ def start_service(name, command, cwd=None):
         print(colorize(f"❌ Failed to start {name}: {e}", Colors.RED))
         return None
 
+def wait_until_ready(service, process):
+    """
+    Poll a service's health URL until it answers, its process exits or it times out
+
+    Returns:
+        True if the service became ready
+    """
+    if not service.health_url:
+        return True
+
+    deadline = time.monotonic() + service.ready_timeout
+    interval = PROBE_INTERVAL_MIN
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return False
+        if probe(service.health_url):
+            return True
+        time.sleep(interval)
+        interval = min(interval * 2, PROBE_INTERVAL_MAX)
+    return False
+
+class ChildWatcher:
+    """
+    Report child process exits as they happen, without polling
+
+    On Linux each child gets a pidfd and a single thread blocks in a
+    selector until one of them becomes readable. Elsewhere (or on kernels
+    without pidfd_open) a waiter thread blocks in wait() for each child.
+
+    Args:
+        on_exit: Called as on_exit(service, process) after the child is reaped
+    """
+
+    def __init__(self, on_exit):
+        self.on_exit = on_exit
+        self._selector = None
+        if hasattr(os, "pidfd_open"):
+            self._selector = selectors.DefaultSelector()
+            self._wakeup_r, self._wakeup_w = os.pipe()
+            self._selector.register(self._wakeup_r, selectors.EVENT_READ)
+            self._pending = []
+            self._lock = threading.Lock()
+            threading.Thread(target=self._run, name="child-watcher", daemon=True).start()
+
+    def watch(self, service, process):
+        """Start watching a freshly spawned process"""
+        if self._selector is not None:
+            try:
+                pidfd = os.pidfd_open(process.pid)
+            except OSError:
+                pass
+            else:
+                with self._lock:
+                    self._pending.append((pidfd, service, process))
+                os.write(self._wakeup_w, b"x")
+                return
+        threading.Thread(target=self._wait, args=(service, process),
+                         name=f"wait-{service.name}", daemon=True).start()
+
+    def _wait(self, service, process):
+        process.wait()
+        self.on_exit(service, process)
+
+    def _run(self):
+        while True:
+            for key, _ in self._selector.select():
+                if key.fd == self._wakeup_r:
+                    os.read(self._wakeup_r, 4096)
+                    with self._lock:
+                        pending, self._pending = self._pending, []
+                    for pidfd, service, process in pending:
+                        self._selector.register(pidfd, selectors.EVENT_READ, (service, process))
+                    continue
+                service, process = key.data
+                self._selector.unregister(key.fd)
+                os.close(key.fd)
+                process.wait()
+                self.on_exit(service, process)
+
+class RotatingLogFile:
+    """Append-only log file that rotates to .1, .2, ... once it passes max_bytes"""
+
+    def __init__(self, path, max_bytes=LOG_FILE_MAX_BYTES, backups=LOG_FILE_BACKUPS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._file = open(path, "ab")
+        self._size = self._file.tell()
+
+    def write(self, data):
+        if self._size + len(data) > self.max_bytes and self._size > 0:
+            self._rotate()
+        self._file.write(data)
+        self._size += len(data)
+
+    def flush(self):
+        self._file.flush()
+
+    def _rotate(self):
+        self._file.close()
+        for index in range(self.backups - 1, 0, -1):
+            older = f"{self.path}.{index}"
+            if os.path.exists(older):
+                os.replace(older, f"{self.path}.{index + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = open(self.path, "ab")
+        self._size = 0
+
+class LogMultiplexer:
+    """
+    Capture every service's stdout/stderr without ever blocking a writer
+
+    One thread reads all child pipes (non-blocking, through a selector) and
+    turns them into timestamped lines. Each line goes to the service's ring
+    buffer, to a size-rotated file under LOG_DIR and to a bounded console
+    queue drained by a separate writer thread, so a slow terminal can only
+    cause dropped console lines, never a stalled child. On Windows, where
+    pipes can't be selected, each pipe gets its own reader thread instead.
+    """
+
+    def __init__(self, log_dir=LOG_DIR, echo=True):
+        self.log_dir = log_dir
+        self.echo = echo
+        self._files = {}
+        self._clock = (None, "", "")
+        self._console = queue.Queue(maxsize=CONSOLE_QUEUE_LINES)
+        self._dropped = 0
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pending = []
+        os.makedirs(log_dir, exist_ok=True)
+        if echo:
+            threading.Thread(target=self._write_console, name="log-console", daemon=True).start()
+        self._selector = None
+        if sys.platform != "win32":
+            self._selector = selectors.DefaultSelector()
+            self._wakeup_r, self._wakeup_w = os.pipe()
+            self._selector.register(self._wakeup_r, selectors.EVENT_READ)
+            threading.Thread(target=self._run, name="log-mux", daemon=True).start()
+
+    def attach(self, service, process):
+        """Start capturing a freshly spawned process's output"""
+        for stream, pipe in (("stdout", process.stdout), ("stderr", process.stderr)):
+            if self._selector is None:
+                threading.Thread(target=self._read_blocking, args=(service, stream, pipe),
+                                 name=f"log-{service.name}-{stream}", daemon=True).start()
+                continue
+            os.set_blocking(pipe.fileno(), False)
+            with self._lock:
+                self._pending.append((service, stream, pipe))
+        if self._selector is not None:
+            os.write(self._wakeup_w, b"x")
+
+    def _run(self):
+        partial = {}
+        while True:
+            for key, _ in self._selector.select():
+                if key.fd == self._wakeup_r:
+                    os.read(self._wakeup_r, 4096)
+                    with self._lock:
+                        pending, self._pending = self._pending, []
+                    for service, stream, pipe in pending:
+                        partial[pipe.fileno()] = b""
+                        self._selector.register(pipe, selectors.EVENT_READ, (service, stream))
+                    continue
+                service, stream = key.data
+                fd = key.fd
+                try:
+                    chunk = os.read(fd, 65536)
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    chunk = b""
+                if not chunk:
+                    self._selector.unregister(fd)
+                    if partial.get(fd):
+                        self._emit(service, stream, partial[fd])
+                    partial.pop(fd, None)
+                    key.fileobj.close()
+                    continue
+                partial[fd] = self._split(service, stream, partial[fd] + chunk)
+            self._flush_files()
+
+    def _read_blocking(self, service, stream, pipe):
+        buffered = b""
+        for chunk in iter(lambda: pipe.read1(65536), b""):
+            # Reader threads share the log files, so serialise their writes
+            with self._write_lock:
+                buffered = self._split(service, stream, buffered + chunk)
+                self._flush_files()
+        if buffered:
+            with self._write_lock:
+                self._emit(service, stream, buffered)
+        pipe.close()
+
+    def _split(self, service, stream, data):
+        """Emit every complete line in data and return the unfinished tail"""
+        *lines, tail = data.split(b"\n")
+        for line in lines:
+            self._emit(service, stream, line)
+        while len(tail) > LOG_MAX_LINE:
+            self._emit(service, stream, tail[:LOG_MAX_LINE])
+            tail = tail[LOG_MAX_LINE:]
+        return tail
+
+    def _emit(self, service, stream, raw):
+        text = raw.rstrip(b"\r").decode("utf-8", errors="replace")
+        now = time.time()
+        second = int(now)
+        if second != self._clock[0]:
+            local = time.localtime(second)
+            self._clock = (second, time.strftime("%Y-%m-%d", local), time.strftime("%H:%M:%S", local))
+        stamp = f"{self._clock[2]}.{int(now % 1 * 1000):03d}"
+        service.log_ring.append(f"{stamp} {stream} {text}")
+        self._file_for(service).write(f"{self._clock[1]}T{stamp} {stream} {text}\n".encode("utf-8"))
+        if self.echo:
+            prefix = colorize(f"{stamp} {service.name:<10}|", Colors.RED if stream == "stderr" else Colors.BLUE)
+            try:
+                self._console.put_nowait(f"{prefix} {text}")
+            except queue.Full:
+                with self._lock:
+                    self._dropped += 1
+
+    def _file_for(self, service):
+        log_file = self._files.get(service.name)
+        if log_file is None:
+            log_file = RotatingLogFile(os.path.join(self.log_dir, f"{service.name}.log"))
+            self._files[service.name] = log_file
+        return log_file
+
+    def _flush_files(self):
+        for log_file in list(self._files.values()):
+            log_file.flush()
+
+    def _write_console(self):
+        while True:
+            line = self._console.get()
+            with self._lock:
+                dropped, self._dropped = self._dropped, 0
+            try:
+                if dropped:
+                    sys.stdout.write(colorize(f"... {dropped} log line(s) dropped from console "
+                                              f"(see {self.log_dir})\n", Colors.YELLOW))
+                sys.stdout.write(line + "\n")
+                sys.stdout.flush()
+            except (OSError, ValueError):
+                pass
+
+    def tail(self, service, lines=20):
+        """Return the last lines captured for a service"""
+        return list(service.log_ring)[-lines:]
+
+class Supervisor:
+    """
+    Start services in dependency order and keep them running
+
+    All state changes happen on the thread that calls run(), driven by a
+    queue of events posted by the child watcher and readiness probes, so
+    the loop sleeps until something actually happens. Crashed services are
+    restarted with exponential backoff until they exhaust their restart
+    budget, at which point they are marked failed.
+
+    Args:
+        services: Services to supervise
+        on_settled: Called once, after every service's first launch attempt
+    """
+
+    def __init__(self, services, on_settled=None):
+        validate_dependencies(services)
+        self.services = services
+        self.by_name = {s.name: s for s in services}
+        self.on_settled = on_settled
+        self.events = queue.Queue()
+        self.watcher = ChildWatcher(self._child_exited)
+        self._settled_reported = False
+        self._thread = None
+
+    def _child_exited(self, service, process):
+        self.events.put(("exit", service, process))
+
+    def call(self, fn):
+        """
+        Run fn on the supervisor thread and return its result
+
+        Other threads (e.g. a rolling restart) use this to change service
+        state without racing the event loop.
+
+        Raises:
+            Whatever fn raised
+        """
+        if threading.current_thread() is self._thread:
+            return fn()
+        reply = queue.Queue(maxsize=1)
+        self.events.put(("call", fn, reply))
+        ok, result = reply.get()
+        if not ok:
+            raise result
+        return result
+
+    def _probe(self, service, process):
+        ok = wait_until_ready(service, process)
+        self.events.put(("ready" if ok else "not_ready", service, process))
+
+    def spawn(self, service):
+        """Launch a service and start probing it for readiness"""
+        service.error = None
+        service.ready_at = None
+        if service.port and not port_is_free(service.port):
+            # Something outside the orchestrator holds the port; probing would
+            # report that process as ready
+            service.error = f"port {service.port} is already in use"
+            print(colorize(f"❌ {service.label}: {service.error}", Colors.RED))
+            self._crashed(service)
+            return
+        process = start_service(service)
+        if process is None:
+            service.error = "failed to spawn"
+            self._crashed(service)
+            return
+        service.state = STARTING
+        self.watcher.watch(service, process)
+        threading.Thread(target=self._probe, args=(service, process),
+                         name=f"probe-{service.name}", daemon=True).start()
+
+    def _start_unblocked(self):
+        """Spawn every pending service whose dependencies are all ready"""
+        for service in self.services:
+            if service.state == PENDING and all(
+                    self.by_name[dep].is_ready for dep in service.depends_on):
+                self.spawn(service)
+
+    def _crashed(self, service):
+        """Schedule a restart with backoff, or give up once the budget is spent"""
+        now = time.monotonic()
+        while service.restart_times and now - service.restart_times[0] > RESTART_WINDOW:
+            service.restart_times.popleft()
+
+        if len(service.restart_times) >= RESTART_BUDGET:
+            service.state = FAILED
+            service.restart_at = None
+            print(colorize(f"❌ {service.label} crashed {RESTART_BUDGET} times within "
+                           f"{RESTART_WINDOW:.0f}s, giving up", Colors.RED))
+        else:
+            delay = min(RESTART_BACKOFF_MIN * 2 ** len(service.restart_times), RESTART_BACKOFF_MAX)
+            service.restart_times.append(now)
+            service.state = BACKOFF
+            service.restart_at = now + delay
+            print(colorize(f"🔁 Restarting {service.label} in {delay:.1f}s", Colors.YELLOW))
+        self._settle(service)
+
+    def _settle(self, service):
+        """Record that a service's first launch attempt is over"""
+        service.settled = True
+        if not self._settled_reported and all(s.settled or s.state == PENDING for s in self.services) \
+                and not any(s.state == STARTING for s in self.services):
+            self._settled_reported = True
+            if self.on_settled:
+                self.on_settled(self.services)
+
+    def handle(self, event, service, process):
+        if process is not service.process:
+            return  # stale event from an earlier incarnation
+
+        if event == "ready":
+            service.state = READY
+            service.ready_at = time.monotonic()
+            service.ready_rss = group_rss(process)
+            print(f"💚 {colorize(service.label, Colors.GREEN)} is ready "
+                  f"{colorize(f'({service.time_to_ready:.2f}s)', Colors.CYAN)}")
+            self._start_unblocked()
+            self._settle(service)
+        elif event == "not_ready":
+            if process.poll() is None:
+                # Alive but never answered: kill it so the exit path restarts it
+                service.error = f"not ready after {service.ready_timeout}s ({service.health_url})"
+                print(colorize(f"❌ {service.label} {service.error}", Colors.RED))
+                signal_group(process, force=True)
+        elif event == "exit" and service.state == RETIRING:
+            signal_group(process, force=True)
+        elif event == "exit":
+            # npm may have died while node still holds the port; clear the
+            # whole group so the restart can bind it
+            signal_group(process, force=True)
+            code = process.returncode
+            if service.state == STARTING:
+                service.error = service.error or f"exited with code {code} before becoming ready"
+            else:
+                service.error = f"exited with code {code}"
+            print(colorize(f"⚠️  {service.label} (PID {process.pid}) {service.error}", Colors.YELLOW))
+            if log_capture is not None:
+                print(colorize(f"   Full output: {os.path.join(log_capture.log_dir, service.name + '.log')}",
+                               Colors.YELLOW))
+            service.restarts += 1
+            self._crashed(service)
+
+    def run(self):
+        """Start everything and supervise until the process is interrupted"""
+        self._thread = threading.current_thread()
+        self._start_unblocked()
+        while True:
+            due = [s.restart_at for s in self.services if s.state == BACKOFF]
+            timeout = max(0.0, min(due) - time.monotonic()) if due else None
+            if sys.platform == "win32":
+                # Lock waits are not interruptible by Ctrl+C on Windows
+                timeout = 1.0 if timeout is None else min(timeout, 1.0)
+            try:
+                event, service, process = self.events.get(timeout=timeout)
+            except queue.Empty:
+                pass
+            else:
+                if event == "call":
+                    fn, reply = service, process
+                    try:
+                        reply.put((True, fn()))
+                    except Exception as e:
+                        reply.put((False, e))
+                else:
+                    self.handle(event, service, process)
+
+            now = time.monotonic()
+            for service in self.services:
+                if service.state == BACKOFF and service.restart_at <= now:
+                    service.restart_at = None
+                    self.spawn(service)
+
+def proxy_admin(method, path, payload=None, timeout=5):
+    """
+    Call the backend proxy's admin API
+
+    Returns:
+        Decoded JSON response
+
+    Raises:
+        RuntimeError: If the proxy can't be reached or rejects the request
+    """
+    data = json.dumps(payload).encode() if payload is not None else None
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{BACKEND_PROXY_ADMIN_PORT}{path}", data=data, method=method,
+        headers={"Content-Type": "application/json"} if data else {})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read())
+    except (urllib.error.URLError, OSError, ValueError, http.client.HTTPException) as e:
+        raise RuntimeError(f"proxy admin {method} {path} failed: {e}")
+
+def db_state(service):
+    """Return mongoose's readyState from a backend's /health/db, or None"""
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{service.port}/health/db",
+                                    timeout=PROBE_TIMEOUT) as response:
+            return json.loads(response.read()).get("state")
+    except (urllib.error.URLError, OSError, ValueError):
+        return None
+
+class RollingRestart:
+    """
+    Replace the backend replicas one at a time without dropping traffic
+
+    For each replica: start a replacement on a spare port, wait for its
+    /health and /health/db, add it to the proxy, drain the old replica
+    (WebSockets are closed gradually, in-flight requests get until the
+    deadline), then stop it. The proxy never has fewer healthy replicas
+    than before, so clients see neither 5xx responses nor a reconnect
+    storm. If a replacement doesn't come up, or the proxy can't add it or
+    drain the old replica, it is taken out and stopped and the old replica
+    keeps serving.
+
+    Args:
+        supervisor: Supervisor running the services
+        report: Called with each progress line
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, supervisor, report=print):
+        self.supervisor = supervisor
+        self.report = report
+
+    def run(self):
+        """
+        Restart every replica in turn
+
+        Returns:
+            True if all replicas were replaced
+        """
+        if not self._lock.acquire(blocking=False):
+            self.report(colorize("⚠️  A rolling restart is already in progress", Colors.YELLOW))
+            return False
+        try:
+            replicas = [s for s in self.supervisor.services
+                        if s.name.startswith("backend-") and s.state != RETIRING]
+            if not replicas:
+                self.report(colorize("❌ Rolling restarts need backend replicas (--backend-replicas N)",
+                                     Colors.RED))
+                return False
+            self.report(colorize(f"🔄 Rolling restart of {len(replicas)} backend replica(s)", Colors.BOLD))
+            started = time.monotonic()
+            for old in replicas:
+                try:
+                    self.replace(old)
+                except ROLLOUT_ERRORS as e:
+                    self.report(colorize(f"❌ {old.label}: {e}; rolling restart stopped", Colors.RED))
+                    return False
+            self.report(colorize(f"✅ Rolling restart finished in {time.monotonic() - started:.2f}s",
+                                 Colors.GREEN))
+            return True
+        finally:
+            self._lock.release()
+
+    def replace(self, old):
+        """
+        Swap one replica for a fresh process
+
+        Raises:
+            RuntimeError, OSError, http.client.HTTPException: If the
+                replacement never became ready, or the proxy couldn't add
+                it or drain the old replica. The replacement is taken out
+                of the proxy and stopped, and the old replica is left in
+                service.
+        """
+        step_started = time.monotonic()
+        new = self.supervisor.call(lambda: self._spawn_replacement(old))
+        registered = False
+        try:
+            self._wait_ready(new)
+            ready_seconds = time.monotonic() - step_started
+            db_seconds = self._wait_db(new, old)
+            # Set before the call: the proxy may add it and still fail to answer
+            registered = True
+            added = proxy_admin("POST", "/upstreams", {"port": new.port})
+            if not added.get("healthy"):
+                raise RuntimeError(f"proxy health check failed for :{new.port}")
+            drain = proxy_admin("POST", f"/upstreams/{old.port}/drain", {"timeout": DRAIN_TIMEOUT},
+                                timeout=DRAIN_TIMEOUT + 10)
+            proxy_admin("DELETE", f"/upstreams/{old.port}")
+        except ROLLOUT_ERRORS:
+            self._roll_back(new, old, registered)
+            raise
+
+        # The old replica is out of the proxy now, so the replacement is the
+        # one serving; record the swap even if stopping the old one fails
+        try:
+            stop_seconds, forced = self._stop(old)
+        finally:
+            self.supervisor.call(lambda: self._swap(old, new))
+
+        how = colorize("SIGKILL", Colors.RED) if forced else "SIGTERM"
+        self.report(
+            f"   {colorize(f'{old.label}:'.ljust(14), Colors.CYAN)} :{old.port} → :{new.port}  "
+            f"ready {ready_seconds:.2f}s · db {db_seconds:.2f}s · "
+            f"drain {drain['seconds']:.2f}s ({drain['websockets_closed']} WebSocket(s), "
+            f"{drain['in_flight']} left in flight) · stop {stop_seconds:.2f}s ({how}) · "
+            f"total {time.monotonic() - step_started:.2f}s")
+
+    def _roll_back(self, new, old, registered):
+        """Take the replacement out of the proxy and stop it; the old replica keeps serving"""
+        if registered:
+            # Re-adding the old replica also undoes a drain that was cut short
+            for method, path, payload in (("DELETE", f"/upstreams/{new.port}", None),
+                                          ("POST", "/upstreams", {"port": old.port})):
+                try:
+                    proxy_admin(method, path, payload)
+                except RuntimeError as e:
+                    self.report(colorize(f"⚠️  Rolling back :{new.port}: {e}", Colors.YELLOW))
+        try:
+            self._stop(new)
+        except RuntimeError as e:
+            self.report(colorize(f"⚠️  Rolling back :{new.port}: {e}", Colors.YELLOW))
+        self.supervisor.call(lambda: self.supervisor.services.remove(new))
+
+    def _spawn_replacement(self, old):
+        used = {s.port for s in self.supervisor.services}
+        port = BACKEND_REPLICA_BASE_PORT
+        while port in used or port == BACKEND_PROXY_ADMIN_PORT or not port_is_free(port):
+            port += 1
+        new = Service(
+            old.name, old.label, old.command, cwd=old.cwd,
+            url=f"http://127.0.0.1:{port}",
+            health_url=f"http://127.0.0.1:{port}/health",
+            ready_timeout=old.ready_timeout,
+            profile=old.profile,
+            env=dict(old.env, PORT=str(port)),
+        )
+        self.supervisor.services.insert(self.supervisor.services.index(old) + 1, new)
+        self.supervisor.spawn(new)
+        return new
+
+    def _wait_ready(self, service):
+        deadline = time.monotonic() + service.ready_timeout + PROBE_TIMEOUT
+        while time.monotonic() < deadline:
+            if service.state == READY:
+                return
+            if service.state == FAILED:
+                break
+            time.sleep(PROBE_INTERVAL_MIN)
+        raise RuntimeError(f"replacement on :{service.port} not ready ({service.error or service.state})")
+
+    def _wait_db(self, new, old):
+        """Wait until the replacement is connected to MongoDB, if the old replica is"""
+        started = time.monotonic()
+        if db_state(old) != 1:
+            return 0.0  # nothing to match; don't hold the restart on a DB outage
+        while time.monotonic() - started < DB_READY_TIMEOUT:
+            if db_state(new) == 1:
+                return time.monotonic() - started
+            time.sleep(PROBE_INTERVAL_MAX / 4)
+        raise RuntimeError(f"replacement on :{new.port} not connected to MongoDB "
+                           f"after {DB_READY_TIMEOUT:.0f}s")
+
+    def _stop(self, service):
+        def retire():
+            service.state = RETIRING
+        self.supervisor.call(retire)
+        results = stop_services([service])
+        if not results:
+            return 0.0, False
+        if results[0][1] is None:
+            raise RuntimeError(f"{service.label} on :{service.port} still running after SIGKILL "
+                               f"(PGID: {service.process.pid})")
+        return results[0][1], results[0][2]
+
+    def _swap(self, old, new):
+        services = self.supervisor.services
+        services.remove(old)
+        self.supervisor.by_name[new.name] = new
+        # A restarted proxy must come back with the current replica set
+        proxy = self.supervisor.by_name.get("backend")
+        if proxy is not None and isinstance(proxy.command, list):
+            command = list(proxy.command)
+            for i in range(1, len(command)):
+                if command[i - 1] == "--upstream" and command[i] == str(old.port):
+                    command[i] = str(new.port)
+            proxy.command = command
+
+def start_rolling_restart(supervisor):
+    """Run a rolling restart in the background (SIGHUP)"""
+    threading.Thread(target=RollingRestart(supervisor).run, name="rolling-restart", daemon=True).start()
+
+def serve_control(supervisor, path=CONTROL_SOCKET):
+    """
+    Accept commands on a local Unix socket
+
+    The only command is "rolling-restart"; progress lines are streamed back
+    and the last line is OK or FAILED.
+
+    Returns:
+        The socket path, or None if control is unavailable
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if os.path.exists(path):
+        probe_sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe_sock.connect(path)
+            print(colorize(f"⚠️  {path} belongs to another running orchestrator; "
+                           "rolling restarts only via SIGHUP", Colors.YELLOW))
+            return None
+        except OSError:
+            os.unlink(path)  # left behind by an orchestrator that was killed
+        finally:
+            probe_sock.close()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(4)
+
+    def handle(conn):
+        with conn:
+            command = conn.makefile("r").readline().strip()
+
+            def report(line):
+                print(line)
+                try:
+                    conn.sendall((line + "\n").encode("utf-8"))
+                except OSError:
+                    pass
+
+            if command == "rolling-restart":
+                ok = RollingRestart(supervisor, report=report).run()
+                report("OK" if ok else "FAILED")
+            else:
+                report(f"FAILED unknown command {command!r}")
+
+    def accept():
+        while True:
+            conn, _ = server.accept()
+            threading.Thread(target=handle, args=(conn,), name="control", daemon=True).start()
+
+    threading.Thread(target=accept, name="control-socket", daemon=True).start()
+    return path
+
+def request_rolling_restart(path=CONTROL_SOCKET):
+    """
+    Ask a running orchestrator for a rolling restart and print its progress
+
+    Returns:
+        Process exit code
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        print(colorize("❌ --rolling-restart needs Unix sockets; send SIGHUP instead", Colors.RED))
+        return 2
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(path)
+    except OSError as e:
+        print(colorize(f"❌ No orchestrator listening on {path}: {e}", Colors.RED))
+        return 2
+    with client:
+        client.sendall(b"rolling-restart\n")
+        last = ""
+        for line in client.makefile("r", encoding="utf-8"):
+            last = line.rstrip("\n")
+            if last not in ("OK", "FAILED"):
+                print(last)
+    return 0 if last == "OK" else 1
+
+class MetricsSampler:
+    """
+    Sample each service's process tree from /proc and serve it to Prometheus
+
+    Every interval the sampler reads /proc/<pid>/stat, status and io for
+    every member of each service's process group, plus the orchestrator
+    itself, and renders the result once. Scrapes just return that text, so
+    they cost nothing beyond the socket write. Linux only.
+
+    Args:
+        services: Services to sample
+        interval: Seconds between samples
+    """
+
+    CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+    def __init__(self, services, interval=METRICS_INTERVAL):
+        self.services = services
+        self.interval = interval
+        self.text = ""
+        self._ticks = {}
+        self._last_sample = None
+        self._stop = threading.Event()
+
+    @staticmethod
+    def available():
+        return os.path.isdir("/proc") and sys.platform.startswith("linux")
+
+    @staticmethod
+    def _read_pid(pid):
+        """Return (cpu_ticks, rss_bytes, threads, fds, read_bytes, write_bytes) or None"""
+        try:
+            with open(f"/proc/{pid}/stat", "rb") as f:
+                fields = f.read().rsplit(b")", 1)[1].split()
+            ticks = int(fields[11]) + int(fields[12])
+            rss = threads = 0
+            with open(f"/proc/{pid}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        rss = int(line.split()[1]) * 1024
+                    elif line.startswith("Threads:"):
+                        threads = int(line.split()[1])
+            fds = len(os.listdir(f"/proc/{pid}/fd"))
+        except (OSError, IndexError, ValueError):
+            return None  # exited mid-sample
+        read_bytes = write_bytes = 0
+        try:
+            with open(f"/proc/{pid}/io") as f:
+                for line in f:
+                    key, _, value = line.partition(":")
+                    if key == "read_bytes":
+                        read_bytes = int(value)
+                    elif key == "write_bytes":
+                        write_bytes = int(value)
+        except OSError:
+            pass  # /proc/<pid>/io needs ptrace access on hardened kernels
+        return ticks, rss, threads, fds, read_bytes, write_bytes
+
+    def sample(self):
+        """Take one sample of every service and re-render the exposition text"""
+        started = time.monotonic()
+        elapsed = started - self._last_sample if self._last_sample else None
+        groups = [("orchestrator", [os.getpid()], 0, 1)]
+        process_groups = scan_process_groups() or {}
+        for service in list(self.services):
+            if service.state == RETIRING:
+                continue  # its replacement reports under the same name
+            members = []
+            if service.process is not None:
+                members = process_groups.get(service.process.pid, [])
+            groups.append((service.name, members, service.restarts, int(service.is_ready)))
+
+        ticks_now = {}
+        rows = []
+        for name, pids, restarts, up in groups:
+            totals = [0.0, 0, 0, 0, 0, 0]
+            for pid in pids:
+                stats = self._read_pid(pid)
+                if stats is None:
+                    continue
+                ticks_now[pid] = stats[0]
+                # New processes count from zero; processes that exited drop out
+                totals[0] += stats[0] - self._ticks.get(pid, 0)
+                for i in range(1, 6):
+                    totals[i] += stats[i]
+            cpu_percent = None
+            if elapsed:
+                cpu_percent = totals[0] / self.CLK_TCK / elapsed * 100
+            rows.append((name, len(pids), cpu_percent, restarts, up, totals[1:]))
+        self._ticks = ticks_now
+        self._last_sample = started
+        self.text = self.render(rows, time.monotonic() - started)
+
+    def render(self, rows, sample_seconds):
+        metrics = [
+            ("up", "gauge", "1 if the service passed its readiness probe", lambda r: r[4]),
+            ("processes", "gauge", "Running processes in the service's process group", lambda r: r[1]),
+            ("cpu_percent", "gauge", "CPU used by the process group since the last sample (100 = one core)",
+             lambda r: None if r[2] is None else round(r[2], 2)),
+            ("rss_bytes", "gauge", "Resident memory of the process group", lambda r: r[5][0]),
+            ("threads", "gauge", "Threads across the process group", lambda r: r[5][1]),
+            ("open_fds", "gauge", "Open file descriptors across the process group", lambda r: r[5][2]),
+            ("io_read_bytes_total", "counter", "Bytes read from storage by running processes", lambda r: r[5][3]),
+            ("io_write_bytes_total", "counter", "Bytes written to storage by running processes", lambda r: r[5][4]),
+            ("restarts_total", "counter", "Times the supervisor has restarted the service", lambda r: r[3]),
+        ]
+        lines = []
+        for suffix, kind, help_text, value in metrics:
+            name = f"coastalwatch_service_{suffix}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for row in rows:
+                v = value(row)
+                if v is not None:
+                    lines.append(f'{name}{{service="{row[0]}"}} {v}')
+        lines.append("# HELP coastalwatch_metrics_sample_seconds Time spent taking the last sample")
+        lines.append("# TYPE coastalwatch_metrics_sample_seconds gauge")
+        lines.append(f"coastalwatch_metrics_sample_seconds {sample_seconds:.6f}")
+        return "\n".join(lines) + "\n"
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.sample()
+            except Exception as e:
+                print(colorize(f"⚠️  Metrics sample failed: {e}", Colors.YELLOW))
+            self._stop.wait(self.interval)
+
+    def serve(self, port, host="127.0.0.1"):
+        """Start sampling and expose /metrics on host:port"""
+        sampler = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = sampler.text.encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=self._run, name="metrics-sampler", daemon=True).start()
+        threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+        return server
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Launch and manage all CoastalWatch services")
+    parser.add_argument(
+        "--prod", action="store_true",
+        help="Serve the prebuilt frontend/dist from a static server instead of the Vite dev server",
+    )
+    parser.add_argument(
+        "--rebuild", action="store_true",
+        help="With --prod, rebuild frontend/dist even if the build cache says it is current",
+    )
+    parser.add_argument(
+        "--metrics-port", type=int, default=METRICS_PORT,
+        help=f"Serve per-service Prometheus metrics on 127.0.0.1:PORT/metrics (0 disables, default {METRICS_PORT})",
+    )
+    parser.add_argument(
+        "--metrics-interval", type=float, default=METRICS_INTERVAL,
+        help=f"Seconds between metrics samples (default {METRICS_INTERVAL:g})",
+    )
+    parser.add_argument(
+        "--backend-replicas", type=int, default=None, metavar="N",
+        help="Run N backend replicas behind a load-balancing proxy on :4000",
+    )
+    parser.add_argument(
+        "--dashboard-workers", type=int, default=None, metavar="N",
+        help="With --prod, run N dashboard worker processes (default: one per core, up to 4)",
+    )
+    parser.add_argument(
+        "--rolling-restart", action="store_true",
+        help="Ask the running orchestrator to restart the backend replicas one at a time, then exit",
+    )
+    parser.add_argument(
+        "--profile", action="append", default=[], metavar="SERVICE:SETTINGS",
+        help="Scheduling profile for a service, e.g. backend:cpus=0-1,nice=0,nofile=65536,as=4G "
+             "(repeatable; Linux only)",
+    )
+    args = parser.parse_args(argv)
+    if args.metrics_interval <= 0:
+        parser.error("--metrics-interval must be greater than 0")
+    return args
+
+def apply_profiles(services, specs):
+    """
+    Attach --profile settings to services, validating each one
+
+    Raises:
+        ValueError: If a spec names an unknown service or can't be applied
+    """
+    by_name = {s.name: s for s in services}
+    for spec in specs:
+        name, sep, settings = spec.partition(":")
+        if not sep:
+            raise ValueError(f"--profile {spec}: expected SERVICE:SETTINGS")
+        if name not in by_name:
+            raise ValueError(f"--profile {spec}: unknown service '{name}' "
+                             f"(one of {', '.join(by_name)})")
+        try:
+            profile = SchedulingProfile.parse(settings)
+            profile.validate()
+        except ValueError as e:
+            raise ValueError(f"--profile {spec}: {e}")
+        by_name[name].profile = profile
+
+def exec_with_profile(argv):
+    """
+    Apply a scheduling profile to this process, then exec the command
+
+    Runs as `run_all.py --exec-profile SETTINGS -- COMMAND...`; the
+    orchestrator starts profiled services this way so that no Python code
+    runs between fork and exec in its own, threaded process.
+    """
+    spec, separator, *command = argv
+    if separator != "--" or not command:
+        sys.exit("usage: run_all.py --exec-profile SETTINGS -- COMMAND...")
+    try:
+        SchedulingProfile.parse(spec).apply()
+        os.execvp(command[0], command)
+    except (OSError, ValueError) as e:
+        sys.exit(f"❌ Could not start {command[0]} with profile {spec}: {e}")
+
 def main():
     """Main orchestrator function"""
+    if sys.argv[1:2] == ["--exec-profile"]:
+        exec_with_profile(sys.argv[2:])
+    args = parse_args()
+    if args.rolling_restart:
+        sys.exit(request_rolling_restart())
+    mode = "prod" if args.prod else "dev"
+    other_mode = "dev" if args.prod else "prod"
     print()
     print(colorize("=" * 60, Colors.BLUE))
     print(colorize("🌊 CoastalWatch Integrated System", Colors.BOLD + Colors.BLUE))
@@ -135,40 +1894,106 @@ def main():
     if sys.platform != "win32":
         signal.signal(signal.SIGTERM, signal_handler)
     
-    # Start backend service
-    start_service("Backend API", "npm start", cwd="backend")
-    time.sleep(2)  # Give backend time to initialize
-    
-    # Start frontend service
-    start_service("Frontend UI", "npm run dev", cwd="frontend")
-    time.sleep(2)  # Give frontend time to initialize
-    
-    # Start dashboard service
-    start_service("Dashboard", [sys.executable, "app.py"], cwd="dashboard")
-    time.sleep(1)  # Give dashboard time to initialize
-    
-    print()
-    print(colorize("=" * 60, Colors.GREEN))
-    print(colorize("✅ All services started successfully!", Colors.BOLD + Colors.GREEN))
-    print(colorize("=" * 60, Colors.GREEN))
-    print()
-    print(colorize("📍 Service URLs:", Colors.BOLD))
-    print(f"   {colorize('Dashboard:', Colors.CYAN)}    {colorize('http://127.0.0.1:5000', Colors.UNDERLINE)}")
-    print(f"   {colorize('Backend API:', Colors.CYAN)}  {colorize('http://127.0.0.1:4000', Colors.UNDERLINE)}")
-    print(f"   {colorize('Frontend UI:', Colors.CYAN)}  {colorize('http://127.0.0.1:5173', Colors.UNDERLINE)}")
-    print()
-    print(colorize("💡 Press Ctrl+C to stop all services", Colors.YELLOW))
-    print(colorize("=" * 60, Colors.GREEN))
-    print()
-    
-    # Keep script running and monitor processes
+    if args.prod and not ensure_frontend_build(force=args.rebuild):
+        sys.exit(1)
+
+    boot_started = time.monotonic()
+    history = load_startup_history()
+
+    def print_banner(services):
+        all_ready = all(s.is_ready for s in services)
+        record_startup(services, mode)
+        boot_elapsed = time.monotonic() - boot_started
+        print()
+        if all_ready:
+            print(colorize("=" * 60, Colors.GREEN))
+            print(colorize("✅ All services are ready!", Colors.BOLD + Colors.GREEN))
+            print(colorize("=" * 60, Colors.GREEN))
+        else:
+            print(colorize("=" * 60, Colors.RED))
+            print(colorize("⚠️  Some services failed to become ready", Colors.BOLD + Colors.RED))
+            print(colorize("=" * 60, Colors.RED))
+        print()
+        print(colorize(f"⏱️  Time to ready ({mode} mode):", Colors.BOLD))
+        for service in services:
+            if service.is_ready:
+                status = colorize(f"{service.time_to_ready:6.2f}s", Colors.GREEN)
+                status += f"  RSS {format_bytes(service.ready_rss):>9}"
+                previous = history.get((service.name, other_mode))
+                if previous:
+                    status += colorize(f"  ({other_mode}: {previous['time_to_ready']:.2f}s, "
+                                       f"{format_bytes(previous.get('rss_bytes'))})", Colors.BLUE)
+            elif service.state == PENDING:
+                status = colorize(f"waiting for {', '.join(service.depends_on)}", Colors.YELLOW)
+            else:
+                status = colorize(f"{service.state}: {service.error}", Colors.RED)
+            print(f"   {colorize(f'{service.label}:'.ljust(14), Colors.CYAN)} {status}")
+        print(f"   {colorize('Total:'.ljust(14), Colors.CYAN)} {boot_elapsed:6.2f}s")
+        print()
+        profiled = [s for s in services if s.profile]
+        if profiled:
+            print(colorize("⚙️  Scheduling profiles (requested → in effect):", Colors.BOLD))
+            for service in profiled:
+                requested = service.profile.describe()
+                if service.process is None or service.process.poll() is not None:
+                    status = colorize("not running", Colors.YELLOW)
+                else:
+                    effective = SchedulingProfile.effective(service.process.pid)
+                    if service.profile.matches(effective):
+                        status = colorize("✔ applied", Colors.GREEN)
+                    else:
+                        status = colorize(f"✘ {effective.describe() if effective else 'unreadable'}", Colors.RED)
+                print(f"   {colorize(f'{service.label}:'.ljust(14), Colors.CYAN)} {requested}  {status}")
+            print()
+        print(colorize("📍 Service URLs:", Colors.BOLD))
+        for service in services:
+            print(f"   {colorize(f'{service.label}:'.ljust(14), Colors.CYAN)} {colorize(service.url, Colors.UNDERLINE)}")
+        if metrics_url:
+            print(f"   {colorize('Metrics:'.ljust(14), Colors.CYAN)} {colorize(metrics_url, Colors.UNDERLINE)}")
+        if args.backend_replicas:
+            proxy_metrics = f"http://127.0.0.1:{BACKEND_PROXY_ADMIN_PORT}/metrics"
+            print(f"   {colorize('Proxy metrics:'.ljust(14), Colors.CYAN)} {colorize(proxy_metrics, Colors.UNDERLINE)}")
+        print()
+        print(colorize("💡 Press Ctrl+C to stop all services", Colors.YELLOW))
+        print(colorize("=" * 60, Colors.GREEN if all_ready else Colors.RED))
+        print()
+
+    global log_capture, control_socket
+    log_capture = LogMultiplexer()
+    if args.backend_replicas is not None and args.backend_replicas < 1:
+        print(colorize("❌ --backend-replicas must be at least 1", Colors.RED))
+        sys.exit(2)
+    if args.dashboard_workers is not None and (args.dashboard_workers < 1 or not args.prod):
+        print(colorize("❌ --dashboard-workers needs --prod and must be at least 1", Colors.RED))
+        sys.exit(2)
+    services.extend(build_services(prod=args.prod, backend_replicas=args.backend_replicas,
+                                   dashboard_workers=args.dashboard_workers))
     try:
-        while True:
-            time.sleep(1)
-            # Check if any process has died unexpectedly
-            for i, p in enumerate(processes):
-                if p.poll() is not None:
-                    print(colorize(f"⚠️  Service process {p.pid} has stopped unexpectedly", Colors.YELLOW))
+        apply_profiles(services, args.profile)
+    except ValueError as e:
+        print(colorize(f"❌ {e}", Colors.RED))
+        sys.exit(2)
+
+    metrics_url = None
+    if args.metrics_port:
+        if MetricsSampler.available():
+            try:
+                MetricsSampler(services, args.metrics_interval).serve(args.metrics_port)
+                metrics_url = f"http://127.0.0.1:{args.metrics_port}/metrics"
+            except OSError as e:
+                print(colorize(f"⚠️  Metrics endpoint disabled: {e}", Colors.YELLOW))
+        else:
+            print(colorize("⚠️  Metrics need /proc (Linux); endpoint disabled", Colors.YELLOW))
+    supervisor = Supervisor(services, on_settled=print_banner)
+    if args.backend_replicas:
+        if sys.platform != "win32":
+            signal.signal(signal.SIGHUP, lambda sig, frame: start_rolling_restart(supervisor))
+        try:
+            control_socket = serve_control(supervisor)
+        except OSError as e:
+            print(colorize(f"⚠️  Control socket disabled: {e}", Colors.YELLOW))
+    try:
+        supervisor.run()
     except KeyboardInterrupt:
         signal_handler(None, None)
 
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+CoastalWatch Static Server
+Serves the prebuilt frontend (frontend/dist) for production mode
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import posixpath
+import re
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+try:
+    import brotli
+except ImportError:  # listed in requirements.txt; without it only gzip is served
+    brotli = None
+
+# Vite emits content-hashed names such as index-BSFJNZnu.js
+HASHED_NAME = re.compile(r"-[A-Za-z0-9_-]{8,}\.[A-Za-z0-9]+$")
+
+# Hashed files never change under the same name, so browsers may keep them forever
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+# Everything else (index.html, vite.svg) must be revalidated on each load
+REVALIDATE_CACHE = "no-cache"
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/javascript",
+    "application/json",
+    "application/xml",
+    "image/svg+xml",
+)
+
+# Files smaller than this are sent as-is; compression would not pay off
+MIN_COMPRESS_SIZE = 1024
+
+
+class Asset:
+    """A file from the dist directory held in memory with its encoded variants"""
+
+    def __init__(self, path, url_path):
+        with open(path, "rb") as f:
+            self.body = f.read()
+        self.content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        if self.content_type.startswith("text/") or self.content_type == "application/javascript":
+            self.content_type += "; charset=utf-8"
+        self.etag = '"' + hashlib.blake2b(self.body, digest_size=12).hexdigest() + '"'
+        self.cache_control = IMMUTABLE_CACHE if HASHED_NAME.search(url_path) else REVALIDATE_CACHE
+        self.encodings = {}
+        if self.compressible:
+            self._load_variants(path)
+
+    @property
+    def compressible(self):
+        return len(self.body) >= MIN_COMPRESS_SIZE and self.content_type.startswith(COMPRESSIBLE_TYPES)
+
+    def _load_variants(self, path):
+        """Use .br/.gz files written by the build if present, otherwise compress once now"""
+        for encoding, suffix in (("br", ".br"), ("gzip", ".gz")):
+            if os.path.isfile(path + suffix):
+                with open(path + suffix, "rb") as f:
+                    self.encodings[encoding] = f.read()
+        if "gzip" not in self.encodings:
+            self.encodings["gzip"] = gzip.compress(self.body, compresslevel=9, mtime=0)
+        if "br" not in self.encodings and brotli is not None:
+            self.encodings["br"] = brotli.compress(self.body, quality=11)
+        # Never send a variant that came out larger than the original
+        self.encodings = {k: v for k, v in self.encodings.items() if len(v) < len(self.body)}
+
+
+def load_assets(root):
+    """
+    Read every file under root into memory
+
+    Returns:
+        Dict mapping URL paths (e.g. "/assets/index-BSFJNZnu.js") to Assets
+    """
+    assets = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if filename.endswith((".gz", ".br")):
+                continue
+            path = os.path.join(dirpath, filename)
+            url_path = "/" + os.path.relpath(path, root).replace(os.sep, "/")
+            assets[url_path] = Asset(path, url_path)
+    return assets
+
+
+def accepted_encodings(header):
+    """Parse Accept-Encoding into the set of codings the client takes"""
+    accepted = set()
+    for part in (header or "").split(","):
+        coding, _, params = part.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def etag_matches(header, etag):
+    """
+    Whether an If-None-Match header matches etag
+
+    The header may be "*" or a comma-separated list of entity tags. Tags
+    are compared weakly (RFC 9110 13.1.2), so W/"x" matches "x".
+    """
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+class StaticHandler(BaseHTTPRequestHandler):
+    """Serve preloaded assets with caching headers and an SPA fallback"""
+
+    server_version = "CoastalWatchStatic/1.0"
+    protocol_version = "HTTP/1.1"
+    assets = {}
+    quiet = False
+
+    def do_HEAD(self):
+        self.do_GET(head=True)
+
+    def do_GET(self, head=False):
+        path = posixpath.normpath(unquote(urlsplit(self.path).path))
+        if path == "/health":
+            return self._send_json({"status": "ok"}, head)
+
+        asset = self.assets.get(path)
+        if asset is None and path in ("/", "/."):
+            asset = self.assets.get("/index.html")
+        if asset is None and not posixpath.splitext(path)[1]:
+            # Client-side route (e.g. /alerts): let the React router handle it
+            asset = self.assets.get("/index.html")
+        if asset is None:
+            return self._send_json({"message": "Not found"}, head, status=404)
+
+        if etag_matches(self.headers.get("If-None-Match"), asset.etag):
+            self.send_response(304)
+            self.send_header("ETag", asset.etag)
+            self.send_header("Cache-Control", asset.cache_control)
+            self.end_headers()
+            return
+
+        body, encoding = asset.body, None
+        accepted = accepted_encodings(self.headers.get("Accept-Encoding"))
+        for candidate in ("br", "gzip"):
+            if candidate in accepted and candidate in asset.encodings:
+                body, encoding = asset.encodings[candidate], candidate
+                break
+
+        self.send_response(200)
+        self.send_header("Content-Type", asset.content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", asset.cache_control)
+        self.send_header("ETag", asset.etag)
+        if asset.encodings:
+            self.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def _send_json(self, payload, head, status=200):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a prebuilt Vite dist directory")
+    parser.add_argument("root", help="Directory to serve (e.g. frontend/dist)")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=5173)
+    parser.add_argument("--quiet", action="store_true", help="Don't log each request")
+    args = parser.parse_args()
+
+    if not os.path.isfile(os.path.join(args.root, "index.html")):
+        print(f"❌ {args.root} has no index.html; build the frontend first", file=sys.stderr)
+        sys.exit(1)
+
+    started = time.monotonic()
+    StaticHandler.assets = load_assets(args.root)
+    StaticHandler.quiet = args.quiet
+    server = ThreadingHTTPServer((args.host, args.port), StaticHandler)
+    server.daemon_threads = True
+
+    total = sum(len(a.body) for a in StaticHandler.assets.values())
+    print(f"✅ Serving {len(StaticHandler.assets)} files ({total / 1024:.1f} KiB) from {args.root} "
+          f"on http://{args.host}:{args.port} (loaded in {time.monotonic() - started:.2f}s"
+          f"{', brotli disabled' if brotli is None else ''})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
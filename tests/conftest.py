@@ -0,0 +1,80 @@
+"""
+Shared fixtures for the CoastalWatch integration suite
+
+run_all.py is started once per session and every test reuses it through
+the `stack` fixture. Checks that only read a page go through `pages`,
+which fetches all of them concurrently as soon as the stack is ready.
+Hermetic tests use `fake_backend` instead and never touch the stack.
+Constants and helpers the test modules share are in helpers.py.
+"""
+
+import asyncio
+import time
+
+import aiohttp
+import pytest
+
+from helpers import (ENDPOINTS, PAGES, STACK_TIMEOUT, Page, Stack, start_orchestrator,
+                     stop_orchestrator, timings)
+from readiness import wait_ready
+from fake_backend import FakeBackend
+
+
+@pytest.fixture(scope="session")
+def stack(tmp_path_factory):
+    """Boot the whole stack once for the session"""
+    log_path = tmp_path_factory.mktemp("stack") / "run_all.log"
+    with open(log_path, "wb") as log:
+        started = time.monotonic()
+        process = start_orchestrator(log)
+        try:
+            readiness = wait_ready(ENDPOINTS, timeout=STACK_TIMEOUT)
+            timings["boot"] = time.monotonic() - started
+            timings["ready"] = {name: r.seconds for name, r in readiness.items()}
+            running = Stack(process, log_path, readiness)
+            failed = [f"{r.name}: {r.error}" for r in readiness.values() if not r.ready]
+            if failed:
+                pytest.fail(f"stack not ready within {STACK_TIMEOUT}s ({'; '.join(failed)})\n"
+                            f"{running.log_tail()}")
+            yield running
+            running.session.close()
+        finally:
+            stop_orchestrator(process)
+
+
+@pytest.fixture(scope="session")
+def pages(stack):
+    """Fetch every page in PAGES concurrently; returns a dict of URL to Page"""
+
+    async def fetch_all():
+        async with aiohttp.ClientSession() as session:
+            async def fetch(url):
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                    return url, Page(response.status, dict(response.headers), await response.text())
+            return dict(await asyncio.gather(*(fetch(url) for url in PAGES)))
+
+    return asyncio.run(fetch_all())
+
+
+@pytest.fixture
+def fake_backend():
+    """A fresh in-memory backend on an ephemeral port (no Node, no MongoDB)"""
+    with FakeBackend() as backend:
+        yield backend
+
+
+def pytest_sessionstart(session):
+    timings["session_started"] = time.monotonic()
+
+
+def pytest_terminal_summary(terminalreporter):
+    elapsed = time.monotonic() - timings.get("session_started", time.monotonic())
+    write = terminalreporter.write_line
+    terminalreporter.section("CoastalWatch timings")
+    if "boot" in timings:
+        ready = ", ".join(f"{name} {seconds:.2f}s" if seconds is not None else f"{name} not ready"
+                          for name, seconds in timings["ready"].items())
+        write(f"stack ready in {timings['boot']:.2f}s ({ready})")
+    for name, seconds in timings["restart"].items():
+        write(f"{name} back after kill in {seconds:.2f}s")
+    write(f"suite wall-clock {elapsed:.2f}s")
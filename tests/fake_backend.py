@@ -0,0 +1,670 @@
+#!/usr/bin/env python3
+"""
+CoastalWatch Fake Backend
+In-process stand-in for the Node backend API, for fast hermetic tests
+
+Serves the same contract as backend/server.js over an in-memory store
+seeded like backend/src/seed/seed.js:
+
+    GET  /, /health, /health/db
+    POST /api/auth/login
+    GET  /api/sensors (keyset pages), GET /api/sensors/export (Admin/Researcher; NDJSON)
+    POST /api/sensors/bulk (Admin/Researcher; NDJSON)
+    GET  /api/alerts (keyset pages), GET /api/alerts/export (Admin/Researcher; NDJSON)
+    POST /api/alerts (Admin/Researcher; broadcasts alert:new)
+    GET  /api/reports, GET /api/reports/rollups, POST /api/reports
+    GET  /api/users (Admin)
+
+No Node, no MongoDB and no network beyond the loopback port it binds.
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import hmac
+import itertools
+import json
+import os
+import random
+import re
+import socket
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlencode
+
+import socketio
+from aiohttp import web
+
+TOKEN_LIFETIME = 8 * 60 * 60
+LIST_LIMIT = 200
+MAX_LIST_LIMIT = 1000
+EXPORT_BATCH = 1000
+SENSOR_FIELDS = ("location", "water_level", "wind_speed", "temperature", "timestamp", "createdAt", "updatedAt")
+ALERT_FIELDS = ("type", "message", "severity", "timestamp", "createdAt", "updatedAt")
+REPORT_LIMIT = 20
+MAX_LINE_LENGTH = 16 * 1024
+MAX_REPORTED_ERRORS = 100
+SENSOR_NUMBERS = ("water_level", "wind_speed", "temperature")
+ROLLUP_SECONDS = {"minute": 60, "hour": 60 * 60, "day": 24 * 60 * 60}
+ROLLUP_LIMIT = 1000
+MAX_ROLLUP_LIMIT = 10000
+SEVERITIES = ("low", "medium", "high", "critical")
+
+# seed.js users: (username, password, role)
+SEED_USERS = [
+    ("admin", "admin123", "Admin"),
+    ("research", "research123", "Researcher"),
+    ("public", "public123", "Public"),
+]
+SEED_ALERTS = [
+    ("Tide", "High tide approaching", "medium"),
+    ("Storm", "Strong winds detected offshore", "high"),
+]
+
+
+def iso(moment):
+    """Format a datetime the way Express serialises a JS Date"""
+    return moment.astimezone(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def b64url(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def b64url_decode(text):
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def sign_token(payload, secret):
+    """Create an HS256 JWT, as jsonwebtoken.sign does"""
+    header = b64url(json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode())
+    body = b64url(json.dumps(payload, separators=(",", ":")).encode())
+    signature = hmac.new(secret.encode(), f"{header}.{body}".encode(), hashlib.sha256).digest()
+    return f"{header}.{body}.{b64url(signature)}"
+
+
+def verify_token(token, secret):
+    """
+    Check an HS256 JWT's signature and expiry
+
+    Returns:
+        The decoded payload
+
+    Raises:
+        ValueError: If the token is malformed, forged or expired
+    """
+    try:
+        header, body, signature = token.split(".")
+        expected = hmac.new(secret.encode(), f"{header}.{body}".encode(), hashlib.sha256).digest()
+        if not hmac.compare_digest(expected, b64url_decode(signature)):
+            raise ValueError("bad signature")
+        payload = json.loads(b64url_decode(body))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"invalid token: {e}")
+    if payload.get("exp", 0) < time.time():
+        raise ValueError("token expired")
+    return payload
+
+
+def encode_cursor(doc):
+    """The opaque (timestamp, _id) position utils/keyset.js hands out"""
+    return b64url(json.dumps({"t": doc["timestamp"], "id": doc["_id"]}, separators=(",", ":")).encode())
+
+
+def parse_time(text):
+    moment = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+def keyset(docs, query, allowed, newest_first):
+    """
+    Mirror utils/keyset.js: filter by from/to/cursor, order by (timestamp, _id)
+    and project to the requested fields
+
+    Returns:
+        (ordered documents, projection function)
+
+    Raises:
+        ValueError: With the message the backend answers 400 with
+    """
+    low = high = position = None
+    if "from" in query or "to" in query:
+        try:
+            low = iso(parse_time(query["from"])) if "from" in query else None
+            high = iso(parse_time(query["to"])) if "to" in query else None
+        except ValueError:
+            raise ValueError("from and to must be ISO 8601 times")
+    if "cursor" in query:
+        try:
+            cursor = json.loads(b64url_decode(query["cursor"]))
+            position = (iso(parse_time(cursor["t"])), cursor["id"])
+            int(cursor["id"], 16)
+            if len(cursor["id"]) != 24:
+                raise ValueError
+        except (ValueError, TypeError, KeyError):
+            raise ValueError("Invalid cursor")
+    fields = None
+    if query.get("fields"):
+        fields = [f.strip() for f in query["fields"].split(",") if f.strip()]
+        unknown = [f for f in fields if f not in allowed]
+        if unknown:
+            raise ValueError(f"Unknown field(s): {', '.join(unknown)}; choose from {', '.join(allowed)}")
+        fields = ["_id", "timestamp", *fields]
+
+    def keep(doc):
+        key = (doc["timestamp"], doc["_id"])
+        if (low and key[0] < low) or (high and key[0] >= high):
+            return False
+        return position is None or (key < position if newest_first else key > position)
+
+    ordered = sorted(filter(keep, docs), key=lambda d: (d["timestamp"], d["_id"]), reverse=newest_first)
+    project = (lambda doc: {f: doc[f] for f in fields if f in doc}) if fields else (lambda doc: doc)
+    return ordered, project
+
+
+def sensor_fields(line):
+    """
+    Validate one NDJSON reading the way the Sensor schema would
+
+    Returns:
+        (fields, None) with numbers and timestamp cast, or (None, error)
+    """
+    try:
+        body = json.loads(line)
+    except ValueError as e:
+        return None, f"Invalid JSON: {e}"
+    if not isinstance(body, dict):
+        return None, "Expected a JSON object"
+    fields, problems = {}, []
+    if "_id" in body:
+        _id = body["_id"]
+        if isinstance(_id, str) and re.fullmatch(r"[0-9a-f]{24}", _id):
+            fields["_id"] = _id
+        else:
+            problems.append(f'_id: Cast to ObjectId failed for value "{_id}" at path "_id"')
+    location = body.get("location")
+    if location is None or location == "":
+        problems.append("location: Path `location` is required.")
+    else:
+        fields["location"] = str(location)
+    for name in SENSOR_NUMBERS:
+        value = body.get(name)
+        if value is None or value == "":
+            problems.append(f"{name}: Path `{name}` is required.")
+            continue
+        try:
+            fields[name] = float(value)
+        except (TypeError, ValueError):
+            problems.append(f'{name}: Cast to Number failed for value "{value}" at path "{name}"')
+    timestamp = body.get("timestamp")
+    if timestamp is None:
+        fields["timestamp"] = datetime.now(timezone.utc)
+    else:
+        try:
+            if isinstance(timestamp, (int, float)):
+                fields["timestamp"] = datetime.fromtimestamp(timestamp / 1000, timezone.utc)
+            else:
+                fields["timestamp"] = datetime.fromisoformat(str(timestamp).replace("Z", "+00:00"))
+            if fields["timestamp"].tzinfo is None:
+                fields["timestamp"] = fields["timestamp"].replace(tzinfo=timezone.utc)
+        except (ValueError, OverflowError):
+            problems.append(f'timestamp: Cast to date failed for value "{timestamp}" at path "timestamp"')
+    if problems:
+        return None, "Sensor validation failed: " + ", ".join(problems)
+    return fields, None
+
+
+class FakeBackend:
+    """
+    The backend API served from memory on an ephemeral port
+
+    Use it as a context manager, or call start() and stop(). The store is
+    exposed as plain lists of dicts (users, sensors, alerts) so tests can
+    inspect or extend it directly. Sensor rollups are kept up to date by
+    the bulk endpoint; call apply_readings() after appending readings
+    directly.
+
+    Args:
+        port: Port to bind on 127.0.0.1 (0 picks a free one)
+        secret: JWT signing secret
+        seed: Seed for the generated sensor readings
+        db_state: Value reported by /health/db (1 = connected)
+
+    Set bulk_failures to make that many of the next /api/sensors/bulk
+    requests fail with 503, as a lost database connection would. Set
+    bulk_partial_failures to have that many store the first half of their
+    readings before failing the same way. Readings sent with an _id that
+    is already stored are counted as duplicates, as MongoDB's duplicate
+    key error makes the real endpoint do. Set
+    export_drops to cut that many of the next export streams off halfway,
+    mid-line, as a dropped connection would. socket_clients holds the
+    sids of the Socket.io clients connected right now.
+    """
+
+    def __init__(self, port=0, secret="coastalwatch-fake-secret", seed=0, db_state=1):
+        self.port = port
+        self.secret = secret
+        self.db_state = db_state
+        self.reports = []
+        self.bulk_failures = 0
+        self.bulk_partial_failures = 0
+        self.socket_clients = set()
+        self.export_drops = 0
+        self.rollups = {}
+        self.rollups_as_of = None
+        self._ids = itertools.count(1)
+        self._seed(random.Random(seed))
+
+        self.sio = socketio.AsyncServer(async_mode="aiohttp", cors_allowed_origins="*")
+        self.sio.on("connect", self._on_connect)
+        self.sio.on("disconnect", self._on_disconnect)
+        self.app = web.Application()
+        self.sio.attach(self.app)
+        self.app.add_routes([
+            web.get("/", self.root),
+            web.get("/health", self.health),
+            web.get("/health/db", self.health_db),
+            web.post("/api/auth/login", self.login),
+            web.get("/api/sensors", self.list_sensors),
+            web.get("/api/sensors/export", self.export_sensors),
+            web.post("/api/sensors/bulk", self.ingest_sensors),
+            web.get("/api/alerts", self.list_alerts),
+            web.get("/api/alerts/export", self.export_alerts),
+            web.post("/api/alerts", self.create_alert),
+            web.get("/api/reports", self.summary_report),
+            web.get("/api/reports/rollups", self.list_rollups),
+            web.post("/api/reports", self.create_report),
+            web.get("/api/users", self.list_users),
+        ])
+        self._loop = None
+        self._runner = None
+        self._thread = None
+
+    # -- store ---------------------------------------------------------
+
+    def object_id(self):
+        """A 24-hex id shaped like a MongoDB ObjectId"""
+        return f"{int(time.time()):08x}{next(self._ids):016x}"
+
+    def document(self, fields, timestamp=None):
+        now = datetime.now(timezone.utc)
+        doc = {"_id": self.object_id(), **fields}
+        if timestamp is not None:
+            doc["timestamp"] = iso(timestamp)
+        doc.update(createdAt=iso(now), updatedAt=iso(now), __v=0)
+        return doc
+
+    def _seed(self, rng):
+        self.users = [
+            dict(self.document({"username": u, "role": r}), password=p) for u, p, r in SEED_USERS
+        ]
+        now = datetime.now(timezone.utc)
+        self.sensors = [
+            self.document({
+                "location": f"Station-{(i % 5) + 1}",
+                "water_level": 1.2 + rng.random() * 1.5,
+                "wind_speed": 5 + rng.random() * 15,
+                "temperature": 15 + rng.random() * 12,
+            }, timestamp=now - timedelta(hours=i))
+            for i in range(30)
+        ]
+        self.alerts = [
+            self.document({"type": t, "message": m, "severity": s}, timestamp=now)
+            for t, m, s in SEED_ALERTS
+        ]
+        self.apply_readings(self.sensors)
+
+    def apply_readings(self, readings):
+        """Fold readings into the rollups, like src/reports/rollups.js"""
+        for reading in readings:
+            epoch = parse_time(reading["timestamp"]).timestamp()
+            keys = [(reading["location"], name, epoch // seconds * seconds)
+                    for name, seconds in ROLLUP_SECONDS.items()]
+            keys += [(reading["location"], "all", 0), ("*", "all", 0)]
+            for key in keys:
+                stats = self.rollups.setdefault(key, {"count": 0, "sum": dict.fromkeys(SENSOR_NUMBERS, 0),
+                                                      "min": {}, "max": {}})
+                stats["count"] += 1
+                for name in SENSOR_NUMBERS:
+                    value = reading[name]
+                    stats["sum"][name] += value
+                    stats["min"][name] = min(stats["min"].get(name, value), value)
+                    stats["max"][name] = max(stats["max"].get(name, value), value)
+        self.rollups_as_of = iso(datetime.now(timezone.utc))
+
+    @staticmethod
+    def latest(docs, limit):
+        return sorted(docs, key=lambda d: d["timestamp"], reverse=True)[:limit]
+
+    # -- lifecycle -----------------------------------------------------
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self):
+        """Serve on a background thread; returns once the port is bound"""
+        ready = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(self._start())
+            ready.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name="fake-backend", daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self
+
+    async def _start(self):
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("127.0.0.1", self.port))
+        self.port = sock.getsockname()[1]
+        await web.SockSite(self._runner, sock).start()
+
+    async def _shutdown(self):
+        await self._runner.cleanup()
+        # Socket.io keeps ping and service tasks running per connection
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stop(self):
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # -- auth ----------------------------------------------------------
+
+    def authorize(self, request, *roles):
+        """
+        Mirror authenticateJWT + authorizeRoles
+
+        Returns:
+            The token payload, or an error response to return instead
+        """
+        header = request.headers.get("Authorization", "")
+        if not header.startswith("Bearer "):
+            return web.json_response({"message": "Authorization header missing"}, status=401)
+        try:
+            user = verify_token(header.split(" ", 1)[1], self.secret)
+        except ValueError:
+            return web.json_response({"message": "Invalid or expired token"}, status=401)
+        if user.get("role") not in roles:
+            return web.json_response({"message": "Forbidden: insufficient role"}, status=403)
+        return user
+
+    def token_for(self, username):
+        """Issue a token for a seeded user without going through /login"""
+        user = next(u for u in self.users if u["username"] == username)
+        now = int(time.time())
+        return sign_token({"id": user["_id"], "username": user["username"], "role": user["role"],
+                           "iat": now, "exp": now + TOKEN_LIFETIME}, self.secret)
+
+    # -- handlers ------------------------------------------------------
+
+    async def _on_disconnect(self, sid):
+        self.socket_clients.discard(sid)
+
+    async def _on_connect(self, sid, environ):
+        self.socket_clients.add(sid)
+        await self.sio.emit("connection", {"message": "Connected to CoastalWatch alerts"}, to=sid)
+
+    async def root(self, request):
+        return web.json_response({
+            "message": "CoastalWatch Backend API",
+            "version": "1.0.0",
+            "endpoints": {
+                "health": "/health",
+                "auth": "/api/auth",
+                "sensors": "/api/sensors",
+                "alerts": "/api/alerts",
+                "users": "/api/users",
+                "reports": "/api/reports",
+            },
+            "frontend": "http://localhost:5173",
+            "dashboard": "http://localhost:5000",
+        })
+
+    async def health(self, request):
+        return web.json_response({"status": "ok"})
+
+    async def health_db(self, request):
+        text = {0: "disconnected", 1: "connected", 2: "connecting", 3: "disconnecting"}
+        return web.json_response({"state": self.db_state, "stateText": text.get(self.db_state, "unknown")})
+
+    async def login(self, request):
+        body = await request.json()
+        username, password = body.get("username"), body.get("password")
+        if not username or not password:
+            return web.json_response({"message": "Username and password are required"}, status=400)
+        user = next((u for u in self.users if u["username"] == username), None)
+        if user is None or not hmac.compare_digest(user["password"], password):
+            return web.json_response({"message": "Invalid credentials"}, status=401)
+        return web.json_response({
+            "token": self.token_for(username),
+            "user": {"id": user["_id"], "username": user["username"], "role": user["role"]},
+        })
+
+    def page(self, request, docs, allowed):
+        try:
+            ordered, project = keyset(docs, request.query, allowed, newest_first=True)
+        except ValueError as e:
+            return web.json_response({"message": str(e)}, status=400)
+        try:
+            limit = min(max(int(request.query.get("limit", "")) or LIST_LIMIT, 1), MAX_LIST_LIMIT)
+        except ValueError:
+            limit = LIST_LIMIT
+        headers = {}
+        if len(ordered) > limit:
+            cursor = encode_cursor(ordered[limit - 1])
+            params = dict(request.query, cursor=cursor)
+            headers = {"X-Next-Cursor": cursor,
+                       "Link": f'<{request.path.rstrip("/")}?{urlencode(params)}>; rel="next"'}
+        return web.json_response([project(d) for d in ordered[:limit]], headers=headers)
+
+    async def export(self, request, docs, allowed):
+        user = self.authorize(request, "Admin", "Researcher")
+        if isinstance(user, web.Response):
+            return user
+        try:
+            ordered, project = keyset(docs, request.query, allowed, newest_first=False)
+        except ValueError as e:
+            return web.json_response({"message": str(e)}, status=400)
+        response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson", "Cache-Control": "no-store"})
+        await response.prepare(request)
+        if self.export_drops:
+            self.export_drops -= 1
+            half = ordered[:len(ordered) // 2]
+            body = "".join(json.dumps(project(d)) + "\n" for d in half)
+            await response.write(body.encode() + b'{"_id": "cut sh')
+            request.transport.close()
+            return response
+        for start in range(0, len(ordered), EXPORT_BATCH):
+            batch = ordered[start:start + EXPORT_BATCH]
+            await response.write("".join(json.dumps(project(d)) + "\n" for d in batch).encode())
+        await response.write_eof()
+        return response
+
+    async def list_sensors(self, request):
+        return self.page(request, self.sensors, SENSOR_FIELDS)
+
+    async def export_sensors(self, request):
+        return await self.export(request, self.sensors, SENSOR_FIELDS)
+
+    async def ingest_sensors(self, request):
+        user = self.authorize(request, "Admin", "Researcher")
+        if isinstance(user, web.Response):
+            return user
+        if request.content_type != "application/x-ndjson":
+            return web.json_response({"message": "Expected Content-Type: application/x-ndjson"}, status=415)
+        result = {"received": 0, "inserted": 0, "duplicates": 0, "rejected": 0, "errors": []}
+        docs = []
+
+        def reject(line_no, message):
+            result["rejected"] += 1
+            if len(result["errors"]) < MAX_REPORTED_ERRORS:
+                result["errors"].append({"line": line_no, "message": message})
+
+        def accept(line, line_no):
+            if not line.strip():
+                return
+            result["received"] += 1
+            fields, error = sensor_fields(line)
+            if error is not None:
+                return reject(line_no, error)
+            docs.append(self.document(fields, timestamp=fields.pop("timestamp")))
+
+        pending, line_no, overlong = b"", 0, False
+        async for chunk in request.content.iter_any():
+            *lines, pending = (pending + chunk).split(b"\n")
+            for line in lines:
+                line_no += 1
+                if overlong:
+                    overlong = False
+                elif len(line) > MAX_LINE_LENGTH:
+                    result["received"] += 1
+                    reject(line_no, f"Line longer than {MAX_LINE_LENGTH} characters")
+                else:
+                    accept(line, line_no)
+            if len(pending) > MAX_LINE_LENGTH:
+                if not overlong:
+                    result["received"] += 1
+                    reject(line_no + 1, f"Line longer than {MAX_LINE_LENGTH} characters")
+                overlong, pending = True, b""
+        if not overlong and pending:
+            accept(pending, line_no + 1)
+        if self.bulk_failures:
+            self.bulk_failures -= 1
+            return web.json_response(dict(result, message="Bulk insert failed: connection closed"), status=503)
+        failing = self.bulk_partial_failures > 0
+        if failing:
+            self.bulk_partial_failures -= 1
+            docs = docs[:len(docs) // 2]
+        stored, fresh = {s["_id"] for s in self.sensors}, []
+        for doc in docs:
+            if doc["_id"] not in stored:
+                stored.add(doc["_id"])
+                fresh.append(doc)
+        result["duplicates"] = len(docs) - len(fresh)
+        self.sensors.extend(fresh)
+        self.apply_readings(fresh)
+        result["inserted"] = len(fresh)
+        if failing:
+            return web.json_response(dict(result, message="Bulk insert failed: connection closed"), status=503)
+        return web.json_response(result)
+
+    async def list_alerts(self, request):
+        return self.page(request, self.alerts, ALERT_FIELDS)
+
+    async def export_alerts(self, request):
+        return await self.export(request, self.alerts, ALERT_FIELDS)
+
+    async def create_alert(self, request):
+        user = self.authorize(request, "Admin", "Researcher")
+        if isinstance(user, web.Response):
+            return user
+        body = await request.json()
+        fields = {k: body.get(k) for k in ("type", "message", "severity")}
+        if not all(fields.values()):
+            return web.json_response({"message": "type, message, severity are required"}, status=400)
+        if fields["severity"] not in SEVERITIES:
+            # Mongoose rejects this and the real API never answers (Express 4
+            # drops the rejected promise); fail fast instead
+            return web.json_response({"message": f"Alert validation failed: severity: "
+                                                 f"`{fields['severity']}` is not a valid enum value"},
+                                     status=500)
+        alert = self.document(fields, timestamp=datetime.now(timezone.utc))
+        self.alerts.append(alert)
+        await self.sio.emit("alert:new", alert)
+        return web.json_response(alert, status=201)
+
+    async def summary_report(self, request):
+        total = self.rollups.get(("*", "all", 0))
+        summary = {"avgTemp": None, "avgWind": None, "avgWater": None}
+        if total:
+            summary = {
+                "avgTemp": total["sum"]["temperature"] / total["count"],
+                "avgWind": total["sum"]["wind_speed"] / total["count"],
+                "avgWater": total["sum"]["water_level"] / total["count"],
+            }
+        return web.json_response({
+            "summary": summary,
+            "latestSensors": self.latest(self.sensors, REPORT_LIMIT),
+            "latestAlerts": self.latest(self.alerts, REPORT_LIMIT),
+            "asOf": self.rollups_as_of,
+        })
+
+    async def list_rollups(self, request):
+        granularity = request.query.get("granularity", "hour")
+        if granularity not in ROLLUP_SECONDS:
+            return web.json_response({"message": f"granularity must be one of {', '.join(ROLLUP_SECONDS)}"},
+                                     status=400)
+        try:
+            bounds = [parse_time(request.query[k]).timestamp() if k in request.query else None for k in ("from", "to")]
+        except ValueError:
+            return web.json_response({"message": "from and to must be ISO 8601 times"}, status=400)
+        try:
+            limit = min(max(int(request.query.get("limit", "")) or ROLLUP_LIMIT, 1), MAX_ROLLUP_LIMIT)
+        except ValueError:
+            limit = ROLLUP_LIMIT
+        location = request.query.get("location")
+        found = []
+        for (name, kind, bucket), stats in self.rollups.items():
+            if kind != granularity or (location and name != location):
+                continue
+            if (bounds[0] is not None and bucket < bounds[0]) or (bounds[1] is not None and bucket >= bounds[1]):
+                continue
+            found.append(dict(stats, location=name, granularity=kind,
+                              bucket=iso(datetime.fromtimestamp(bucket, timezone.utc)), updatedAt=self.rollups_as_of,
+                              avg={k: v / stats["count"] for k, v in stats["sum"].items()}))
+        found.sort(key=lambda r: (r["bucket"], r["location"]))
+        return web.json_response(found[:limit])
+
+    async def create_report(self, request):
+        body = await request.json()
+        self.reports.append(body)
+        return web.json_response({
+            "success": True,
+            "message": "Report received",
+            "data": dict(body, id=int(time.time() * 1000)),
+        }, status=201)
+
+    async def list_users(self, request):
+        user = self.authorize(request, "Admin")
+        if isinstance(user, web.Response):
+            return user
+        users = [{k: v for k, v in u.items() if k != "password"} for u in self.users]
+        return web.json_response(sorted(users, key=lambda u: u["createdAt"], reverse=True))
+
+
+def main():
+    """Run the fake on a fixed port, e.g. in place of `npm start` for dashboard work"""
+    parser = argparse.ArgumentParser(description="Serve the in-memory fake CoastalWatch backend")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 4000)))
+    args = parser.parse_args()
+    backend = FakeBackend(port=args.port)
+    print(f"✅ Fake backend on {backend.url} (in-memory, seeded like seed.js)", flush=True)
+    web.run_app(backend.app, host="127.0.0.1", port=args.port, print=None, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
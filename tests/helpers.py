@@ -0,0 +1,91 @@
+"""
+Constants and helpers shared by the CoastalWatch test modules
+
+Importing this puts the repository root on sys.path, so tests can import
+run_all, readiness and the other top-level modules. Fixtures live in
+conftest.py; test modules import from here, never from conftest.
+"""
+
+import json
+import os
+import signal
+import subprocess
+import sys
+
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+ENDPOINTS = {
+    "dashboard": "http://127.0.0.1:5000",
+    "backend": "http://127.0.0.1:4000/health",
+    "frontend": "http://127.0.0.1:5173",
+}
+STACK_TIMEOUT = 90
+SHUTDOWN_TIMEOUT = 15
+
+# Read-only pages used by independent checks
+PAGES = [
+    "http://127.0.0.1:5000",
+    "http://127.0.0.1:4000/health",
+    "http://127.0.0.1:4000/health/db",
+    "http://127.0.0.1:5173",
+]
+
+# Filled in as the session runs; printed by pytest_terminal_summary
+timings = {"ready": {}, "restart": {}}
+
+
+class Stack:
+    """
+    A running run_all.py and a shared HTTP session for talking to it
+
+    Args:
+        process: The orchestrator process
+        log_path: File receiving the orchestrator's output
+        readiness: Result of readiness.wait_ready for ENDPOINTS
+    """
+
+    def __init__(self, process, log_path, readiness):
+        self.process = process
+        self.log_path = log_path
+        self.readiness = readiness
+        self.session = requests.Session()
+
+    def log_tail(self, lines=40):
+        with open(self.log_path, "rb") as f:
+            return b"".join(f.readlines()[-lines:]).decode("utf-8", "replace")
+
+
+class Page:
+    """A fetched response: status, headers and body text"""
+
+    def __init__(self, status, headers, text):
+        self.status = status
+        self.headers = headers
+        self.text = text
+
+    def json(self):
+        return json.loads(self.text)
+
+
+def start_orchestrator(log):
+    if sys.platform == "win32":
+        flags = dict(creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
+    else:
+        flags = dict(start_new_session=True)
+    return subprocess.Popen([sys.executable, "run_all.py"], cwd=ROOT, stdout=log,
+                            stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL, **flags)
+
+
+def stop_orchestrator(process):
+    """Ask run_all.py to shut its services down, killing it if it won't"""
+    if process.poll() is not None:
+        return
+    process.send_signal(signal.CTRL_BREAK_EVENT if sys.platform == "win32" else signal.SIGINT)
+    try:
+        process.wait(timeout=SHUTDOWN_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
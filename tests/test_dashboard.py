@@ -0,0 +1,300 @@
+"""
+Hermetic tests for the dashboard's cached service status
+"""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+import requests
+from werkzeug.serving import make_server
+
+from helpers import ROOT
+from readiness import wait_ready
+
+sys.path.insert(0, os.path.join(ROOT, "dashboard"))
+
+import app as dashboard  # noqa: E402
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def hung_server():
+    """Accepts connections but never answers"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen(16)
+        yield f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+
+def wait_for(poller, names, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        states = {s["name"]: s for s in poller.snapshot()}
+        if all(states[n]["checked_at"] is not None for n in names):
+            return states
+        time.sleep(0.01)
+    raise AssertionError(f"no status for {names}")
+
+
+def make_client(services, **kwargs):
+    app = dashboard.create_app(services, **kwargs)
+    return app, app.test_client()
+
+
+def test_status_reflects_upstreams(fake_backend):
+    services = [
+        dashboard.Service("backend", "Backend API", fake_backend.url, f"{fake_backend.url}/health"),
+        dashboard.Service("down", "Down", f"http://127.0.0.1:{free_port()}"),
+    ]
+    app, client = make_client(services, interval=0.05)
+    poller = app.extensions["status_poller"]
+    try:
+        wait_for(poller, ["backend", "down"])
+        body = client.get("/status.json").get_json()
+        states = {s["name"]: s for s in body["services"]}
+        assert states["backend"]["state"] == "online"
+        assert states["backend"]["http_status"] == 200
+        assert states["down"]["state"] == "offline"
+        assert states["down"]["error"]
+
+        page = client.get("/")
+        assert page.status_code == 200
+        assert b"CoastalWatch Dashboard" in page.data
+        assert f"{fake_backend.url}/health".encode() in page.data
+    finally:
+        poller.stop()
+
+
+def test_renders_do_not_wait_for_hung_upstream(hung_server):
+    services = [dashboard.Service("hung", "Hung", hung_server)]
+    app, client = make_client(services, interval=0.05)
+    poller = app.extensions["status_poller"]
+    poller.timeout = 5
+    try:
+        time.sleep(0.1)  # the first probe is now blocked on the hung server
+        started = time.monotonic()
+        for path in ("/", "/status.json", "/health"):
+            assert client.get(path).status_code == 200
+        assert time.monotonic() - started < 0.5
+        assert client.get("/status.json").get_json()["services"][0]["state"] == "unknown"
+    finally:
+        poller._stop.set()
+
+
+def test_stale_results_become_unknown(fake_backend):
+    service = dashboard.Service("backend", "Backend API", f"{fake_backend.url}/health")
+    poller = dashboard.StatusPoller([service], interval=0.05, ttl=0.2)
+    poller.start()
+    assert wait_for(poller, ["backend"])["backend"]["state"] == "online"
+    poller.stop()
+    time.sleep(0.3)
+    entry = poller.snapshot()[0]
+    assert entry["state"] == "unknown"
+    assert entry["age_s"] > 0.2
+
+
+def test_probe_reuses_connection(fake_backend):
+    probe = dashboard.Probe(f"{fake_backend.url}/health")
+    try:
+        assert probe.check()[0] == 200
+        connection = probe.connection
+        assert probe.check()[0] == 200
+        assert probe.connection is connection
+    finally:
+        probe.close()
+
+
+def read_events(response):
+    """Yield (event, data) pairs from an SSE response, including heartbeats"""
+    event, data = None, []
+    for line in response.iter_lines(decode_unicode=True):
+        if line.startswith(":"):
+            yield "heartbeat", None
+        elif line.startswith("event: "):
+            event = line[7:]
+        elif line.startswith("data: "):
+            data.append(line[6:])
+        elif not line and event:
+            yield event, json.loads("\n".join(data))
+            event, data = None, []
+
+
+@pytest.fixture
+def live_dashboard(fake_backend):
+    service = dashboard.Service("backend", "Backend API", fake_backend.url, f"{fake_backend.url}/health")
+    app = dashboard.create_app([service], interval=0.05, backend_url=fake_backend.url, heartbeat=0.2)
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield app, f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    app.extensions["alert_feed"].stop()
+    app.extensions["status_poller"].stop()
+
+
+def test_events_stream_status_and_alerts(fake_backend, live_dashboard):
+    app, url = live_dashboard
+    feed = app.extensions["alert_feed"]
+    deadline = time.monotonic() + 10
+    while not feed.connected and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert feed.connected
+
+    with requests.get(f"{url}/events", stream=True, timeout=5) as response:
+        assert response.headers["Content-Type"].startswith("text/event-stream")
+        events = read_events(response)
+        assert next(events)[0] == "status"
+        assert next(events) == ("alerts", [])
+
+        requests.post(f"{fake_backend.url}/api/alerts",
+                      json={"type": "Tide", "message": "Surge at Station-2", "severity": "high"},
+                      headers={"Authorization": f"Bearer {fake_backend.token_for('admin')}"}, timeout=5)
+        seen = {}
+        for event, data in events:
+            seen.setdefault(event, data)
+            if "alert" in seen and "service" in seen:
+                break
+        assert seen["alert"]["message"] == "Surge at Station-2"
+        assert seen["service"]["state"] == "online"
+    assert feed.recent[0]["message"] == "Surge at Station-2"
+    assert b"Surge at Station-2" in requests.get(url, timeout=5).content
+
+
+def test_hub_heartbeat_and_slow_subscriber():
+    hub = dashboard.EventHub(queue_size=2, heartbeat=0.01)
+    subscriber = hub.subscribe()
+    stream = hub.stream(subscriber, [hub.frame("status", {})])
+    assert next(stream) == b"retry: 3000\n\n"
+    assert b"event: status" in next(stream)
+    assert next(stream) == b": ping\n\n"
+
+    for i in range(3):
+        hub.publish("service", {"n": i})
+    assert subscriber.dropped and hub.subscribers == 0
+    # The frames queued before the overflow are not sent; the stream just ends
+    assert list(stream) == []
+
+
+@pytest.mark.skipif(dashboard.BaseApplication is None or sys.platform == "win32", reason="needs gunicorn")
+def test_prefork_serves_and_recycles_workers():
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, "app.py", "--prefork", "--port", str(port), "--workers", "2", "--threads", "4",
+         "--max-requests", "10", "--max-requests-jitter", "0"],
+        cwd=os.path.join(ROOT, "dashboard"), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        start_new_session=True)
+    try:
+        url = f"http://127.0.0.1:{port}/health"
+        assert wait_ready({"dashboard": url}, timeout=30)["dashboard"].ready
+        # Enough requests to recycle both workers at least once, none may fail
+        statuses = [requests.get(url, timeout=5).status_code for _ in range(60)]
+        assert statuses == [200] * 60
+    finally:
+        process.terminate()
+        assert process.wait(10) == 0
+
+
+def metric(text, line_start):
+    for line in text.splitlines():
+        if line.startswith(line_start):
+            return float(line.rsplit(" ", 1)[1])
+    return 0
+
+
+@pytest.mark.skipif(dashboard.BaseApplication is None or sys.platform == "win32", reason="needs gunicorn")
+def test_prefork_workers_share_status_alerts_and_metrics(fake_backend):
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, "app.py", "--prefork", "--port", str(port), "--workers", "3", "--threads", "4",
+         "--poll-interval", "0.2", "--backend-url", fake_backend.url],
+        cwd=os.path.join(ROOT, "dashboard"), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        start_new_session=True)
+    url = f"http://127.0.0.1:{port}"
+    try:
+        assert wait_ready({"dashboard": f"{url}/health"}, timeout=30)["dashboard"].ready
+        deadline = time.monotonic() + 10
+        while not fake_backend.socket_clients and time.monotonic() < deadline:
+            time.sleep(0.05)
+        time.sleep(0.5)
+        # One alert subscription for the whole pool, not one per worker
+        assert len(fake_backend.socket_clients) == 1
+
+        requests.post(f"{fake_backend.url}/api/alerts",
+                      json={"type": "Tide", "message": "Surge at Station-4", "severity": "high"},
+                      headers={"Authorization": f"Bearer {fake_backend.token_for('admin')}"}, timeout=5)
+        deadline = time.monotonic() + 10
+        while b"Surge at Station-4" not in requests.get(url, timeout=5).content and time.monotonic() < deadline:
+            time.sleep(0.05)
+        # Fresh connections land on different workers; all render the same page
+        pages = [requests.get(url, timeout=5) for _ in range(12)]
+        assert all(b"Surge at Station-4" in page.content for page in pages)
+        assert len({page.headers["ETag"] for page in pages}) == 1
+
+        for _ in range(30):
+            assert requests.get(f"{url}/static/missing.css", timeout=5).status_code == 404
+        counter = 'coastalwatch_dashboard_responses_total{route="/static/<path:filename>",status="404"'
+        deadline = time.monotonic() + 10
+        while metric(requests.get(f"{url}/metrics", timeout=5).text, counter) < 30 and time.monotonic() < deadline:
+            time.sleep(0.1)
+        # Whichever worker answers the scrape reports the whole pool's count
+        assert [metric(requests.get(f"{url}/metrics", timeout=5).text, counter) for _ in range(6)] == [30] * 6
+    finally:
+        process.terminate()
+        assert process.wait(10) == 0
+    # The collector process went with the master
+    deadline = time.monotonic() + 5
+    while fake_backend.socket_clients and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not fake_backend.socket_clients
+
+
+def test_page_rendered_once_and_revalidated(fake_backend):
+    service = dashboard.Service("backend", "Backend API", fake_backend.url, f"{fake_backend.url}/health")
+    app, client = make_client([service], interval=0.05)
+    poller, pages = app.extensions["status_poller"], app.extensions["page_cache"]
+    try:
+        wait_for(poller, ["backend"])
+        gzip = {"Accept-Encoding": "gzip"}
+        first = client.get("/", headers=gzip)
+        assert first.headers["Content-Encoding"] == "gzip"
+        assert first.headers["Vary"] == "Accept-Encoding"
+        # Latency changes with every probe but isn't part of the page
+        time.sleep(0.2)
+        again = client.get("/", headers={**gzip, "If-None-Match": first.headers["ETag"]})
+        assert again.status_code == 304
+        assert pages.renders == 1 and pages.hits == 1
+        # The uncompressed representation has its own validator
+        plain = client.get("/", headers={"If-None-Match": first.headers["ETag"]})
+        assert plain.status_code == 200 and "Content-Encoding" not in plain.headers
+
+        metrics = client.get("/metrics").get_data(as_text=True)
+        assert 'coastalwatch_dashboard_responses_total{route="/",status="304",encoding="identity"} 1' in metrics
+        assert 'coastalwatch_dashboard_response_bytes_count{route="/"}' in metrics
+        assert "coastalwatch_dashboard_page_renders_total 1" in metrics
+    finally:
+        poller.stop()
+
+
+def test_static_assets_fingerprinted():
+    app, client = make_client([], start_poller=False)
+    page = client.get("/").get_data(as_text=True)
+    url = page.split('<link rel="stylesheet" href="', 1)[1].split('"', 1)[0]
+    assert url.startswith("/static/dashboard.") and url.endswith(".css") and url != "/static/dashboard.css"
+
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["ETag"]}) \
+        .status_code == 304
+    assert client.get("/static/dashboard.css").headers["Cache-Control"] == "no-cache"
+    assert client.get("/static/missing.css").status_code == 404
@@ -0,0 +1,118 @@
+"""
+Hermetic tests for keyset pagination, the NDJSON export and the export CLI
+"""
+
+import csv
+import json
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+
+from helpers import ROOT
+
+sys.path.insert(0, os.path.join(ROOT, "tools"))
+
+import export  # noqa: E402
+
+
+def add_readings(backend, count):
+    """Readings in runs of 10 sharing a timestamp, so pages split ties"""
+    start = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    backend.sensors.extend(
+        backend.document({"location": f"Buoy-{i}", "water_level": 1.5, "wind_speed": 8.0, "temperature": 18.5},
+                         timestamp=start + timedelta(minutes=i // 10))
+        for i in range(count)
+    )
+
+
+def test_pages_cover_everything_once(fake_backend):
+    add_readings(fake_backend, 95)
+    url, params, seen, pages = f"{fake_backend.url}/api/sensors", {"limit": 7}, [], 0
+    while True:
+        response = requests.get(url, params=params, timeout=5)
+        assert response.status_code == 200
+        page = response.json()
+        seen += page
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        assert 'rel="next"' in response.headers["Link"]
+        assert len(page) == 7
+        params["cursor"] = cursor
+
+    keys = [(s["timestamp"], s["_id"]) for s in seen]
+    assert keys == sorted(keys, reverse=True)
+    assert sorted(s["_id"] for s in seen) == sorted(s["_id"] for s in fake_backend.sensors)
+    assert pages == -(-len(fake_backend.sensors) // 7)
+
+
+def test_page_fields_and_bad_queries(fake_backend):
+    url = f"{fake_backend.url}/api/sensors"
+    page = requests.get(url, params={"fields": "location,water_level", "limit": 3}, timeout=5).json()
+    assert [sorted(s) for s in page] == [["_id", "location", "timestamp", "water_level"]] * 3
+
+    for params in ({"cursor": "not-a-cursor"}, {"fields": "password"}, {"from": "yesterday"}):
+        response = requests.get(url, params=params, timeout=5)
+        assert response.status_code == 400, params
+        assert response.json()["message"]
+
+
+def test_export_streams_oldest_first(fake_backend):
+    url = f"{fake_backend.url}/api/alerts/export"
+    assert requests.get(url, timeout=5).status_code == 401
+    public = {"Authorization": f"Bearer {fake_backend.token_for('public')}"}
+    assert requests.get(url, headers=public, timeout=5).status_code == 403
+
+    research = {"Authorization": f"Bearer {fake_backend.token_for('research')}"}
+    response = requests.get(url, headers=research, timeout=5)
+    assert response.headers["Content-Type"].startswith("application/x-ndjson")
+    alerts = [json.loads(line) for line in response.text.splitlines()]
+    assert [a["_id"] for a in alerts] == [a["_id"] for a in fake_backend.alerts]
+
+    after = requests.get(url, headers=research, params={"cursor": export.encode_cursor(alerts[0])}, timeout=5)
+    assert [json.loads(line)["_id"] for line in after.text.splitlines()] == [a["_id"] for a in alerts[1:]]
+
+
+def test_cli_writes_csv_and_resumes_after_a_drop(fake_backend, tmp_path, capsys):
+    add_readings(fake_backend, 2500)
+    fake_backend.export_drops = 2
+    out = tmp_path / "sensors.csv"
+    args = ["sensors", "--out", str(out), "--url", fake_backend.url, "--batch-size", "100", "--progress", "0"]
+    assert export.main(args) == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert (summary["rows"], summary["resumed"]) == (len(fake_backend.sensors), 2)
+
+    with open(out, newline="") as f:
+        rows = list(csv.DictReader(f))
+    expected = sorted(fake_backend.sensors, key=lambda s: (s["timestamp"], s["_id"]))
+    assert [r["_id"] for r in rows] == [s["_id"] for s in expected]
+    assert float(rows[-1]["water_level"]) == expected[-1]["water_level"]
+
+
+def test_cli_fields_and_refusals(fake_backend, tmp_path, capsys):
+    out = tmp_path / "alerts.csv"
+    base = ["alerts", "--out", str(out), "--url", fake_backend.url, "--progress", "0"]
+    assert export.main([*base, "--fields", "severity"]) == 0
+    with open(out, newline="") as f:
+        assert next(csv.reader(f)) == ["_id", "severity", "timestamp"]
+
+    assert export.main([*base, "--username", "public", "--password", "public123"]) == 1
+    with pytest.raises(SystemExit):
+        export.main([*base, "--fields", "password"])
+
+
+@pytest.mark.skipif(export.pyarrow is None, reason="pyarrow not installed")
+def test_cli_writes_parquet_row_groups(fake_backend, tmp_path, capsys):
+    add_readings(fake_backend, 250)
+    out = tmp_path / "sensors.parquet"
+    assert export.main(["sensors", "--out", str(out), "--url", fake_backend.url,
+                        "--batch-size", "100", "--progress", "0"]) == 0
+    parquet = export.pyarrow.parquet.ParquetFile(out)
+    assert parquet.metadata.num_rows == len(fake_backend.sensors)
+    assert parquet.metadata.num_row_groups == 3
+    assert str(parquet.schema_arrow.field("timestamp").type) == "timestamp[ms, tz=UTC]"
+    assert parquet.schema_arrow.field("water_level").type == export.pyarrow.float64()
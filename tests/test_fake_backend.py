@@ -0,0 +1,98 @@
+"""
+Hermetic tests against the in-process fake backend
+
+These run in well under a second with no Node, MongoDB or network.
+"""
+
+import asyncio
+
+import requests
+import socketio
+
+import run_all
+from readiness import wait_ready
+
+
+def login(backend, username, password):
+    return requests.post(f"{backend.url}/api/auth/login",
+                         json={"username": username, "password": password}, timeout=5)
+
+
+def test_health(fake_backend):
+    assert requests.get(f"{fake_backend.url}/health", timeout=5).json() == {"status": "ok"}
+    assert requests.get(f"{fake_backend.url}/health/db", timeout=5).json() == \
+        {"state": 1, "stateText": "connected"}
+
+
+def test_login(fake_backend):
+    response = login(fake_backend, "research", "research123")
+    assert response.status_code == 200
+    assert response.json()["user"]["role"] == "Researcher"
+    assert login(fake_backend, "research", "wrong").status_code == 401
+    assert login(fake_backend, "research", "").status_code == 400
+
+
+def test_sensors_seeded_newest_first(fake_backend):
+    sensors = requests.get(f"{fake_backend.url}/api/sensors", timeout=5).json()
+    assert len(sensors) == 30
+    timestamps = [s["timestamp"] for s in sensors]
+    assert timestamps == sorted(timestamps, reverse=True)
+    assert {s["location"] for s in sensors} == {f"Station-{i}" for i in range(1, 6)}
+
+
+def test_create_alert_requires_role(fake_backend):
+    alert = {"type": "Tide", "message": "Surge", "severity": "high"}
+    url = f"{fake_backend.url}/api/alerts"
+    assert requests.post(url, json=alert, timeout=5).status_code == 401
+    public = {"Authorization": f"Bearer {fake_backend.token_for('public')}"}
+    assert requests.post(url, json=alert, headers=public, timeout=5).status_code == 403
+    forged = {"Authorization": f"Bearer {fake_backend.token_for('admin')}x"}
+    assert requests.post(url, json=alert, headers=forged, timeout=5).status_code == 401
+
+
+def test_create_alert_broadcasts(fake_backend):
+    async def scenario():
+        received = asyncio.Queue()
+        client = socketio.AsyncClient()
+        client.on("alert:new", received.put_nowait)
+        await client.connect(fake_backend.url, transports=["websocket"])
+        try:
+            token = login(fake_backend, "admin", "admin123").json()["token"]
+            response = await asyncio.to_thread(
+                requests.post, f"{fake_backend.url}/api/alerts",
+                json={"type": "Storm", "message": "Gale warning", "severity": "critical"},
+                headers={"Authorization": f"Bearer {token}"}, timeout=5)
+            assert response.status_code == 201
+            alert = await asyncio.wait_for(received.get(), 5)
+            assert alert == response.json()
+        finally:
+            await client.disconnect()
+
+    asyncio.run(scenario())
+    alerts = requests.get(f"{fake_backend.url}/api/alerts", timeout=5).json()
+    assert alerts[0]["message"] == "Gale warning"
+    assert len(alerts) == 3
+
+
+def test_summary_report(fake_backend):
+    report = requests.get(f"{fake_backend.url}/api/reports", timeout=5).json()
+    expected = sum(s["temperature"] for s in fake_backend.sensors) / len(fake_backend.sensors)
+    assert abs(report["summary"]["avgTemp"] - expected) < 1e-9
+    assert len(report["latestSensors"]) == 20
+    assert len(report["latestAlerts"]) == 2
+
+
+def test_users_admin_only(fake_backend):
+    url = f"{fake_backend.url}/api/users"
+    admin = {"Authorization": f"Bearer {fake_backend.token_for('admin')}"}
+    users = requests.get(url, headers=admin, timeout=5).json()
+    assert {u["username"] for u in users} == {"admin", "research", "public"}
+    assert all("password" not in u for u in users)
+    research = {"Authorization": f"Bearer {fake_backend.token_for('research')}"}
+    assert requests.get(url, headers=research, timeout=5).status_code == 403
+
+
+def test_orchestrator_probes(fake_backend):
+    assert run_all.probe(f"{fake_backend.url}/health")
+    result = wait_ready({"backend": f"{fake_backend.url}/health"}, timeout=2)["backend"]
+    assert result.ready and result.attempts == 1
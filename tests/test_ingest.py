@@ -0,0 +1,164 @@
+"""
+Hermetic tests for bulk sensor ingestion and the streaming loader
+"""
+
+import json
+import os
+import sys
+
+import requests
+
+from helpers import ROOT
+
+sys.path.insert(0, os.path.join(ROOT, "tools"))
+
+import ingest  # noqa: E402
+
+SEEDED = 30
+
+
+def reading(i):
+    return {"location": f"Buoy-{i}", "water_level": 1.5, "wind_speed": 8.0, "temperature": 18.5,
+            "timestamp": "2024-06-01T00:00:00Z"}
+
+
+def write_ndjson(path, count):
+    with open(path, "w") as f:
+        for i in range(count):
+            f.write(json.dumps(reading(i)) + "\n")
+
+
+def loaded(backend):
+    """Locations of the ingested readings; batches in flight may land in any order"""
+    return sorted((s["location"] for s in backend.sensors[SEEDED:]), key=lambda name: int(name.split("-")[1]))
+
+
+def test_bulk_endpoint_validates_each_line(fake_backend):
+    url = f"{fake_backend.url}/api/sensors/bulk"
+    body = "\n".join([
+        json.dumps(reading(0)),
+        "{not json",
+        "",
+        json.dumps({"location": "Buoy-x", "water_level": "high", "wind_speed": 1, "temperature": 1}),
+        json.dumps({"location": "Buoy-y", "wind_speed": 1, "temperature": 1}),
+        json.dumps(reading(1)),
+    ])
+    headers = {"Authorization": f"Bearer {fake_backend.token_for('research')}",
+               "Content-Type": "application/x-ndjson"}
+    result = requests.post(url, data=body, headers=headers, timeout=5).json()
+    assert (result["received"], result["inserted"], result["rejected"]) == (5, 2, 3)
+    assert [e["line"] for e in result["errors"]] == [2, 4, 5]
+    assert "water_level" in result["errors"][2]["message"]
+    assert loaded(fake_backend) == ["Buoy-0", "Buoy-1"]
+
+    public = {**headers, "Authorization": f"Bearer {fake_backend.token_for('public')}"}
+    assert requests.post(url, data=body, headers=public, timeout=5).status_code == 403
+    assert requests.post(url, data=body, timeout=5).status_code == 401
+    assert requests.post(url, json=[reading(2)], headers={"Authorization": headers["Authorization"]},
+                         timeout=5).status_code == 415
+
+
+def test_bulk_endpoint_caps_line_length(fake_backend):
+    # One write, so the oversized line arrives whole rather than as a growing tail
+    oversized = json.dumps(dict(reading(1), location="B" * (17 * 1024)))
+    body = "\n".join([json.dumps(reading(0)), oversized, json.dumps(reading(2))]).encode()
+    headers = {"Authorization": f"Bearer {fake_backend.token_for('research')}",
+               "Content-Type": "application/x-ndjson"}
+    result = requests.post(f"{fake_backend.url}/api/sensors/bulk", data=body, headers=headers, timeout=5).json()
+    assert (result["received"], result["inserted"], result["rejected"]) == (3, 2, 1)
+    assert result["errors"] == [{"line": 2, "message": "Line longer than 16384 characters"}]
+    assert loaded(fake_backend) == ["Buoy-0", "Buoy-2"]
+
+
+def test_loader_streams_csv(fake_backend, tmp_path, capsys):
+    path = tmp_path / "readings.csv"
+    rows = ["location,water_level,wind_speed,temperature,timestamp"]
+    rows += [f"Buoy-{i},1.5,8,18.5,2024-06-01T00:00:00Z" for i in range(95)]
+    rows.insert(40, "Buoy-bad,,8,18.5,")
+    path.write_text("\n".join(rows) + "\n")
+
+    code = ingest.main([str(path), "--url", fake_backend.url, "--batch-size", "10", "--max-in-flight", "3",
+                        "--progress", "0"])
+    assert code == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert (summary["batches"], summary["inserted"], summary["rejected"]) == (10, 95, 1)
+    assert summary["readings_per_second"] > 0
+    assert summary["end_line"] == 97
+    assert loaded(fake_backend) == [f"Buoy-{i}" for i in range(95)]
+    assert fake_backend.sensors[-1]["water_level"] == 1.5
+
+
+def test_loader_resumes_without_gaps_or_duplicates(fake_backend, tmp_path):
+    path = tmp_path / "readings.ndjson"
+    write_ndjson(path, 500)
+    common = [str(path), "--url", fake_backend.url, "--batch-size", "40", "--progress", "0"]
+
+    assert ingest.main(common + ["--limit", "250"]) == 0
+    with open(f"{path}.checkpoint") as f:
+        assert json.load(f)["line"] == 250
+    assert ingest.main(common + ["--resume"]) == 0
+    assert loaded(fake_backend) == [f"Buoy-{i}" for i in range(500)]
+
+
+def test_loader_retries_then_stops_at_checkpoint(fake_backend, tmp_path):
+    path = tmp_path / "readings.ndjson"
+    write_ndjson(path, 100)
+    common = [str(path), "--url", fake_backend.url, "--batch-size", "10", "--max-in-flight", "1",
+              "--progress", "0"]
+
+    fake_backend.bulk_failures = 2
+    assert ingest.main(common + ["--retries", "2", "--limit", "30"]) == 0
+    assert len(loaded(fake_backend)) == 30
+
+    fake_backend.bulk_failures = 3
+    assert ingest.main(common + ["--retries", "2", "--resume"]) == 1
+    with open(f"{path}.checkpoint") as f:
+        assert json.load(f)["line"] == 30
+    assert ingest.main(common + ["--resume"]) == 0
+    assert loaded(fake_backend) == [f"Buoy-{i}" for i in range(100)]
+
+
+def test_loader_resends_partial_batches_without_duplicates(fake_backend, tmp_path, capsys):
+    path = tmp_path / "readings.ndjson"
+    write_ndjson(path, 100)
+    fake_backend.bulk_partial_failures = 3
+    assert ingest.main([str(path), "--url", fake_backend.url, "--batch-size", "10", "--max-in-flight", "1",
+                        "--retries", "3", "--progress", "0"]) == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert (summary["inserted"], summary["duplicates"], summary["retries"]) == (100, 5, 3)
+    assert loaded(fake_backend) == [f"Buoy-{i}" for i in range(100)]
+
+    rollups = requests.get(f"{fake_backend.url}/api/reports/rollups", params={"granularity": "day"},
+                           timeout=5).json()
+    assert sum(r["count"] for r in rollups if r["location"].startswith("Buoy-")) == 100
+
+    # A second run of the same file stores nothing new
+    assert ingest.main([str(path), "--url", fake_backend.url, "--progress", "0"]) == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert (summary["inserted"], summary["duplicates"]) == (0, 100)
+    assert len(loaded(fake_backend)) == 100
+
+
+def test_ingested_readings_roll_up(fake_backend):
+    before = requests.get(f"{fake_backend.url}/api/reports", timeout=5).json()
+    body = "\n".join(json.dumps(dict(reading(0), water_level=level, timestamp=f"2024-06-01T10:{minute}:00Z"))
+                     for level, minute in ((1.0, "00"), (3.0, "00"), (5.0, "59")))
+    headers = {"Authorization": f"Bearer {fake_backend.token_for('research')}",
+               "Content-Type": "application/x-ndjson"}
+    requests.post(f"{fake_backend.url}/api/sensors/bulk", data=body, headers=headers, timeout=5)
+
+    rollups = requests.get(f"{fake_backend.url}/api/reports/rollups",
+                           params={"granularity": "minute", "location": "Buoy-0"}, timeout=5).json()
+    assert [(r["bucket"], r["count"]) for r in rollups] == \
+        [("2024-06-01T10:00:00.000Z", 2), ("2024-06-01T10:59:00.000Z", 1)]
+    assert rollups[0]["avg"]["water_level"] == 2.0
+    hour = requests.get(f"{fake_backend.url}/api/reports/rollups",
+                        params={"granularity": "hour", "location": "Buoy-0"}, timeout=5).json()
+    assert (hour[0]["count"], hour[0]["min"]["water_level"], hour[0]["max"]["water_level"]) == (3, 1.0, 5.0)
+
+    after = requests.get(f"{fake_backend.url}/api/reports", timeout=5).json()
+    levels = [s["water_level"] for s in fake_backend.sensors]
+    assert abs(after["summary"]["avgWater"] - sum(levels) / len(levels)) < 1e-9
+    assert after["asOf"] > before["asOf"]
+    assert requests.get(f"{fake_backend.url}/api/reports/rollups", params={"granularity": "week"},
+                        timeout=5).status_code == 400
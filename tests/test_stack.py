@@ -0,0 +1,113 @@
+"""
+Integration tests against the full stack started by run_all.py
+"""
+
+import os
+import signal
+import sys
+import time
+
+import pytest
+
+from helpers import ENDPOINTS, ROOT, timings
+from readiness import wait_ready
+
+import run_all
+
+RESTART_TIMEOUT = 90
+
+
+def listening_pid(port):
+    """Return the PID of the process listening on a local TCP port (Linux)"""
+    inodes = set()
+    for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            with open(table) as f:
+                next(f)
+                for line in f:
+                    fields = line.split()
+                    # State 0A is LISTEN
+                    if fields[3] == "0A" and int(fields[1].rsplit(":", 1)[1], 16) == port:
+                        inodes.add(fields[9])
+        except OSError:
+            continue
+    for pid in filter(str.isdigit, os.listdir("/proc")):
+        try:
+            for fd in os.listdir(f"/proc/{pid}/fd"):
+                link = os.readlink(f"/proc/{pid}/fd/{fd}")
+                if link.startswith("socket:[") and link[8:-1] in inodes:
+                    return int(pid)
+        except OSError:
+            continue
+    return None
+
+
+def test_dashboard_accessible(pages):
+    assert pages["http://127.0.0.1:5000"].status == 200
+
+
+@pytest.mark.parametrize("text", [
+    "CoastalWatch Dashboard",
+    "CoastalWatch Frontend",
+    "Backend API",
+    "http://127.0.0.1:5173",
+    "http://127.0.0.1:4000/health",
+])
+def test_dashboard_content(pages, text):
+    assert text in pages["http://127.0.0.1:5000"].text
+
+
+def test_backend_health(pages):
+    page = pages["http://127.0.0.1:4000/health"]
+    assert page.status == 200
+    assert page.json().get("status") == "ok"
+
+
+def test_backend_db_health(pages):
+    # The DB may be unreachable, but the endpoint must still answer
+    page = pages["http://127.0.0.1:4000/health/db"]
+    assert page.status == 200
+    assert "state" in page.json()
+
+
+def test_frontend_accessible(pages):
+    assert pages["http://127.0.0.1:5173"].status == 200
+
+
+def test_service_entry_points_exist():
+    for path in ("backend/package.json", "frontend/package.json", "dashboard/app.py"):
+        assert os.path.exists(os.path.join(ROOT, path)), path
+
+
+def test_ports_unique():
+    ports = [service.port for service in run_all.build_services()]
+    assert len(ports) == len(set(ports))
+
+
+def test_shared_session_reaches_api(stack):
+    response = stack.session.get("http://127.0.0.1:4000/", timeout=5)
+    assert response.status_code == 200
+    assert response.json()["endpoints"]["health"] == "/health"
+
+
+# Runs last: each case kills one service inside the warm stack, so the
+# others (and the restarted service's dependencies) never go cold
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="finds listeners through /proc")
+@pytest.mark.parametrize("name", ["dashboard", "frontend", "backend"])
+def test_service_restarts_independently(stack, name):
+    port = next(s.port for s in run_all.build_services() if s.name == name)
+    pid = listening_pid(port)
+    assert pid is not None, f"nothing listening on :{port}"
+
+    killed = time.monotonic()
+    os.killpg(os.getpgid(pid), signal.SIGKILL)
+    while listening_pid(port) == pid and time.monotonic() - killed < 5:
+        time.sleep(0.01)
+
+    others = {n: url for n, url in ENDPOINTS.items() if n != name}
+    still_up = wait_ready(others, timeout=5)
+    assert all(r.ready for r in still_up.values()), still_up
+
+    back = wait_ready({name: ENDPOINTS[name]}, timeout=RESTART_TIMEOUT)[name]
+    assert back.ready, f"{name} not restarted: {back.error}\n{stack.log_tail()}"
+    timings["restart"][name] = time.monotonic() - killed
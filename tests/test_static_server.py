@@ -0,0 +1,18 @@
+"""
+Tests for the production static server's conditional requests
+"""
+
+from static_server import etag_matches
+
+ETAG = '"3f2a9c"'
+
+
+def test_if_none_match_lists_and_weak_tags():
+    assert etag_matches('"3f2a9c"', ETAG)
+    assert etag_matches('W/"3f2a9c"', ETAG)
+    assert etag_matches('"old", W/"3f2a9c"', ETAG)
+    assert etag_matches(' * ', ETAG)
+    assert not etag_matches('"old", "older"', ETAG)
+    assert not etag_matches('3f2a9c', ETAG)
+    assert not etag_matches("", ETAG)
+    assert not etag_matches(None, ETAG)
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+CoastalWatch Exporter
+Streams sensors or alerts out of GET /api/<collection>/export into CSV
+or Parquet
+
+The backend sends one JSON document per line, oldest first, as its
+database cursor yields them. This tool writes rows out as they arrive,
+so memory stays at one --batch-size of rows however many documents
+there are. Parquet gets one row group per batch. If the connection
+drops part-way, the export carries on from the last complete line by
+passing the backend a cursor made from that document's timestamp and
+_id, so nothing is duplicated or skipped.
+
+Parquet output needs pyarrow (pip install pyarrow).
+
+    python tools/export.py sensors --out sensors.csv
+    python tools/export.py alerts --format parquet --out alerts.parquet --from 2024-01-01T00:00:00Z
+    python tools/export.py sensors --fields location,water_level --out - | head
+"""
+
+import argparse
+import asyncio
+import base64
+import csv
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+import aiohttp
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# Every field the backend will project, in column order
+COLUMNS = {
+    "sensors": ["_id", "location", "water_level", "wind_speed", "temperature", "timestamp",
+                "createdAt", "updatedAt"],
+    "alerts": ["_id", "type", "message", "severity", "timestamp", "createdAt", "updatedAt"],
+}
+NUMERIC_COLUMNS = ("water_level", "wind_speed", "temperature")
+TIME_COLUMNS = ("timestamp", "createdAt", "updatedAt")
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+READ_CHUNK = 64 * 1024
+
+
+def log(message):
+    print(message, file=sys.stderr, flush=True)
+
+
+class ExportError(Exception):
+    """A request the backend refused, or a stream that kept failing after retries"""
+
+
+def encode_cursor(doc):
+    """The cursor utils/keyset.js would hand out for doc: resume just after it"""
+    position = json.dumps({"t": doc["timestamp"], "id": doc["_id"]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(position.encode()).rstrip(b"=").decode()
+
+
+def columns_for(collection, fields=None):
+    """
+    Output columns for an export
+
+    Args:
+        collection: "sensors" or "alerts"
+        fields: Comma-separated fields asked for, or None for all of them
+
+    Raises:
+        ValueError: If a field isn't one the collection has
+    """
+    known = COLUMNS[collection]
+    if not fields:
+        return list(known)
+    wanted = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in wanted if f not in known]
+    if unknown:
+        raise ValueError(f"unknown field(s) for {collection}: {', '.join(unknown)}")
+    # The backend always includes _id and timestamp; the resume cursor needs them
+    return [c for c in known if c in ("_id", "timestamp") or c in wanted]
+
+
+class CsvWriter:
+    """
+    Writes rows to a CSV file (or stdout for "-") as they come
+
+    Args:
+        out: Path, or "-" for stdout
+        columns: Header row, in order
+    """
+
+    def __init__(self, out, columns):
+        self.file = sys.stdout if out == "-" else open(out, "w", newline="")
+        self.writer = csv.DictWriter(self.file, columns, extrasaction="ignore")
+        self.writer.writeheader()
+
+    def write(self, rows):
+        self.writer.writerows(rows)
+        self.file.flush()
+
+    def close(self):
+        if self.file is not sys.stdout:
+            self.file.close()
+
+
+class ParquetWriter:
+    """
+    Writes each batch of rows as one Parquet row group
+
+    Readings become float64, times UTC timestamps in milliseconds and
+    everything else strings.
+
+    Args:
+        out: Path of the .parquet file
+        columns: Columns, in order
+    """
+
+    def __init__(self, out, columns):
+        def column_type(name):
+            if name in NUMERIC_COLUMNS:
+                return pyarrow.float64()
+            if name in TIME_COLUMNS:
+                return pyarrow.timestamp("ms", tz="UTC")
+            return pyarrow.string()
+
+        self.columns = columns
+        self.schema = pyarrow.schema([(name, column_type(name)) for name in columns])
+        self.writer = pyarrow.parquet.ParquetWriter(out, self.schema)
+
+    def write(self, rows):
+        arrays = []
+        for field in self.schema:
+            values = [row.get(field.name) for row in rows]
+            if field.name in TIME_COLUMNS:
+                values = [datetime.fromisoformat(v.replace("Z", "+00:00")) if v else None for v in values]
+            elif field.name in NUMERIC_COLUMNS:
+                values = [float(v) if v is not None else None for v in values]
+            arrays.append(pyarrow.array(values, type=field.type))
+        self.writer.write_table(pyarrow.Table.from_arrays(arrays, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+class Exporter:
+    """
+    Pulls one collection's export stream, resuming after dropped connections
+
+    Args:
+        url: Backend base URL
+        token: JWT for an Admin or Researcher
+        collection: "sensors" or "alerts"
+        params: from/to/fields query parameters to pass through
+        retries: Reconnects allowed in a row without receiving a line
+        timeout: Seconds allowed between chunks of the stream
+        progress: Seconds between progress lines (0 for none)
+    """
+
+    def __init__(self, url, token, collection, params=None, retries=3, timeout=60, progress=5):
+        self.url = f"{url.rstrip('/')}/api/{collection}/export"
+        self.headers = {"Authorization": f"Bearer {token}", "Accept": "application/x-ndjson"}
+        self.params = dict(params or {})
+        self.retries = retries
+        self.timeout = timeout
+        self.progress = progress
+        self.rows = 0
+        self.requests = 0
+        self.resumed = 0
+        self.elapsed = 0
+        self.last = None
+
+    async def stream(self, session):
+        """
+        Yield documents from one request, starting after self.last if set
+
+        Raises:
+            ExportError: On a 4xx, which retrying won't fix
+        """
+        params = dict(self.params)
+        if self.last is not None:
+            params["cursor"] = encode_cursor(self.last)
+        self.requests += 1
+        async with session.get(self.url, params=params, headers=self.headers) as response:
+            if response.status in RETRY_STATUSES:
+                response.raise_for_status()
+            if response.status != 200:
+                raise ExportError(f"HTTP {response.status} {(await response.text())[:200]}")
+            pending = b""
+            async for chunk in response.content.iter_chunked(READ_CHUNK):
+                *lines, pending = (pending + chunk).split(b"\n")
+                for line in lines:
+                    if line.strip():
+                        yield json.loads(line)
+            # Anything left over is a line cut short; it is requested again
+            # on resume rather than parsed
+
+    async def run(self, writer, batch_size=10000):
+        """
+        Export everything into writer, batch_size rows at a time
+
+        Raises:
+            ExportError: If the backend refuses the export, or the stream
+                fails retries times in a row without progress; rows
+                received before that are still written
+        """
+        started = time.monotonic()
+        batch = []
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=self.timeout)
+        try:
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                await self.pull(session, writer, batch, batch_size)
+        finally:
+            if batch:
+                writer.write(batch)
+            self.elapsed = time.monotonic() - started
+
+    async def pull(self, session, writer, batch, batch_size):
+        last_report, last_rows = time.monotonic(), 0
+        failures = 0
+        while True:
+            rows_before = self.rows
+            try:
+                async for doc in self.stream(session):
+                    batch.append(doc)
+                    self.rows += 1
+                    self.last = doc
+                    if len(batch) >= batch_size:
+                        writer.write(batch)
+                        batch.clear()
+                        now = time.monotonic()
+                        if self.progress and now - last_report >= self.progress:
+                            rate = (self.rows - last_rows) / (now - last_report)
+                            log(f"📈 {self.rows:,} rows, {rate:,.0f} rows/s, at {doc['timestamp']}")
+                            last_report, last_rows = now, self.rows
+                return
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                failures = 0 if self.rows > rows_before else failures + 1
+                if failures > self.retries:
+                    raise ExportError(f"export failed after {self.retries} reconnects without progress: "
+                                      f"{type(e).__name__}: {e}")
+                self.resumed += 1
+                log(f"🔁 {type(e).__name__} after {self.rows:,} rows; resuming")
+                await asyncio.sleep(min(0.5 * 2 ** failures, 10))
+
+    def summary(self):
+        elapsed = self.elapsed
+        return {
+            "rows": self.rows,
+            "requests": self.requests,
+            "resumed": self.resumed,
+            "last_timestamp": self.last["timestamp"] if self.last else None,
+            "elapsed_s": round(elapsed, 3),
+            "rows_per_second": round(self.rows / elapsed, 1) if elapsed else None,
+        }
+
+
+async def login(url, username, password):
+    """
+    Get a JWT from /api/auth/login
+
+    Raises:
+        ExportError: If the credentials are refused
+    """
+    async with aiohttp.ClientSession() as session:
+        async with session.post(f"{url.rstrip('/')}/api/auth/login",
+                                json={"username": username, "password": password}) as response:
+            if response.status != 200:
+                raise ExportError(f"login failed: HTTP {response.status} {(await response.text())[:200]}")
+            return (await response.json())["token"]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Export sensors or alerts to CSV or Parquet")
+    parser.add_argument("collection", choices=tuple(COLUMNS), help="What to export")
+    parser.add_argument("--out", required=True, help="Output file, or - for CSV on stdout")
+    parser.add_argument("--format", choices=("csv", "parquet"),
+                        help="Output format (default: from the --out extension, else csv)")
+    parser.add_argument("--from", dest="start", help="Only documents at or after this ISO 8601 time")
+    parser.add_argument("--to", dest="end", help="Only documents before this ISO 8601 time")
+    parser.add_argument("--fields", help="Comma-separated fields (default all; _id and timestamp always)")
+    parser.add_argument("--url", default="http://127.0.0.1:4000", help="Backend base URL")
+    parser.add_argument("--token", default=os.environ.get("COASTALWATCH_TOKEN"),
+                        help="JWT for an Admin or Researcher (default $COASTALWATCH_TOKEN)")
+    parser.add_argument("--username", default="research", help="Login used when no token is given")
+    parser.add_argument("--password", default="research123", help="Password for --username")
+    parser.add_argument("--batch-size", type=int, default=10000,
+                        help="Rows held before writing; one Parquet row group each (default 10000)")
+    parser.add_argument("--retries", type=int, default=3, help="Reconnects in a row without progress (default 3)")
+    parser.add_argument("--timeout", type=float, default=60, help="Seconds allowed between chunks (default 60)")
+    parser.add_argument("--progress", type=float, default=5, help="Seconds between progress lines (0 for none)")
+    args = parser.parse_args(argv)
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+    if args.format is None:
+        args.format = "parquet" if args.out.lower().endswith(".parquet") else "csv"
+    if args.format == "parquet":
+        if pyarrow is None:
+            parser.error("Parquet output needs pyarrow (pip install pyarrow)")
+        if args.out == "-":
+            parser.error("Parquet can't be written to stdout; give --out a file")
+    try:
+        args.columns = columns_for(args.collection, args.fields)
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    params = {k: v for k, v in (("from", args.start), ("to", args.end), ("fields", args.fields)) if v}
+    writer = (ParquetWriter if args.format == "parquet" else CsvWriter)(args.out, args.columns)
+
+    async def export():
+        token = args.token or await login(args.url, args.username, args.password)
+        exporter = Exporter(args.url, token, args.collection, params, args.retries, args.timeout, args.progress)
+        await exporter.run(writer, args.batch_size)
+        return exporter.summary()
+
+    try:
+        summary = asyncio.run(export())
+    except (ExportError, aiohttp.ClientError) as e:
+        log(f"❌ {e}")
+        return 1
+    except KeyboardInterrupt:
+        log("🛑 Interrupted; the output holds every row written so far")
+        return 130
+    finally:
+        writer.close()
+    summary.update(collection=args.collection, format=args.format, out=args.out)
+    log(f"✅ {summary['rows']:,} {args.collection} exported to {args.out}, "
+        f"{summary['rows_per_second'] or 0:,.0f} rows/s")
+    print(json.dumps(summary, indent=2), file=sys.stderr if args.out == "-" else sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""
+CoastalWatch Synthetic Data Generator
+Produces reproducible benchmark datasets of sensor readings, alerts and
+hazard reports
+
+Stations are spread along the Indian coastline, and each reports every
+--interval seconds. Water level follows a semi-diurnal tide (M2 + S2, so
+spring and neap tides appear on their own). Wind is a mean-reverting
+process with an afternoon sea breeze. Temperature has a seasonal and a
+daily cycle. Storms drift along the coast, raising wind and surge at the
+stations they pass. Thresholds crossed during a storm produce bursts of
+alerts, and storms also bring high-wave and flooding reports. Background
+reports of spills and debris arrive at a steady rate.
+
+The same --seed always gives the same data, whatever the batch size. A
+station's readings depend only on the seed and its own index, so adding
+stations leaves the existing ones unchanged. Output is generated in time
+order and written in batches, so memory stays flat from thousands of
+readings to hundreds of millions.
+
+    python tools/generate.py --out data/ --stations 2000 --readings 1000000
+    python tools/generate.py --mongo mongodb://localhost:27017/coastalwatch --drop
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import sys
+import time
+from datetime import datetime, timezone
+
+try:
+    import pymongo
+except ImportError:
+    pymongo = None
+
+COLLECTIONS = ("sensors", "alerts", "reports")
+DEFAULT_END = "2024-06-01T00:00:00Z"
+M2_HOURS = 12.4206  # principal lunar semi-diurnal tide
+S2_HOURS = 12.0  # principal solar semi-diurnal tide
+ALERT_COOLDOWN_H = 3
+PROGRESS_INTERVAL = 5
+
+# Waypoints (lat, lon) from Gujarat down the west coast, round Kanyakumari
+# and up the east coast to West Bengal
+COASTLINE = [
+    (22.8, 68.9), (21.6, 69.6), (20.7, 70.9), (19.0, 72.8), (15.4, 73.8), (12.9, 74.8),
+    (9.9, 76.2), (8.1, 77.5), (9.3, 79.3), (11.0, 79.8), (13.1, 80.3), (15.9, 81.1),
+    (17.7, 83.3), (19.8, 85.8), (21.6, 87.5), (21.7, 88.3),
+]
+WIND_SEVERITY = [(32, "critical"), (26, "high"), (20, "medium")]
+SURGE_SEVERITY = [(1.5, "critical"), (0.9, "high"), (0.5, "medium")]
+BACKGROUND_REPORTS = [
+    ("Oil Spill", "Oil slick observed covering approximately {size}m² near {station}.", ("medium", "high", "critical")),
+    ("Floating Debris", "Floating debris and fishing nets spotted about {km}km off {station}.", ("low", "medium")),
+    ("Other", "Unusual discolouration of the water reported near {station}.", ("low",)),
+]
+STORM_REPORTS = {
+    "Storm": ("High Waves", "Waves estimated at {waves}m breaking near {station}."),
+    "Tide": ("Coastal Flooding", "Tidal flooding of roads and low-lying areas near {station}."),
+}
+
+
+def log(message):
+    print(message, file=sys.stderr, flush=True)
+
+
+def iso(moment):
+    """Format a datetime the way Express serialises a JS Date"""
+    return moment.astimezone(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def parse_time(text):
+    moment = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+def coast_position(fraction):
+    """Latitude and longitude at a fraction (0-1) of the way along COASTLINE"""
+    scaled = min(max(fraction, 0), 1) * (len(COASTLINE) - 1)
+    i = min(int(scaled), len(COASTLINE) - 2)
+    step = scaled - i
+    (lat1, lon1), (lat2, lon2) = COASTLINE[i], COASTLINE[i + 1]
+    return lat1 + (lat2 - lat1) * step, lon1 + (lon2 - lon1) * step
+
+
+def poisson(rng, mean):
+    """Draw an event count with the given mean (Knuth's method; means here are small)"""
+    limit, count, product = math.exp(-mean), 0, rng.random()
+    while product > limit:
+        count += 1
+        product *= rng.random()
+    return count
+
+
+def season_offset(moment):
+    """Seasonal temperature offset shared by all stations; peaks in May, lowest around New Year"""
+    return 2.5 * math.sin(2 * math.pi * (moment.timetuple().tm_yday - 45) / 365)
+
+
+def rated(value, thresholds):
+    """The severity of the first threshold value reaches, or None"""
+    return next((severity for limit, severity in thresholds if value >= limit), None)
+
+
+class Station:
+    """
+    One virtual station and its running weather state
+
+    Args:
+        index: Station number from 0; the name is Station-<index + 1>
+        seed: Dataset seed
+    """
+
+    def __init__(self, index, seed):
+        self.rng = random.Random(f"{seed}:station:{index}")
+        rng = self.rng
+        self.name = f"Station-{index + 1}"
+        self.coast = rng.random()
+        self.lat, self.lon = coast_position(self.coast)
+        self.tide_amplitude = rng.uniform(0.4, 2.2)
+        self.mean_level = self.tide_amplitude * 1.3 + rng.uniform(0.2, 0.8)
+        self.m2_phase = rng.uniform(0, 2 * math.pi)
+        self.s2_phase = self.m2_phase + rng.uniform(-0.5, 0.5)
+        self.wind_mean = rng.uniform(4, 10)
+        self.breeze = rng.uniform(1, 3)
+        self.temp_mean = 29 - 0.25 * (self.lat - 8) + rng.uniform(-1, 1)
+        self.temp_daily = rng.uniform(1, 2.5)
+        self.wind = self.wind_mean
+        self.temp_anomaly = 0.0
+        self.last_alert = {}
+
+    def read(self, t, hours, season, storm_wind, surge):
+        """
+        Advance the station to epoch time t and return its reading
+
+        Args:
+            t: Epoch seconds
+            hours: Hours since the previous reading
+            season: Seasonal temperature offset shared by all stations
+            storm_wind: Extra wind from storms at this station
+            surge: Storm surge at this station, in metres
+        """
+        rng = self.rng
+        solar_hour = (t / 3600 + self.lon / 15) % 24
+        tide = self.tide_amplitude * (
+            math.cos(2 * math.pi * t / (M2_HOURS * 3600) + self.m2_phase)
+            + 0.46 * math.cos(2 * math.pi * t / (S2_HOURS * 3600) + self.s2_phase))
+        water = self.mean_level + tide / 1.46 + surge + rng.gauss(0, 0.03)
+
+        # Ornstein-Uhlenbeck towards the sea-breeze-adjusted mean
+        target = self.wind_mean + self.breeze * math.sin(2 * math.pi * (solar_hour - 9) / 24) + storm_wind
+        pull = min(0.3 * hours, 1)
+        self.wind += pull * (target - self.wind) + 1.5 * math.sqrt(hours) * rng.gauss(0, 1)
+        self.wind = max(self.wind, 0)
+
+        decay = math.exp(-hours / 6)
+        self.temp_anomaly = self.temp_anomaly * decay + 0.4 * math.sqrt(1 - decay * decay) * rng.gauss(0, 1)
+        temperature = (self.temp_mean + season + self.temp_daily * math.sin(2 * math.pi * (solar_hour - 9) / 24)
+                       + self.temp_anomaly - 0.1 * storm_wind)
+        return round(water, 3), round(self.wind, 2), round(temperature, 2)
+
+    def alerts(self, t, wind, surge):
+        """Alerts for thresholds crossed at time t, at most one per type per cooldown"""
+        found = []
+        severity = rated(wind, WIND_SEVERITY)
+        if severity:
+            found.append(("Storm", f"Wind speed {wind:.1f} m/s recorded at {self.name}", severity))
+        severity = rated(surge, SURGE_SEVERITY)
+        if severity:
+            found.append(("Tide", f"Storm surge {surge:.2f} m above predicted tide at {self.name}", severity))
+        issued = []
+        for kind, message, severity in found:
+            if t - self.last_alert.get(kind, -math.inf) >= ALERT_COOLDOWN_H * 3600:
+                self.last_alert[kind] = t
+                issued.append((kind, message, severity))
+        return issued
+
+
+class Storm:
+    """A weather system drifting along the coast, rising and fading over its life"""
+
+    def __init__(self, rng, start):
+        self.start = start
+        self.hours = rng.uniform(6, 36)
+        self.center = rng.random()
+        self.radius = rng.uniform(0.02, 0.08)
+        self.drift = rng.uniform(-0.004, 0.004)  # coast fraction per hour
+        self.wind = rng.uniform(12, 30)
+        self.surge = rng.uniform(0.3, 2.0)
+
+    def strength(self, t, coast):
+        """0-1 intensity felt at a coast position at time t"""
+        age = (t - self.start) / 3600
+        if not 0 <= age <= self.hours:
+            return 0
+        offset = (coast - self.center - self.drift * age) / self.radius
+        if abs(offset) > 3:
+            return 0
+        return math.sin(math.pi * age / self.hours) * math.exp(-offset * offset)
+
+
+class Dataset:
+    """
+    Deterministic generator of (collection, document) pairs in time order
+
+    Args:
+        seed: Any value; the same seed gives the same data
+        stations: Number of stations
+        readings: Total sensor readings to produce
+        interval: Seconds between a station's readings
+        end: Timestamp of the final round of readings
+        storms_per_day: Average new storms per day along the whole coast
+        reports_per_day: Average background hazard reports per day
+    """
+
+    def __init__(self, seed=42, stations=2000, readings=1_000_000, interval=300, end=DEFAULT_END,
+                 storms_per_day=1.0, reports_per_day=50):
+        self.seed = seed
+        self.stations = stations
+        self.readings = readings
+        self.interval = interval
+        self.end = parse_time(end)
+        self.storms_per_day = storms_per_day
+        self.reports_per_day = reports_per_day
+        self.ticks = math.ceil(readings / stations)
+        self.start = self.end.timestamp() - (self.ticks - 1) * interval
+
+    def describe(self):
+        return {
+            "seed": self.seed,
+            "stations": self.stations,
+            "readings": self.readings,
+            "interval_s": self.interval,
+            "start": iso(datetime.fromtimestamp(self.start, timezone.utc)),
+            "end": iso(self.end),
+            "storms_per_day": self.storms_per_day,
+            "reports_per_day": self.reports_per_day,
+        }
+
+    def __iter__(self):
+        stations = [Station(i, self.seed) for i in range(self.stations)]
+        storm_rng = random.Random(f"{self.seed}:storms")
+        report_rng = random.Random(f"{self.seed}:reports")
+        storms = []
+        hours = self.interval / 3600
+        remaining = self.readings
+        for tick in range(self.ticks):
+            t = self.start + tick * self.interval
+            moment = datetime.fromtimestamp(t, timezone.utc)
+            storms = [s for s in storms if (t - s.start) / 3600 <= s.hours]
+            for _ in range(poisson(storm_rng, self.storms_per_day * hours / 24)):
+                storms.append(Storm(storm_rng, t))
+            season = season_offset(moment)
+
+            alerts, reports = [], []
+            for station in stations[:remaining]:
+                storm_wind = surge = 0.0
+                for storm in storms:
+                    strength = storm.strength(t, station.coast)
+                    storm_wind += storm.wind * strength
+                    surge += storm.surge * strength
+                water, wind, temperature = station.read(t, hours, season, storm_wind, surge)
+                yield "sensors", {"location": station.name, "water_level": water, "wind_speed": wind,
+                                  "temperature": temperature, "timestamp": moment}
+                for kind, message, severity in station.alerts(t, wind, surge):
+                    alerts.append({"type": kind, "message": message, "severity": severity, "timestamp": moment})
+                    if report_rng.random() < 0.3:
+                        reports.append(self.storm_report(report_rng, station, t, kind, severity, wind, surge))
+            remaining -= min(remaining, len(stations))
+
+            for _ in range(poisson(report_rng, self.reports_per_day * hours / 24)):
+                reports.append(self.background_report(report_rng, report_rng.choice(stations), t))
+            yield from (("alerts", alert) for alert in alerts)
+            yield from (("reports", report) for report in sorted(reports, key=lambda r: r["timestamp"]))
+
+    def report(self, rng, station, t, kind, description, severity):
+        return {
+            "type": kind,
+            "description": description,
+            "location": station.name,
+            "position": [round(station.lat + rng.uniform(-0.05, 0.05), 4),
+                         round(station.lon + rng.uniform(-0.05, 0.05), 4)],
+            "severity": severity,
+            # People report a little after they notice, within the same round
+            "timestamp": datetime.fromtimestamp(t + rng.uniform(0, self.interval * 0.99), timezone.utc),
+        }
+
+    def storm_report(self, rng, station, t, alert_kind, severity, wind, surge):
+        kind, template = STORM_REPORTS[alert_kind]
+        description = template.format(station=station.name, waves=round(1 + wind / 8, 1))
+        return self.report(rng, station, t, kind, description, severity)
+
+    def background_report(self, rng, station, t):
+        kind, template, severities = rng.choice(BACKGROUND_REPORTS)
+        description = template.format(station=station.name, size=rng.randrange(50, 2000, 50),
+                                      km=rng.randint(1, 15))
+        return self.report(rng, station, t, kind, description, rng.choice(severities))
+
+
+class NdjsonSink:
+    """
+    Writes each collection to <directory>/<collection>.ndjson
+
+    A SHA-256 of every file is kept as it's written, so a manifest can
+    prove two runs produced the same bytes.
+    """
+
+    def __init__(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.files = {name: open(os.path.join(directory, f"{name}.ndjson"), "wb") for name in COLLECTIONS}
+        self.digests = {name: hashlib.sha256() for name in COLLECTIONS}
+
+    def write(self, collection, docs):
+        chunk = "".join(json.dumps(doc, separators=(",", ":"), default=iso) + "\n" for doc in docs).encode()
+        self.files[collection].write(chunk)
+        self.digests[collection].update(chunk)
+
+    def close(self, manifest):
+        for f in self.files.values():
+            f.close()
+        manifest["sha256"] = {name: digest.hexdigest() for name, digest in self.digests.items()}
+        with open(os.path.join(self.directory, "manifest.json"), "w") as f:
+            json.dump(manifest, f, indent=2)
+            f.write("\n")
+
+
+class MongoSink:
+    """
+    Inserts each collection into MongoDB with unordered bulk inserts
+
+    Documents get createdAt/updatedAt/__v like the Mongoose models'
+    timestamps, set to the reading's own time rather than now.
+
+    Args:
+        uri: MongoDB connection string; the database defaults to coastalwatch
+        drop: Empty the collections first
+    """
+
+    def __init__(self, uri, drop=False):
+        if pymongo is None:
+            raise RuntimeError("writing to MongoDB needs pymongo (pip install -r requirements.txt)")
+        self.client = pymongo.MongoClient(uri)
+        self.db = self.client.get_default_database(default="coastalwatch")
+        if drop:
+            for name in COLLECTIONS:
+                self.db[name].drop()
+
+    def write(self, collection, docs):
+        for doc in docs:
+            doc.update(createdAt=doc["timestamp"], updatedAt=doc["timestamp"], __v=0)
+        self.db[collection].insert_many(docs, ordered=False)
+
+    def close(self, manifest):
+        self.client.close()
+
+
+def generate(dataset, sink, batch_size=10000):
+    """
+    Stream a dataset into a sink in batches of up to batch_size per collection
+
+    Returns:
+        The number of documents written per collection
+    """
+    batches = {name: [] for name in COLLECTIONS}
+    counts = dict.fromkeys(COLLECTIONS, 0)
+    started = last_report = time.monotonic()
+    for collection, doc in dataset:
+        batch = batches[collection]
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            sink.write(collection, batch)
+            counts[collection] += len(batch)
+            batches[collection] = []
+            now = time.monotonic()
+            if collection == "sensors" and now - last_report >= PROGRESS_INTERVAL:
+                rate = counts["sensors"] / (now - started)
+                log(f"📈 {counts['sensors']:,}/{dataset.readings:,} readings, {rate:,.0f}/s")
+                last_report = now
+    for collection, batch in batches.items():
+        if batch:
+            sink.write(collection, batch)
+            counts[collection] += len(batch)
+    return counts
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a reproducible CoastalWatch dataset")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--out", help="Directory for sensors/alerts/reports.ndjson and manifest.json")
+    target.add_argument("--mongo", help="MongoDB URI to insert into instead")
+    parser.add_argument("--drop", action="store_true", help="With --mongo, empty the collections first")
+    parser.add_argument("--seed", default="42", help="Dataset seed (default 42)")
+    parser.add_argument("--stations", type=int, default=2000, help="Number of stations (default 2000)")
+    parser.add_argument("--readings", type=int, default=1_000_000, help="Total sensor readings (default 1000000)")
+    parser.add_argument("--interval", type=int, default=300, help="Seconds between a station's readings (default 300)")
+    parser.add_argument("--end", default=DEFAULT_END, help=f"Time of the last readings (default {DEFAULT_END})")
+    parser.add_argument("--storms-per-day", type=float, default=1.0, help="Average new storms per day (default 1)")
+    parser.add_argument("--reports-per-day", type=float, default=50,
+                        help="Average background hazard reports per day (default 50)")
+    parser.add_argument("--batch-size", type=int, default=10000, help="Documents per write (default 10000)")
+    args = parser.parse_args(argv)
+    if args.stations < 1 or args.readings < 1 or args.interval < 1 or args.batch_size < 1:
+        parser.error("--stations, --readings, --interval and --batch-size must be at least 1")
+    if args.drop and not args.mongo:
+        parser.error("--drop only applies to --mongo")
+    try:
+        parse_time(args.end)
+    except ValueError:
+        parser.error(f"--end is not an ISO 8601 time: {args.end}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    dataset = Dataset(args.seed, args.stations, args.readings, args.interval, args.end,
+                      args.storms_per_day, args.reports_per_day)
+    try:
+        sink = MongoSink(args.mongo, args.drop) if args.mongo else NdjsonSink(args.out)
+    except RuntimeError as e:
+        log(f"❌ {e}")
+        return 2
+    log(f"🌊 Generating {args.readings:,} readings from {args.stations:,} stations "
+        f"({dataset.describe()['start']} to {dataset.describe()['end']})")
+    started = time.monotonic()
+    counts = generate(dataset, sink, args.batch_size)
+    elapsed = time.monotonic() - started
+    manifest = dict(dataset.describe(), counts=counts)
+    sink.close(manifest)
+    log(f"✅ {counts['sensors']:,} readings, {counts['alerts']:,} alerts, {counts['reports']:,} reports "
+        f"in {elapsed:.1f}s")
+    if args.mongo:
+        log("ℹ️  Run `npm run rollups` in backend/ so the summary report includes the new readings")
+    print(json.dumps(dict(manifest, elapsed_s=round(elapsed, 3)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""
+CoastalWatch Sensor Loader
+Streams sensor readings from CSV or NDJSON files into POST /api/sensors/bulk
+
+The file is read in fixed-size batches, and at most --max-in-flight of them
+are outstanding at once, so memory stays flat however large the file is.
+After each acknowledged batch, the loader saves a checkpoint: the byte
+offset and line up to which every reading has been sent. --resume then
+carries on from there after a crash or a Ctrl+C. Rejected readings are
+listed by their line in the file.
+
+Every reading is sent with an _id derived from the file, its byte offset
+and the line itself, so a batch that is sent again (after a retry, or a
+crash before its checkpoint was saved) can't insert a reading twice: the
+backend counts the readings it already has as duplicates and skips
+them. A line that carries its own _id keeps it.
+
+CSV files need a header row naming the Sensor fields (location,
+water_level, wind_speed, temperature and optionally timestamp), one
+reading per line. NDJSON lines are sent as they are and validated by
+the backend.
+
+    python tools/ingest.py readings.ndjson --username research --password research123
+    python tools/ingest.py readings.csv --batch-size 5000 --max-in-flight 8 --resume
+"""
+
+import argparse
+import asyncio
+import csv
+import hashlib
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+import aiohttp
+
+BULK_PATH = "/api/sensors/bulk"
+NUMERIC_FIELDS = ("water_level", "wind_speed", "temperature")
+FORMATS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_LOGGED_REJECTS = 10
+
+
+def log(message):
+    print(message, file=sys.stderr, flush=True)
+
+
+class LoaderError(Exception):
+    """A batch the backend refused outright, or that kept failing after retries"""
+
+
+def detect_format(path):
+    """
+    Work out the input format from the file extension
+
+    Raises:
+        ValueError: If the extension isn't one of FORMATS
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"can't tell the format of {path}; pass --format csv or --format ndjson")
+    return FORMATS[extension]
+
+
+def csv_reading(header, row):
+    """Turn a CSV row into a reading; blanks are dropped, numbers cast where they parse"""
+    reading = {}
+    for name, value in zip(header, row):
+        value = value.strip()
+        if not value:
+            continue
+        if name in NUMERIC_FIELDS:
+            try:
+                value = float(value)
+            except ValueError:
+                pass  # sent as-is so the backend reports it against this line
+        reading[name] = value
+    return reading
+
+
+def reading_id(source, offset, text):
+    """
+    The _id a reading is sent with: 24 hex digits, like a MongoDB ObjectId
+
+    Args:
+        source: Absolute path of the input file
+        offset: Byte offset of the reading's line in the file
+        text: The line as read, so an edited file gets new ids
+    """
+    return hashlib.blake2b(f"{source}\0{offset}\0".encode() + text, digest_size=12).hexdigest()
+
+
+def with_id(text, _id):
+    """Add "_id" as the first key of a JSON object line; anything else goes as-is"""
+    stripped = text.strip()
+    if not stripped.startswith(b"{"):
+        return text  # not an object; the backend rejects it against this line
+    rest = stripped[1:].lstrip()
+    separator = b"" if rest.startswith(b"}") else b","
+    # JSON.parse keeps the last of repeated keys, so an _id already on the line wins
+    return b'{"_id":"' + _id.encode() + b'"' + separator + rest
+
+
+class Batch:
+    """
+    One request's worth of readings
+
+    Args:
+        number: Position of the batch in this run, from 0
+        body: The NDJSON request body
+        lines: The file line of each reading in the body, in order
+        end_offset: Byte offset just past the batch's last line
+    """
+
+    def __init__(self, number, body, lines, end_offset):
+        self.number = number
+        self.body = body
+        self.lines = lines
+        self.end_offset = end_offset
+
+    def __len__(self):
+        return len(self.lines)
+
+
+class Reader:
+    """
+    Reads a CSV or NDJSON file in batches, starting at a byte offset
+
+    Args:
+        path: File to read
+        fmt: "csv" or "ndjson"
+        offset: Byte offset to start at (0, or a checkpoint's offset)
+        line: Number of lines before offset
+    """
+
+    def __init__(self, path, fmt, offset=0, line=0):
+        self.path = path
+        self.format = fmt
+        self.offset = offset
+        self.line = line
+        self.header = None
+
+    def batches(self, size, limit=None):
+        """
+        Yield Batch objects of up to size readings
+
+        Args:
+            size: Readings per batch
+            limit: Stop after this many readings (None for the whole file)
+        """
+        with open(self.path, "rb") as f:
+            if self.format == "csv":
+                header = f.readline()
+                self.header = [h.strip() for h in next(csv.reader([header.decode("utf-8-sig")]))]
+                if self.offset == 0:
+                    self.offset, self.line = len(header), 1
+            f.seek(self.offset)
+            source = os.path.abspath(self.path)
+            number, sent = 0, 0
+            body, lines = [], []
+            for raw in f:
+                start = self.offset
+                self.offset += len(raw)
+                self.line += 1
+                text = raw.rstrip(b"\r\n")
+                if not text.strip():
+                    continue
+                if self.format == "csv":
+                    row = next(csv.reader([text.decode("utf-8")]))
+                    text = json.dumps(csv_reading(self.header, row), separators=(",", ":")).encode()
+                body.append(with_id(text, reading_id(source, start, raw)))
+                lines.append(self.line)
+                sent += 1
+                if len(lines) == size or sent == limit:
+                    yield Batch(number, b"\n".join(body) + b"\n", lines, self.offset)
+                    number += 1
+                    body, lines = [], []
+                    if sent == limit:
+                        return
+            if lines:
+                yield Batch(number, b"\n".join(body) + b"\n", lines, self.offset)
+
+
+class Checkpoint:
+    """
+    Where a load got to, saved next to the input as <file>.checkpoint
+
+    The offset only moves past a batch once it and every batch before it
+    have been acknowledged, so resuming never skips a reading.
+    """
+
+    def __init__(self, path, source):
+        self.path = path
+        self.source = os.path.abspath(source)
+        self.offset = 0
+        self.line = 0
+
+    def load(self):
+        """
+        Read a saved checkpoint, if there is one
+
+        Returns:
+            True if a checkpoint was loaded
+
+        Raises:
+            ValueError: If the checkpoint belongs to a different file
+        """
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path) as f:
+            saved = json.load(f)
+        if saved["source"] != self.source:
+            raise ValueError(f"{self.path} is a checkpoint for {saved['source']}, not {self.source}")
+        self.offset, self.line = saved["offset"], saved["line"]
+        return True
+
+    def save(self, offset, line):
+        self.offset, self.line = offset, line
+        state = {"source": self.source, "offset": offset, "line": line,
+                 "updated": datetime.now(timezone.utc).isoformat(timespec="seconds")}
+        temp = f"{self.path}.tmp"
+        with open(temp, "w") as f:
+            json.dump(state, f)
+        os.replace(temp, self.path)
+
+
+class Loader:
+    """
+    Sends batches with bounded concurrency and retries
+
+    Args:
+        url: Backend base URL
+        token: JWT for an Admin or Researcher
+        max_in_flight: Most batches outstanding at once
+        retries: Extra attempts for a batch after a 5xx or connection error
+        timeout: Seconds allowed per request
+        progress: Seconds between progress lines (0 for none)
+    """
+
+    def __init__(self, url, token, max_in_flight=4, retries=3, timeout=60, progress=5):
+        self.url = url.rstrip("/") + BULK_PATH
+        self.headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/x-ndjson"}
+        self.max_in_flight = max_in_flight
+        self.retries = retries
+        self.timeout = timeout
+        self.progress = progress
+        self.received = 0
+        self.inserted = 0
+        self.duplicates = 0
+        self.rejected = 0
+        self.batches = 0
+        self.retried = 0
+        self.elapsed = 0
+        self.logged_rejects = 0
+
+    async def send(self, session, batch):
+        """
+        POST one batch, retrying transient failures with backoff
+
+        Readings carry deterministic ids, so resending a batch that was
+        partly inserted before a 5xx only inserts the rest.
+
+        Returns:
+            The backend's {received, inserted, duplicates, rejected, errors}
+            result
+
+        Raises:
+            LoaderError: On a 4xx, or once the retries are used up
+        """
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self.retried += 1
+                await asyncio.sleep(min(0.5 * 2 ** (attempt - 1), 10))
+            try:
+                async with session.post(self.url, data=batch.body, headers=self.headers) as response:
+                    if response.status == 200:
+                        return await response.json()
+                    text = await response.text()
+                    if response.status not in RETRY_STATUSES:
+                        raise LoaderError(f"batch at line {batch.lines[0]}: HTTP {response.status} {text[:200]}")
+                    try:
+                        # Stored before the failure; the retry reports them as duplicates
+                        self.inserted += json.loads(text).get("inserted", 0)
+                    except (ValueError, AttributeError):
+                        pass  # not the backend's own error body, e.g. a proxy's 502
+                    error = f"HTTP {response.status} {text[:200]}"
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = f"{type(e).__name__}: {e}"
+        raise LoaderError(f"batch at line {batch.lines[0]} failed after {self.retries + 1} attempts: {error}")
+
+    def record(self, batch, result):
+        self.batches += 1
+        self.received += result["received"]
+        self.inserted += result["inserted"]
+        self.duplicates += result.get("duplicates", 0)
+        self.rejected += result["rejected"]
+        for error in result["errors"]:
+            if self.logged_rejects < MAX_LOGGED_REJECTS:
+                # The backend numbers lines within the request body
+                log(f"⚠️  line {batch.lines[error['line'] - 1]}: {error['message']}")
+                self.logged_rejects += 1
+
+    async def run(self, reader, checkpoint=None, batch_size=1000, limit=None):
+        """
+        Load the reader's batches, advancing the checkpoint as they land
+
+        Raises:
+            LoaderError: If a batch fails; batches already in flight are
+                allowed to finish and the checkpoint reflects them
+        """
+        started = time.monotonic()
+        last_report, last_inserted = started, 0
+        done, next_commit = {}, 0
+        pending, failure = set(), None
+
+        def collect(finished):
+            nonlocal next_commit, failure
+            for task in finished:
+                batch = task.batch
+                if task.exception() is not None:
+                    failure = failure or task.exception()
+                    continue
+                self.record(batch, task.result())
+                done[batch.number] = batch
+            while next_commit in done:
+                batch = done.pop(next_commit)
+                if checkpoint is not None:
+                    checkpoint.save(batch.end_offset, batch.lines[-1])
+                next_commit += 1
+
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            for batch in reader.batches(batch_size, limit):
+                while len(pending) >= self.max_in_flight and failure is None:
+                    finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    collect(finished)
+                if failure is not None:
+                    break
+                task = asyncio.create_task(self.send(session, batch))
+                task.batch = batch
+                pending.add(task)
+
+                now = time.monotonic()
+                if self.progress and now - last_report >= self.progress:
+                    rate = (self.inserted - last_inserted) / (now - last_report)
+                    log(f"📈 {self.inserted:,} inserted, {rate:,.0f} readings/s, line {reader.line:,}")
+                    last_report, last_inserted = now, self.inserted
+            if pending:
+                finished, _ = await asyncio.wait(pending)
+                collect(finished)
+        self.elapsed = time.monotonic() - started
+        if failure is not None:
+            raise failure
+
+    def summary(self):
+        elapsed = self.elapsed
+        return {
+            "batches": self.batches,
+            "received": self.received,
+            "inserted": self.inserted,
+            "duplicates": self.duplicates,
+            "rejected": self.rejected,
+            "retries": self.retried,
+            "elapsed_s": round(elapsed, 3),
+            "readings_per_second": round(self.inserted / elapsed, 1) if elapsed else None,
+        }
+
+
+async def login(url, username, password):
+    """
+    Get a JWT from /api/auth/login
+
+    Raises:
+        LoaderError: If the credentials are refused
+    """
+    async with aiohttp.ClientSession() as session:
+        async with session.post(f"{url.rstrip('/')}/api/auth/login",
+                                json={"username": username, "password": password}) as response:
+            if response.status != 200:
+                raise LoaderError(f"login failed: HTTP {response.status} {(await response.text())[:200]}")
+            return (await response.json())["token"]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Stream CSV/NDJSON sensor readings into the backend")
+    parser.add_argument("path", help="CSV or NDJSON file of readings")
+    parser.add_argument("--url", default="http://127.0.0.1:4000", help="Backend base URL")
+    parser.add_argument("--format", choices=("csv", "ndjson"), help="Input format (default: from the extension)")
+    parser.add_argument("--token", default=os.environ.get("COASTALWATCH_TOKEN"),
+                        help="JWT for an Admin or Researcher (default $COASTALWATCH_TOKEN)")
+    parser.add_argument("--username", default="research", help="Login used when no token is given")
+    parser.add_argument("--password", default="research123", help="Password for --username")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Readings per request (default 1000)")
+    parser.add_argument("--max-in-flight", type=int, default=4, help="Requests outstanding at once (default 4)")
+    parser.add_argument("--retries", type=int, default=3, help="Retries per batch on 5xx/connection errors")
+    parser.add_argument("--timeout", type=float, default=60, help="Seconds allowed per request (default 60)")
+    parser.add_argument("--limit", type=int, help="Stop after this many readings")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default <path>.checkpoint)")
+    parser.add_argument("--resume", action="store_true", help="Continue from the checkpoint")
+    parser.add_argument("--offset", type=int, help="Start at this byte offset instead (must be a line start)")
+    parser.add_argument("--progress", type=float, default=5, help="Seconds between progress lines (0 for none)")
+    args = parser.parse_args(argv)
+    if args.batch_size < 1 or args.max_in_flight < 1:
+        parser.error("--batch-size and --max-in-flight must be at least 1")
+    if args.resume and args.offset is not None:
+        parser.error("--resume and --offset are mutually exclusive")
+    try:
+        args.format = args.format or detect_format(args.path)
+    except ValueError as e:
+        parser.error(str(e))
+    args.checkpoint = args.checkpoint or f"{args.path}.checkpoint"
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    checkpoint = Checkpoint(args.checkpoint, args.path)
+    try:
+        if args.resume and not checkpoint.load():
+            log(f"ℹ️  No checkpoint at {args.checkpoint}, starting from the beginning")
+    except ValueError as e:
+        log(f"❌ {e}")
+        return 2
+    offset, line = checkpoint.offset, checkpoint.line
+    if args.offset is not None:
+        # Line numbers are only known relative to where we started
+        offset, line = args.offset, 0
+    reader = Reader(args.path, args.format, offset, line)
+    if offset:
+        log(f"⏩ Resuming {args.path} at byte {offset:,} (line {line:,})")
+
+    async def load():
+        token = args.token or await login(args.url, args.username, args.password)
+        loader = Loader(args.url, token, args.max_in_flight, args.retries, args.timeout, args.progress)
+        await loader.run(reader, checkpoint, args.batch_size, args.limit)
+        return loader.summary()
+
+    started_line = line
+    try:
+        summary = asyncio.run(load())
+    except (LoaderError, aiohttp.ClientError) as e:
+        log(f"❌ {e}")
+        log(f"   Checkpoint at line {checkpoint.line:,}; rerun with --resume to continue")
+        return 1
+    except KeyboardInterrupt:
+        log(f"🛑 Interrupted; checkpoint at line {checkpoint.line:,}, rerun with --resume to continue")
+        return 130
+    summary.update(file=args.path, format=args.format, start_line=started_line, end_line=checkpoint.line,
+                   checkpoint=args.checkpoint)
+    log(f"✅ {summary['inserted']:,} readings inserted, {summary['rejected']:,} rejected, "
+        f"{summary['readings_per_second'] or 0:,.0f} readings/s sustained")
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())